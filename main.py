@@ -49,10 +49,8 @@ from src.audio.advanced_punctuation import AdvancedPunctuationRestorer
 from src.text.utils import Annotator
 from src.text.llm import LLMOrchestrator, LLMResultHandler
 from src.text.advanced_analysis import AdvancedAnalysisManager
-from src.utils.utils import Cleaner, Watcher
+from src.utils.utils import Cleaner
 from src.db.multi_database_manager import MultiDatabaseManager
-from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
 from src.text.korean_models import KoreanModels
 
 from src.text.integrated_analyzer import IntegratedAnalyzer as AdvancedIntegratedAnalyzer
@@ -812,11 +810,11 @@ async def process(path: str):
         # 성공한 경우에만 파일 삭제
         if success:
             try:
-                if os.path.exists(path):
-                    os.remove(path)
-                    print(f"🗑️ 처리 완료된 오디오 파일 삭제: {path}")
-                else:
-                    print(f"⚠️ 삭제할 파일이 없습니다: {path}")
+                # 존재 확인 후 삭제 사이의 경쟁을 피하기 위해 바로 삭제 시도
+                os.remove(path)
+                print(f"🗑️ 처리 완료된 오디오 파일 삭제: {path}")
+            except FileNotFoundError:
+                print(f"⚠️ 삭제할 파일이 없습니다: {path}")
             except Exception as e:
                 print(f"❌ 파일 삭제 실패: {path} - {e}")
         
@@ -836,6 +834,21 @@ def watch_and_process():
         "/app/.temp"
     ]
     
+    existing_directories = []
+    for directory in watch_directories:
+        if os.path.exists(directory):
+            existing_directories.append(directory)
+        else:
+            print(f"⚠️ 디렉토리가 존재하지 않습니다: {directory}")
+    
+    if not existing_directories:
+        print("⚠️ 감시할 디렉토리가 없어 파일 감시를 시작하지 않습니다")
+        return
+    
+    # watchdog은 실제로 감시할 때만 로드
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    
     # 파일 핸들러 클래스 정의
     class FileHandler(FileSystemEventHandler):
         def __init__(self, callback):
@@ -880,12 +893,9 @@ def watch_and_process():
     
     # Observer 설정 및 시작
     observer = Observer()
-    for directory in watch_directories:
-        if os.path.exists(directory):
-            observer.schedule(handler, directory, recursive=False)
-            print(f"📁 디렉토리 감시 시작: {directory}")
-        else:
-            print(f"⚠️ 디렉토리가 존재하지 않습니다: {directory}")
+    for directory in existing_directories:
+        observer.schedule(handler, directory, recursive=False)
+        print(f"📁 디렉토리 감시 시작: {directory}")
     
     observer.start()
     
@@ -14,6 +14,23 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+class PhaseLog:
+    """단계별 로그 메시지를 모아 단계 경계에서 한 번에 출력"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.lines = []
+        self.enabled = logger.isEnabledFor(logging.INFO)
+    
+    def add(self, message: str):
+        if self.enabled:
+            self.lines.append(message)
+    
+    def flush(self):
+        if self.lines:
+            logger.info("[%s]\n%s", self.name, "\n".join(self.lines))
+            self.lines = []
+
 def test_pipeline_components():
     """파이프라인 구성 요소들을 개별적으로 테스트"""
     
@@ -99,6 +116,7 @@ def test_full_pipeline():
     
     logger.info("🚀 전체 파이프라인 플로우 테스트 시작")
     
+    phase = None
     try:
         # 1. 인증 시스템 초기화
         from src.auth.agent_auth import AgentAuthManager
@@ -155,8 +173,9 @@ def test_full_pipeline():
         logger.info(f"✅ 오디오 업로드 성공: {upload_info.file_path}")
         
         # 5. 분석 파이프라인 실행
-        logger.info("🔍 4단계: 분석 파이프라인 실행")
-        logger.info("⚠️ 실제 분석은 시간이 오래 걸리므로 시뮬레이션합니다...")
+        phase = PhaseLog("4단계")
+        phase.add("🔍 4단계: 분석 파이프라인 실행")
+        phase.add("⚠️ 실제 분석은 시간이 오래 걸리므로 시뮬레이션합니다...")
         
         # 분석 시뮬레이션 (실제로는 analyzer.analyze_consultation() 호출)
         analysis_result = {
@@ -215,10 +234,12 @@ def test_full_pipeline():
             'timestamp': time.time()
         }
         
-        logger.info("✅ 분석 결과 생성 완료")
+        phase.add("✅ 분석 결과 생성 완료")
+        phase.flush()
         
         # 6. 데이터베이스 저장
-        logger.info("💾 5단계: 데이터베이스 저장")
+        phase = PhaseLog("5단계")
+        phase.add("💾 5단계: 데이터베이스 저장")
         
         # 상담 분석 결과 저장
         consultation_data = {
@@ -237,7 +258,7 @@ def test_full_pipeline():
         }
         
         db_manager.insert_consultation_analysis(consultation_data)
-        logger.info("✅ 상담 분석 결과 저장 완료")
+        phase.add("✅ 상담 분석 결과 저장 완료")
         
         # 커뮤니케이션 품질 결과 저장
         quality_data = {
@@ -261,7 +282,7 @@ def test_full_pipeline():
         }
         
         db_manager.insert_communication_quality(quality_data)
-        logger.info("✅ 커뮤니케이션 품질 결과 저장 완료")
+        phase.add("✅ 커뮤니케이션 품질 결과 저장 완료")
         
         # 발화 내용 저장
         for i, utterance in enumerate(analysis_result['utterances']):
@@ -278,10 +299,12 @@ def test_full_pipeline():
             }
             db_manager.insert_utterance(utterance_data)
         
-        logger.info("✅ 발화 내용 저장 완료")
+        phase.add("✅ 발화 내용 저장 완료")
+        phase.flush()
         
         # 7. 결과 검증
-        logger.info("🔍 6단계: 결과 검증")
+        phase = PhaseLog("6단계")
+        phase.add("🔍 6단계: 결과 검증")
         
         # 저장된 데이터 조회
         consultation_result = db_manager.fetch_consultation_analysis(analysis_result['consultation_id'])
@@ -289,11 +312,13 @@ def test_full_pipeline():
         utterances_result = db_manager.fetch_utterances(analysis_result['audio_path'])
         
         if consultation_result and quality_result and utterances_result:
-            logger.info("✅ 모든 데이터가 성공적으로 저장되고 조회됨")
-            logger.info(f"📊 상담 분석 결과: {len(consultation_result)}개")
-            logger.info(f"📊 품질 분석 결과: {len(quality_result)}개")
-            logger.info(f"📊 발화 내용: {len(utterances_result)}개")
+            phase.add("✅ 모든 데이터가 성공적으로 저장되고 조회됨")
+            phase.add(f"📊 상담 분석 결과: {len(consultation_result)}개")
+            phase.add(f"📊 품질 분석 결과: {len(quality_result)}개")
+            phase.add(f"📊 발화 내용: {len(utterances_result)}개")
+            phase.flush()
         else:
+            phase.flush()
             logger.error("❌ 데이터 저장 또는 조회 실패")
             return False
         
@@ -301,9 +326,10 @@ def test_full_pipeline():
         return True
         
     except Exception as e:
-        logger.error(f"❌ 전체 파이프라인 테스트 실패: {e}")
-        import traceback
-        traceback.print_exc()
+        if phase is not None:
+            # 실패한 단계에서 모아 둔 진행 로그를 traceback보다 먼저 출력
+            phase.flush()
+        logger.exception(f"❌ 전체 파이프라인 테스트 실패: {e}")
         return False
 
 def test_advanced_analyzer():
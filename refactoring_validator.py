@@ -4,8 +4,42 @@
 """
 
 import os
+import re
 import sys
 from pathlib import Path
+from typing import Iterator, List, Sequence, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# 중복 함수 패턴 (파일당 한 번의 스캔으로 모두 검색)
+DUPLICATE_FUNCTION_PATTERNS = {
+    "def __init__": "init",
+    "def main": "main"
+}
+DUPLICATE_FUNCTION_RE = re.compile(r'def (__init__|main)')
+
+if AHOCORASICK_AVAILABLE:
+    DUPLICATE_FUNCTION_AUTOMATON = ahocorasick.Automaton()
+    for _pattern, _kind in DUPLICATE_FUNCTION_PATTERNS.items():
+        DUPLICATE_FUNCTION_AUTOMATON.add_word(_pattern, _kind)
+    DUPLICATE_FUNCTION_AUTOMATON.make_automaton()
+
+# 사용되지 않는 함수 패턴 (단일 정규식으로 한 번에 검색)
+DEAD_CODE_PATTERNS = (
+    "def _unused_",
+    "def test_",  # 테스트 함수는 제외
+    "def debug_",
+    "def temp_"
+)
+DEAD_CODE_RE = re.compile("|".join(re.escape(p) for p in DEAD_CODE_PATTERNS))
+
+# 함수 정의 패턴 및 네임스페이스 검사 제외 대상
+FUNCTION_DEF_RE = re.compile(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+NAMESPACE_EXEMPT_FUNCTIONS = frozenset({"__init__", "main", "health_check", "get_metrics"})
 
 def check_backup_cleanup():
     """백업 폴더 정리 확인"""
@@ -20,7 +54,32 @@ def check_backup_cleanup():
         print(f"❌ 백업 폴더 존재: {backup_dirs}")
         return False
 
-def check_duplicate_reduction():
+def _iter_sources(files: Sequence[Path], errors: List[Tuple[Path, Exception]]) -> Iterator[Tuple[Path, str]]:
+    """일반 파일만 읽어 (경로, 내용)을 반환하고 읽기 실패는 errors에 모음"""
+    for py_file in files:
+        if not py_file.is_file():
+            continue
+        try:
+            content = py_file.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            errors.append((py_file, e))
+            continue
+        yield py_file, content
+
+def _report_unreadable(errors: List[Tuple[Path, Exception]]):
+    """읽지 못한 파일 요약 출력"""
+    if errors:
+        print(f"⚠️ 읽을 수 없는 파일: {len(errors)}개")
+        for py_file, e in errors[:5]:  # 상위 5개만 표시
+            print(f"   - {py_file}: {e}")
+
+def _find_duplicate_function_kinds(content: str) -> set:
+    """파일 내용에 등장하는 중복 함수 종류('init', 'main')를 한 번의 스캔으로 반환"""
+    if AHOCORASICK_AVAILABLE:
+        return {kind for _, kind in DUPLICATE_FUNCTION_AUTOMATON.iter(content)}
+    return {"init" if name == "__init__" else "main" for name in DUPLICATE_FUNCTION_RE.findall(content)}
+
+def check_duplicate_reduction(files: Sequence[Path]):
     """중복 함수 감소 확인"""
     print("🔍 중복 함수 감소 확인...")
     
@@ -28,16 +87,12 @@ def check_duplicate_reduction():
     init_count = 0
     main_count = 0
     
-    for py_file in Path("src").rglob("*.py"):
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if "def __init__" in content:
-                    init_count += 1
-                if "def main" in content:
-                    main_count += 1
-        except:
-            continue
+    errors = []
+    for _, content in _iter_sources(files, errors):
+        kinds = _find_duplicate_function_kinds(content)
+        init_count += "init" in kinds
+        main_count += "main" in kinds
+    _report_unreadable(errors)
     
     print(f"📊 __init__ 함수: {init_count}개")
     print(f"📊 main 함수: {main_count}개")
@@ -50,28 +105,15 @@ def check_duplicate_reduction():
         print("⚠️ 중복 함수가 여전히 많음")
         return False
 
-def check_dead_code_removal():
+def check_dead_code_removal(files: Sequence[Path]):
     """죽은 코드 제거 확인"""
     print("🔍 죽은 코드 제거 확인...")
     
-    # 사용되지 않는 함수 패턴 검색
-    dead_code_patterns = [
-        "def _unused_",
-        "def test_",  # 테스트 함수는 제외
-        "def debug_",
-        "def temp_"
-    ]
-    
     dead_code_count = 0
-    for py_file in Path("src").rglob("*.py"):
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                for pattern in dead_code_patterns:
-                    if pattern in content:
-                        dead_code_count += 1
-        except:
-            continue
+    errors = []
+    for _, content in _iter_sources(files, errors):
+        dead_code_count += len(set(DEAD_CODE_RE.findall(content)))
+    _report_unreadable(errors)
     
     print(f"📊 의심스러운 죽은 코드: {dead_code_count}개")
     
@@ -82,33 +124,29 @@ def check_dead_code_removal():
         print("⚠️ 죽은 코드가 여전히 많음")
         return False
 
-def check_namespace_consistency():
+def check_namespace_consistency(files: Sequence[Path]):
     """네임스페이스 일관성 확인"""
     print("🔍 네임스페이스 일관성 확인...")
     
     # 모듈별 함수명 패턴 확인
     namespace_issues = 0
+    errors = []
     
-    for py_file in Path("src").rglob("*.py"):
+    for py_file, content in _iter_sources(files, errors):
         module_name = py_file.stem
-        try:
-            with open(py_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-                # 함수 정의 찾기
-                import re
-                function_matches = re.findall(r'def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                
-                for func_name in function_matches:
-                    # 공통 함수들은 제외
-                    if func_name in ["__init__", "main", "health_check", "get_metrics"]:
-                        continue
-                    
-                    # 모듈명과 일치하지 않는 함수 찾기
-                    if not func_name.startswith(module_name.lower()) and not func_name.startswith('_'):
-                        namespace_issues += 1
-        except:
-            continue
+        
+        # 함수 정의 찾기
+        function_matches = FUNCTION_DEF_RE.findall(content)
+        
+        for func_name in function_matches:
+            # 공통 함수들은 제외
+            if func_name in NAMESPACE_EXEMPT_FUNCTIONS:
+                continue
+            
+            # 모듈명과 일치하지 않는 함수 찾기
+            if not func_name.startswith(module_name.lower()) and not func_name.startswith('_'):
+                namespace_issues += 1
+    _report_unreadable(errors)
     
     print(f"📊 네임스페이스 불일치: {namespace_issues}개")
     
@@ -147,17 +185,20 @@ def main():
     
     results = []
     
+    # 검사 대상 파일 목록은 한 번만 수집
+    files = list(Path("src").rglob("*.py"))
+    
     # 1. 백업 폴더 정리 확인
     results.append(check_backup_cleanup())
     
     # 2. 중복 함수 감소 확인
-    results.append(check_duplicate_reduction())
+    results.append(check_duplicate_reduction(files))
     
     # 3. 죽은 코드 제거 확인
-    results.append(check_dead_code_removal())
+    results.append(check_dead_code_removal(files))
     
     # 4. 네임스페이스 일관성 확인
-    results.append(check_namespace_consistency())
+    results.append(check_namespace_consistency(files))
     
     # 5. 공통 모듈 확인
     results.append(check_common_modules())
@@ -4,6 +4,7 @@ import json
 import threading
 import hashlib
 import time
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Tuple, List, Dict, Any
 from pathlib import Path
@@ -129,8 +130,12 @@ class AdvancedTranscriber:
                 cache_info = self.cache_metadata[cache_key]
                 cache_path = self.cache_dir / cache_info["filename"]
 
-                if cache_path.exists() and os.path.getsize(cache_path) > 0:
-                    return cache_info
+                # 존재 여부와 크기를 stat 한 번으로 확인
+                try:
+                    if cache_path.stat().st_size > 0:
+                        return cache_info
+                except OSError:
+                    pass
 
         return None
 
@@ -379,9 +384,14 @@ class AdvancedTranscriber:
                     except Exception as e:
                         print(f"❌ Chunk 결과 수집 실패: {e}")
 
+                # chunk 결과는 대부분 이미 시간순이므로 정렬이 필요한 경우에만 정렬
+                starts = [segment["start"] for segment in all_segments]
+                if any(a > b for a, b in zip(starts, starts[1:])):
+                    all_segments.sort(key=itemgetter("start"))
+
                 # 결과 정리
                 result = {
-                    "segments": sorted(all_segments, key=lambda x: x["start"]),
+                    "segments": all_segments,
                     "language": max(language_info, key=language_info.get),
                     "language_probability": language_info.get("ko", 0) / len(chunks),
                     "start_time": 0,
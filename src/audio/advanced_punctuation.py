@@ -123,8 +123,12 @@ class AdvancedPunctuationRestorer:
                 cache_info = self.cache_metadata[cache_key]
                 cache_path = self.cache_dir / cache_info["filename"]
                 
-                if cache_path.exists() and os.path.getsize(cache_path) > 0:
-                    return str(cache_path)
+                # 존재 여부와 크기를 stat 한 번으로 확인
+                try:
+                    if cache_path.stat().st_size > 0:
+                        return str(cache_path)
+                except OSError:
+                    pass
         
         return None
     
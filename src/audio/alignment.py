@@ -1,13 +1,19 @@
 # Standard library imports
 import os
-from typing import Annotated, List, Dict
+import importlib.util
+import logging
+import threading
+from functools import lru_cache
+from typing import Annotated, Any, Iterator, List, Dict, NamedTuple, Optional, Tuple
 
 # Related third-party imports
+import numpy as np
 import torch
 from faster_whisper import decode_audio
 
-# ctc-forced-aligner 안전 import
-load_audio = None
+logger = logging.getLogger(__name__)
+
+# ctc-forced-aligner API (처음 정렬할 때 _init_ctc_forced_aligner()가 채움)
 load_alignment_model = None
 generate_emissions = None
 preprocess_text = None
@@ -15,31 +21,187 @@ get_alignments = None
 get_spans = None
 postprocess_results = None
 
-try:
-    import ctc_forced_aligner
-    # 사용 가능한 함수들 확인
-    if hasattr(ctc_forced_aligner, 'load_alignment_model'):
-        load_alignment_model = ctc_forced_aligner.load_alignment_model
-    if hasattr(ctc_forced_aligner, 'generate_emissions'):
-        generate_emissions = ctc_forced_aligner.generate_emissions
-    if hasattr(ctc_forced_aligner, 'preprocess_text'):
-        preprocess_text = ctc_forced_aligner.preprocess_text
-    if hasattr(ctc_forced_aligner, 'get_alignments'):
-        get_alignments = ctc_forced_aligner.get_alignments
-    if hasattr(ctc_forced_aligner, 'get_spans'):
-        get_spans = ctc_forced_aligner.get_spans
-    if hasattr(ctc_forced_aligner, 'postprocess_results'):
-        postprocess_results = ctc_forced_aligner.postprocess_results
-    if hasattr(ctc_forced_aligner, 'load_audio'):
-        load_audio = ctc_forced_aligner.load_audio
-    
-    print("✅ ctc-forced-aligner imported successfully")
-except ImportError as e:
-    print(f"⚠️ ctc-forced-aligner import failed: {e}")
-    print("🔄 ForcedAligner will run in fallback mode")
-except Exception as e:
-    print(f"⚠️ ctc-forced-aligner error: {e}")
-    print("🔄 ForcedAligner will run in fallback mode")
+CTC_FORCED_ALIGNER_NAMES = ('load_alignment_model', 'generate_emissions', 'preprocess_text',
+                            'get_alignments', 'get_spans', 'postprocess_results')
+_CTC_INIT_LOCK = threading.Lock()
+_ctc_initialized = False
+
+
+def _init_ctc_forced_aligner() -> None:
+    """ctc-forced-aligner를 한 번만 import해 전역 API를 연결 (없으면 torchaudio fallback 연결)
+
+    모듈 import 시점이 아니라 첫 정렬 시점에 호출되어, 정렬을 쓰지 않는 프로세스/워커의 시작 비용을 줄입니다.
+    """
+    global _ctc_initialized
+    with _CTC_INIT_LOCK:
+        if _ctc_initialized:
+            return
+        _ctc_initialized = True
+
+        module_globals = globals()
+        try:
+            import ctc_forced_aligner
+            # 사용 가능한 함수들 확인 (없는 함수는 None 유지)
+            for name in CTC_FORCED_ALIGNER_NAMES:
+                module_globals[name] = getattr(ctc_forced_aligner, name, None)
+            logger.info("ctc-forced-aligner imported successfully")
+        except ImportError as e:
+            logger.warning("ctc-forced-aligner import failed: %s; ForcedAligner will run in fallback mode", e)
+        except Exception as e:
+            logger.warning("ctc-forced-aligner error: %s; ForcedAligner will run in fallback mode", e)
+
+        # fallback 전역 함수 alias 연결 (torchaudio는 실제로 fallback을 쓸 때까지 import하지 않음)
+        if module_globals['load_alignment_model'] is None:
+            if importlib.util.find_spec("torchaudio") is not None:
+                module_globals.update(
+                    load_alignment_model=_load_alignment_model_ta,
+                    generate_emissions=_generate_emissions_ta,
+                    preprocess_text=_preprocess_text_ta,
+                    get_alignments=_get_alignments_ta,
+                    get_spans=_get_spans_ta,
+                    postprocess_results=_postprocess_results_ta,
+                )
+                logger.info("torchaudio fallback alignment enabled (Python 3.8 compatible)")
+            else:
+                logger.warning("torchaudio fallback initialisation failed: torchaudio is not installed")
+
+
+# 로드된 정렬 모델 캐시 ((device, dtype) -> (model, tokenizer)), ForcedAligner 인스턴스 간 공유
+_ALIGNMENT_MODEL_CACHE: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+_ALIGNMENT_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _dummy_alignments(transcript: str, duration_per_word: float = 1.0) -> List[Dict[str, float]]:
+    """단어당 고정 길이(기본 1초)를 가정한 더미 정렬 결과 생성"""
+    words = transcript.split()
+    bounds = (np.arange(len(words) + 1, dtype=np.float64) * duration_per_word).tolist()
+    return [
+        {'word': word, 'start': start, 'end': end}
+        for word, start, end in zip(words, bounds, bounds[1:])
+    ]
+
+# 정렬 후 CUDA 캐시 비우기 기본값 (empty_cache는 디바이스 동기화를 유발하므로 기본 비활성)
+ALIGNMENT_RELEASE_CUDA_CACHE = os.getenv("ALIGN_FREE_CACHE", "false").lower() == "true"
+
+# emission 계산 시 한 번에 모델에 넣는 오디오 길이 (긴 통화에서 GPU 최대 메모리 제한)
+ALIGNMENT_TILE_SECONDS = 60
+ALIGNMENT_SAMPLE_RATE = 16000
+# 구간 경계의 emission이 한쪽 문맥만 보지 않도록 앞뒤로 덧붙이는 오디오 길이
+ALIGNMENT_TILE_OVERLAP_SECONDS = 1
+
+# CUDA에서 모델 forward를 torch.compile(reduce-overhead, CUDA graph)로 감쌀지 여부 (첫 호출 컴파일 비용이 있어 기본 비활성화)
+ALIGNMENT_TORCH_COMPILE = os.getenv("ALIGN_TORCH_COMPILE", "false").lower() == "true"
+# CPU에서 Linear 레이어를 INT8 동적 양자화할지 여부 (가중치 메모리 1/4, CPU 추론 가속)
+# 단어 타임스탬프 값이 달라질 수 있으므로 정확도를 확인한 배포에서만 켜도록 기본 비활성화
+ALIGNMENT_CPU_INT8 = os.getenv("ALIGN_CPU_INT8", "false").lower() == "true"
+# 컴파일된 그래프 재사용을 위해 입력 길이를 올림할 구간(초), 마지막 구간보다 길면 그 배수로 올림
+_BUCKET_SET = (5, 10, 20, 30)
+
+
+def _bucket_num_samples(num_samples: int, sample_rate: int = ALIGNMENT_SAMPLE_RATE) -> int:
+    """입력 샘플 수를 _BUCKET_SET 구간 길이로 올림"""
+    for seconds in _BUCKET_SET:
+        if num_samples <= seconds * sample_rate:
+            return seconds * sample_rate
+    step = _BUCKET_SET[-1] * sample_rate
+    return -(-num_samples // step) * step
+
+
+def _maybe_quantize_model(model, device: str):
+    """CPU에서 설정된 경우 Linear 레이어를 INT8 동적 양자화하고, 실패하면 원본 모델 반환"""
+    if not (ALIGNMENT_CPU_INT8 and device == "cpu"):
+        return model
+    try:
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except Exception as e:
+        logger.warning("INT8 quantization failed, using float alignment model: %s", e)
+        return model
+
+
+def _maybe_compile_model(model, device: str):
+    """CUDA에서 설정된 경우 모델을 torch.compile로 감싸고, 실패하면 원본 모델 반환"""
+    if not (ALIGNMENT_TORCH_COMPILE and device == "cuda" and hasattr(torch, "compile")):
+        return model
+    try:
+        if hasattr(model, "normalize_waveform"):
+            # torchaudio MMS_FA wrapper: 정규화를 직접 수행하므로 내부 wav2vec2 모델만 컴파일
+            model.model = torch.compile(model.model, mode="reduce-overhead", fullgraph=False)
+            return model
+        return torch.compile(model, mode="reduce-overhead", fullgraph=False)
+    except Exception as e:
+        logger.warning("torch.compile failed, using eager alignment model: %s", e)
+        return model
+
+
+def _generate_emissions_tiled(model, waveform: torch.Tensor, batch_size: int):
+    """긴 오디오를 구간별로 나눠 emission을 계산하고 시간 축으로 이어 붙임
+
+    각 구간은 앞뒤로 ALIGNMENT_TILE_OVERLAP_SECONDS 만큼의 문맥을 붙여 forward한 뒤
+    문맥에 해당하는 프레임을 잘라내므로 구간 경계에서도 양쪽 문맥을 보고 emission을 계산합니다.
+    stride(프레임당 시간)는 구간별 프레임 수로 가중 평균합니다.
+    """
+    tile = ALIGNMENT_TILE_SECONDS * ALIGNMENT_SAMPLE_RATE
+    total = waveform.shape[-1]
+    if total <= tile:
+        return generate_emissions(model, waveform, batch_size=batch_size)
+
+    # 마지막 구간이 지나치게 짧아지지 않도록 균등 분할
+    n_tiles = -(-total // tile)
+    tile = -(-total // n_tiles)
+    context = ALIGNMENT_TILE_OVERLAP_SECONDS * ALIGNMENT_SAMPLE_RATE
+
+    parts = []
+    weighted_stride = 0.0
+    frames = 0
+    for start in range(0, total, tile):
+        end = min(start + tile, total)
+        window_start = max(0, start - context)
+        window_end = min(total, end + context)
+        emissions, stride = generate_emissions(model, waveform[..., window_start:window_end], batch_size=batch_size)
+        # 앞뒤 문맥 구간에 해당하는 프레임 제거 (stride 단위가 backend마다 달라 프레임 수 비율로 계산:
+        # ctc-forced-aligner는 ms, torchaudio fallback은 초)
+        window_frames = emissions.shape[0]
+        window_samples = window_end - window_start
+        lead = int(round(window_frames * (start - window_start) / window_samples))
+        trail = int(round(window_frames * (window_end - end) / window_samples))
+        emissions = emissions[lead:window_frames - trail]
+        parts.append(emissions)
+        weighted_stride += stride * emissions.shape[0]
+        frames += emissions.shape[0]
+    return torch.cat(parts, dim=0), weighted_stride / frames
+
+
+@lru_cache(maxsize=2)
+def _load_wav_cached(audio_path: str, mtime: float, sample_rate: int = ALIGNMENT_SAMPLE_RATE) -> torch.Tensor:
+    """오디오 파일을 mono float32 CPU 텐서로 디코딩 ((경로, 수정 시각, sample rate) 단위로 캐시)
+
+    배치 정렬 실패 후 파일별로 다시 정렬할 때 디코딩을 반복하지 않도록 최근 파일만 보관하며,
+    파일이 바뀌면 mtime이 달라져 다시 디코딩합니다.
+    torchaudio가 설치되어 있으면 ffmpeg 하위 프로세스 없이 프로세스 안에서 디코딩하고,
+    없거나 해당 포맷을 읽지 못하면 faster_whisper.decode_audio로 fallback.
+    반환된 텐서는 공유되므로 호출자는 in-place로 수정하면 안 됩니다.
+    """
+    waveform = None
+    if importlib.util.find_spec("torchaudio") is not None:
+        try:
+            import torchaudio
+            import torchaudio.functional as ta_F
+            waveform, source_rate = torchaudio.load(audio_path)
+            waveform = waveform.mean(0) if waveform.shape[0] > 1 else waveform[0]
+            if source_rate != sample_rate:
+                waveform = ta_F.resample(waveform, source_rate, sample_rate)
+        except Exception as e:
+            logger.debug("torchaudio.load failed for %s, using decode_audio: %s", audio_path, e)
+            waveform = None
+    if waveform is None:
+        waveform = torch.from_numpy(decode_audio(audio_path, sampling_rate=sample_rate))
+    return waveform
+
+
+@lru_cache(maxsize=64)
+def _cached_preprocess_text(transcript: str, language: str):
+    """같은 전사문을 여러 구간/재시도에 정렬할 때 토큰화·로마자 변환 결과 재사용"""
+    return preprocess_text(transcript, romanize=True, language=language)
 
 
 class ForcedAligner:
@@ -51,7 +213,7 @@ class ForcedAligner:
     device : str
         Device to run the model on ('cuda' for GPU or 'cpu').
     alignment_model : torch.nn.Module
-        The pre-trained alignment model.
+        The pre-trained alignment model, loaded on the first alignment (None until then or if unavailable).
     alignment_tokenizer : Any
         Tokenizer for processing text in alignment.
 
@@ -59,6 +221,10 @@ class ForcedAligner:
     -------
     audio_align(audio_path, transcript, language, batch_size)
         Aligns audio with a transcript and returns word-level timing information.
+    audio_align_iter(audio_path, transcript, language, batch_size)
+        Same as audio_align, but yields the word timing dictionaries one at a time.
+    audio_align_batch(items, batch_size)
+        Aligns several (audio_path, transcript, language) items, batching emission generation when possible.
     """
 
     def __init__(self, device: Annotated[str, "Device for model ('cuda' or 'cpu')"] = None):
@@ -71,21 +237,42 @@ class ForcedAligner:
             Device for running the model, by default 'cuda' if available, otherwise 'cpu'.
         """
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
-        
+        # 모델은 실제 정렬이 처음 필요할 때 로드 (whisper 타임스탬프만 쓰는 호출자는 로드하지 않음)
+        self.alignment_model = None
+        self.alignment_tokenizer = None
+        self._model_load_attempted = False
+
+    def _lazy_load(self) -> None:
+        """정렬 모델을 처음 필요할 때 한 번만 로드 (실패하면 비활성화 상태 유지)"""
+        if self._model_load_attempted:
+            return
+        self._model_load_attempted = True
+
         # ctc-forced-aligner API 호환성 체크
+        _init_ctc_forced_aligner()
         if load_alignment_model is None:
-            print("Warning: ctc-forced-aligner not properly installed. ForcedAligner will be disabled.")
-            self.alignment_model = None
-            self.alignment_tokenizer = None
+            logger.warning("ctc-forced-aligner not properly installed. ForcedAligner will be disabled.")
             return
             
+        # Ampere 이상 GPU는 fp16과 같은 속도에 지수 범위가 넓은 bf16 사용
+        if self.device == 'cuda':
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        else:
+            dtype = torch.float32
+        cache_key = (self.device, str(dtype))
         try:
-            self.alignment_model, self.alignment_tokenizer = load_alignment_model(
-                self.device,
-                dtype=torch.float16 if self.device == 'cuda' else torch.float32,
-            )
+            # 같은 device/dtype의 모델은 한 번만 로드 (동시 생성 시 중복 로드 방지)
+            with _ALIGNMENT_MODEL_CACHE_LOCK:
+                if cache_key not in _ALIGNMENT_MODEL_CACHE:
+                    model, tokenizer = load_alignment_model(self.device, dtype=dtype)
+                    # 공유 모델은 추론 전용 (dropout 등 학습용 동작 비활성화)
+                    model.eval()
+                    model = _maybe_quantize_model(model, self.device)
+                    model = _maybe_compile_model(model, self.device)
+                    _ALIGNMENT_MODEL_CACHE[cache_key] = (model, tokenizer)
+                self.alignment_model, self.alignment_tokenizer = _ALIGNMENT_MODEL_CACHE[cache_key]
         except Exception as e:
-            print(f"Warning: Failed to load alignment model: {e}")
+            logger.warning("Failed to load alignment model: %s", e)
             self.alignment_model = None
             self.alignment_tokenizer = None
 
@@ -96,6 +283,8 @@ class ForcedAligner:
             language: Annotated[str, "Language of the transcript"] = 'en',
             batch_size: Annotated[int, "Batch size for emission generation"] = 8,
             whisper_word_timestamps: Annotated[List[Dict], "Word timestamps from faster-whisper"] = None,
+            release_memory: Annotated[Optional[bool], "Release cached CUDA memory after alignment"] = None,
+            use_forced_alignment: Annotated[bool, "Re-align even when whisper word timestamps are given"] = True,
     ) -> Annotated[List[Dict[str, float]], "List of word alignment data with timestamps"]:
         """
         Aligns audio with a transcript and returns word-level timing information.
@@ -112,6 +301,15 @@ class ForcedAligner:
             Batch size for generating emissions, by default 8.
         whisper_word_timestamps : List[Dict], optional
             Pre-computed word timestamps from faster-whisper, by default None.
+        release_memory : bool, optional
+            Whether to call ``torch.cuda.empty_cache()`` after alignment. Defaults to the
+            ``ALIGN_FREE_CACHE`` environment variable (off unless set to "true"). PyTorch's
+            caching allocator reuses freed blocks on its own; emptying the cache synchronizes
+            the device and slows the next call, so only enable it when other processes run
+            out of GPU memory between long runs.
+        use_forced_alignment : bool, optional
+            If False and ``whisper_word_timestamps`` is given, return those timestamps as-is
+            without loading the alignment model or running the CTC encoder. Defaults to True.
 
         Returns
         -------
@@ -129,90 +327,205 @@ class ForcedAligner:
         >>> aligner.audio_align("path/to/audio.wav", "hello world")
         [{'word': 'hello', 'start': 0.0, 'end': 0.5}, {'word': 'world', 'start': 0.6, 'end': 1.0}]
         """
+        word_timestamps = list(self.audio_align_iter(
+            audio_path,
+            transcript,
+            language,
+            batch_size=batch_size,
+            whisper_word_timestamps=whisper_word_timestamps,
+            release_memory=release_memory,
+            use_forced_alignment=use_forced_alignment,
+        ))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Word_Timestamps: %s", word_timestamps)
+
+        return word_timestamps
+
+    def audio_align_iter(
+            self,
+            audio_path: Annotated[str, "Path to the audio file"],
+            transcript: Annotated[str, "Transcript of the audio content"],
+            language: Annotated[str, "Language of the transcript"] = 'en',
+            batch_size: Annotated[int, "Batch size for emission generation"] = 8,
+            whisper_word_timestamps: Annotated[List[Dict], "Word timestamps from faster-whisper"] = None,
+            release_memory: Annotated[Optional[bool], "Release cached CUDA memory after alignment"] = None,
+            use_forced_alignment: Annotated[bool, "Re-align even when whisper word timestamps are given"] = True,
+    ) -> Annotated[Iterator[Dict[str, float]], "Word alignment data with timestamps, one word at a time"]:
+        """
+        Aligns audio with a transcript and yields word-level timing information one word at a time.
+
+        The CTC forward pass, forced alignment and span merging run before this method returns,
+        so errors still fall back to ``whisper_word_timestamps`` or dummy data. Only the
+        conversion of spans into word dictionaries is deferred, which lets callers that write
+        results incrementally (e.g. subtitles) start before every word dict has been built.
+        Parameters are the same as :meth:`audio_align`.
+
+        Returns
+        -------
+        Iterator[Dict[str, float]]
+            Word timing dictionaries in transcript order.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the specified audio file does not exist.
+        """
         if not os.path.exists(audio_path):
             raise FileNotFoundError(
                 f"The audio file at path '{audio_path}' was not found."
             )
+
+        # faster-whisper 타임스탬프로 충분한 경우 CTC 정렬 생략
+        if whisper_word_timestamps and not use_forced_alignment:
+            return iter(whisper_word_timestamps)
+
+        self._lazy_load()
         
         # ForcedAligner가 비활성화된 경우
         if self.alignment_model is None:
-            print("Warning: ForcedAligner is disabled.")
+            logger.warning("ForcedAligner is disabled.")
             
             # faster-whisper word_timestamps가 제공된 경우 우선 사용
             if whisper_word_timestamps:
-                print("Using faster-whisper word timestamps instead of ctc-forced-aligner.")
-                return whisper_word_timestamps
+                logger.info("Using faster-whisper word timestamps instead of ctc-forced-aligner.")
+                return iter(whisper_word_timestamps)
             
             # fallback: 더미 데이터 생성
-            print("Generating dummy alignment data.")
-            words = transcript.split()
-            dummy_alignments = []
-            duration_per_word = 1.0  # 단어당 1초로 가정
-            for i, word in enumerate(words):
-                dummy_alignments.append({
-                    'word': word,
-                    'start': i * duration_per_word,
-                    'end': (i + 1) * duration_per_word
-                })
-            return dummy_alignments
+            logger.warning("Generating dummy alignment data.")
+            return iter(_dummy_alignments(transcript))
 
         try:
-            if load_audio:
-                audio_waveform = load_audio(audio_path, self.alignment_model.dtype, self.alignment_model.device)
-            else:
-                # Fallback to faster_whisper
-                speech_array = torch.from_numpy(decode_audio(audio_path))
-                audio_waveform = speech_array.to(self.alignment_model.dtype).to(self.alignment_model.device)
-
-            emissions, stride = generate_emissions(
-                self.alignment_model,
-                audio_waveform,
-                batch_size=batch_size,
-            )
-
-            tokens_starred, text_starred = preprocess_text(
-                transcript,
-                romanize=True,
-                language=language,
-            )
-
-            segments, scores, blank_token = get_alignments(
-                emissions,
-                tokens_starred,
-                self.alignment_tokenizer,
-            )
-
-            spans = get_spans(tokens_starred, segments, blank_token)
-
-            word_timestamps = postprocess_results(text_starred, spans, stride, scores)
-
-            if self.device == 'cuda':
+            audio_waveform = self._load_waveform(audio_path)
+            # 오디오가 GPU로 복사되는 동안 CPU에서 전사문 토큰화를 미리 수행 (결과는 캐시됨)
+            _cached_preprocess_text(transcript, language)
+
+            # emission 계산부터 forced_align/span 병합까지 autograd 기록 없이 수행
+            # (모델 가중치가 이미 GPU에서 bf16/fp16이라 autocast는 불필요)
+            with torch.inference_mode():
+                emissions, stride = _generate_emissions_tiled(
+                    self.alignment_model,
+                    audio_waveform,
+                    batch_size=batch_size,
+                )
+                word_timestamps = self._align_emissions_iter(emissions, stride, transcript, language)
+
+            if release_memory is None:
+                release_memory = ALIGNMENT_RELEASE_CUDA_CACHE
+            if release_memory and self.device == 'cuda':
                 torch.cuda.empty_cache()
 
-            print(f"Word_Timestamps: {word_timestamps}")
-
             return word_timestamps
             
         except Exception as e:
-            print(f"Warning: Forced alignment failed: {e}")
+            logger.warning("Forced alignment failed: %s", e)
             
             # faster-whisper word_timestamps가 제공된 경우 fallback으로 사용
             if whisper_word_timestamps:
-                print("Using faster-whisper word timestamps as fallback.")
-                return whisper_word_timestamps
+                logger.info("Using faster-whisper word timestamps as fallback.")
+                return iter(whisper_word_timestamps)
             
             # 최종 fallback: 더미 데이터 반환
-            print("Generating dummy alignment data as final fallback.")
-            words = transcript.split()
-            dummy_alignments = []
-            duration_per_word = 1.0
-            for i, word in enumerate(words):
-                dummy_alignments.append({
-                    'word': word,
-                    'start': i * duration_per_word,
-                    'end': (i + 1) * duration_per_word
-                })
-            return dummy_alignments
+            logger.warning("Generating dummy alignment data as final fallback.")
+            return iter(_dummy_alignments(transcript))
+
+    def audio_align_batch(
+            self,
+            items: Annotated[List[Tuple[str, str, str]], "List of (audio_path, transcript, language)"],
+            batch_size: Annotated[int, "Number of audio files per emission forward pass"] = 8,
+    ) -> Annotated[List[List[Dict[str, float]]], "Word alignment data per audio file"]:
+        """
+        Aligns several audio files with their transcripts.
+
+        With the torchaudio fallback model, the waveforms of up to ``batch_size`` files are
+        padded into one ``(B, T)`` batch so the CTC encoder runs a single forward pass per
+        batch instead of one per file. Other backends align the files one by one.
+
+        Parameters
+        ----------
+        items : List[Tuple[str, str, str]]
+            ``(audio_path, transcript, language)`` for each audio file.
+        batch_size : int, optional
+            Number of audio files per forward pass, by default 8.
+
+        Returns
+        -------
+        List[List[Dict[str, float]]]
+            Word timing information for each item, in input order.
+
+        Raises
+        ------
+        FileNotFoundError
+            If one of the audio files does not exist.
+        """
+        self._lazy_load()
+        if self.alignment_model is None or generate_emissions is not _generate_emissions_ta:
+            return [
+                self.audio_align(audio_path, transcript, language, batch_size=batch_size)
+                for audio_path, transcript, language in items
+            ]
+
+        for audio_path, _, _ in items:
+            if not os.path.exists(audio_path):
+                raise FileNotFoundError(
+                    f"The audio file at path '{audio_path}' was not found."
+                )
+
+        results = []
+        for offset in range(0, len(items), batch_size):
+            chunk = items[offset:offset + batch_size]
+            try:
+                waveforms = [self._load_waveform(audio_path) for audio_path, _, _ in chunk]
+                emissions, frame_lengths, stride = _generate_emissions_batch_ta(self.alignment_model, waveforms)
+            except Exception as e:
+                logger.warning("Batched emission generation failed, aligning one by one: %s", e)
+                results.extend(
+                    self.audio_align(audio_path, transcript, language, batch_size=batch_size)
+                    for audio_path, transcript, language in chunk
+                )
+                continue
+
+            for i, (audio_path, transcript, language) in enumerate(chunk):
+                try:
+                    with torch.inference_mode():
+                        results.append(
+                            self._align_emissions(emissions[i, :frame_lengths[i]], stride, transcript, language)
+                        )
+                except Exception as e:
+                    logger.warning("Forced alignment failed for %s: %s", audio_path, e)
+                    results.append(_dummy_alignments(transcript))
+        return results
+
+    def _load_waveform(self, audio_path: str) -> torch.Tensor:
+        """정렬 모델의 dtype/device로 오디오 로드 (디코딩 결과는 파일 단위로 캐시)"""
+        waveform = _load_wav_cached(audio_path, os.path.getmtime(audio_path))
+        # torchaudio MMS_FA 모델에는 .dtype/.device 속성이 없으므로 파라미터에서 확인
+        parameter = next(self.alignment_model.parameters())
+        device, dtype = parameter.device, parameter.dtype
+        if device.type == 'cuda':
+            # 복사할 때만 pinned 메모리를 거쳐 비동기로 보내 이후 CPU 작업(텍스트 전처리 등)과 겹치게 함
+            waveform = waveform.pin_memory().to(device, non_blocking=True)
+        return waveform.to(device=device, dtype=dtype)
+
+    def _align_emissions(self, emissions, stride, transcript: str, language: str) -> List[Dict[str, float]]:
+        """한 오디오의 emission과 전사문으로 단어 단위 타임스탬프 계산"""
+        return list(self._align_emissions_iter(emissions, stride, transcript, language))
+
+    def _align_emissions_iter(self, emissions, stride, transcript: str, language: str) -> Iterator[Dict[str, float]]:
+        """정렬/span 병합은 즉시 수행하고, 단어 단위 dict 변환은 순회할 때 하나씩 생성"""
+        tokens_starred, text_starred = _cached_preprocess_text(transcript, language)
+
+        segments, scores, blank_token = get_alignments(
+            emissions,
+            tokens_starred,
+            self.alignment_tokenizer,
+        )
+
+        spans = get_spans(tokens_starred, segments, blank_token)
+
+        if postprocess_results is _postprocess_results_ta and isinstance(text_starred, _PreparedTextTa):
+            return _iter_words_ta(spans, text_starred.word_lengths, text_starred.words, stride)
+        return iter(postprocess_results(text_starred, spans, stride, scores))
 
 
 if __name__ == "__main__":
@@ -235,88 +548,187 @@ if __name__ == "__main__":
 # `generate_emissions`, `preprocess_text` 등 함수를 기대하므로 동일한
 # 시그니처를 맞춰주면 다른 부분을 수정하지 않아도 된다.
 
-try:
-    import torchaudio
-    import torchaudio.functional as ta_F
-    from torchaudio.pipelines import MMS_FA as _MMS_FA_BUNDLE
-
-    _bundle = _MMS_FA_BUNDLE  # 다국어 1B CTC 모델
-    _LABELS = _bundle.get_labels(star=None)
-    _DICT = _bundle.get_dict(star=None)
-
-    def _load_alignment_model_ta(device: str = 'cpu', dtype=torch.float32):
-        """torchaudio wav2vec2 CTC 모델 + tokenizer 로드 (CPU/GPU)."""
-        model = _bundle.get_model(with_star=False).to(device, dtype=dtype)
-        tokenizer = _DICT  # char->idx dict 그대로 반환 (기존 코드 호환용)
-        return model, tokenizer
-
-    def _generate_emissions_ta(model, waveform: torch.Tensor, batch_size: int = 8):
-        """모델 forward 로 emission(logits) 및 stride(=index duration) 계산"""
+@lru_cache(maxsize=1)
+def _get_mms_fa_bundle():
+    """torchaudio MMS_FA 번들과 문자->index dict (fallback을 처음 사용할 때 한 번만 로드)"""
+    from torchaudio.pipelines import MMS_FA as _MMS_FA_BUNDLE  # 다국어 1B CTC 모델
+    return _MMS_FA_BUNDLE, _MMS_FA_BUNDLE.get_dict(star=None)
+
+
+@lru_cache(maxsize=1)
+def _get_char_index_table() -> np.ndarray:
+    """ASCII 코드 -> MMS_FA 문자 index 변환 테이블 (사전에 없는 문자는 -1)"""
+    _, char_dict = _get_mms_fa_bundle()
+    table = np.full(256, -1, dtype=np.int64)
+    for char, index in char_dict.items():
+        if len(char) == 1 and ord(char) < 128:
+            table[ord(char)] = index
+    return table
+
+
+def _load_alignment_model_ta(device: str = 'cpu', dtype=torch.float32):
+    """torchaudio wav2vec2 CTC 모델 + tokenizer 로드 (CPU/GPU)."""
+    bundle, char_dict = _get_mms_fa_bundle()
+    model = bundle.get_model(with_star=False).to(device, dtype=dtype)
+    tokenizer = char_dict  # char->idx dict 그대로 반환 (기존 코드 호환용)
+    return model, tokenizer
+
+
+def _generate_emissions_ta(model, waveform: torch.Tensor, batch_size: int = 8):
+    """모델 forward 로 emission(logits) 및 stride(=index duration) 계산"""
+    bundle, _ = _get_mms_fa_bundle()
+    if waveform.dim() == 1:
+        waveform = waveform.unsqueeze(0)  # 모델 입력은 (batch, time)
+    if ALIGNMENT_TORCH_COMPILE:
+        # 컴파일된 그래프가 재컴파일되지 않도록 구간 길이로 zero-padding 후 유효 frame만 사용
+        # (패딩이 정규화 통계에 섞이지 않도록 먼저 정규화하고 wrapper를 거치지 않음)
+        num_samples = waveform.shape[-1]
+        padded = _bucket_num_samples(num_samples, bundle.sample_rate)
+        lengths = torch.tensor([num_samples], device=waveform.device)
         with torch.inference_mode():
-            emissions, _ = model(waveform)
-        # stride 계산: torchaudio 모델은 20ms/stride 4 => 640/16000=0.04? 안전하게
-        # index_duration = waveform_len / num_frames / sample_rate
-        index_duration = waveform.shape[-1] / emissions.shape[1] / _bundle.sample_rate
-        return emissions[0].cpu(), index_duration  # (frames, vocab), float
-
-    def _preprocess_text_ta(text: str):
-        """공백 단위로 단어 분할, 각 단어를 문자 index 시퀀스로 변환."""
-        words = text.lower().strip().split()
-        tokens = [ _DICT[c] for w in words for c in w ]
-        word_lengths = [len(w) for w in words]
-        return tokens, word_lengths, words
-
-    def _postprocess_to_words_ta(token_spans, word_lengths, words, index_duration):
-        """TokenSpan 리스트를 단어 단위 time dict 로 변환."""
-        def _unflatten(lst, lens):
-            out = []
-            i = 0
-            for l in lens:
-                out.append(lst[i:i+l])
-                i += l
-            return out
-
-        grouped = _unflatten(token_spans, word_lengths)
-        results = []
-        for w, spans in zip(words, grouped):
-            start_fr = spans[0].start
-            end_fr = spans[-1].end
-            results.append({
-                'word': w,
-                'start': round(start_fr * index_duration, 3),
-                'end': round(end_fr * index_duration, 3)
-            })
-        return results
+            waveform = _normalize_waveform_ta(model, waveform)
+            waveform = torch.nn.functional.pad(waveform, (0, padded - num_samples))
+            emissions, frame_lengths = _forward_normalized_ta(model, waveform, lengths)
+        emissions = emissions[:, :int(frame_lengths[0])]
+        index_duration = num_samples / emissions.shape[1] / bundle.sample_rate
+        return emissions[0], index_duration
+    with torch.inference_mode():
+        emissions, _ = model(waveform)
+    # stride 계산: torchaudio 모델은 20ms/stride 4 => 640/16000=0.04? 안전하게
+    # index_duration = waveform_len / num_frames / sample_rate
+    index_duration = waveform.shape[-1] / emissions.shape[1] / bundle.sample_rate
+    # forced_align은 CUDA 구현이 있으므로 emission은 모델 device에 그대로 둠
+    return emissions[0], index_duration  # (frames, vocab), float
+
+
+def _normalize_waveform_ta(model, waveform: torch.Tensor) -> torch.Tensor:
+    """MMS_FA wrapper의 waveform 정규화(layer_norm)를 waveform 하나에 적용"""
+    if getattr(model, "normalize_waveform", False):
+        return torch.nn.functional.layer_norm(waveform, waveform.shape)
+    return waveform
+
+
+def _forward_normalized_ta(model, waveforms: torch.Tensor, lengths: Optional[torch.Tensor] = None):
+    """_normalize_waveform_ta로 정규화한 (B, T) 입력으로 MMS_FA forward
+
+    torchaudio wrapper(_Wav2Vec2Model)는 입력 전체에 layer_norm을 적용하므로 zero-padding이
+    정규화 통계에 섞이지 않도록 내부 wav2vec2 모델을 직접 호출하고 나머지 후처리만 재현합니다.
+    """
+    emissions, frame_lengths = model.model(waveforms, lengths)
+    if getattr(model, "apply_log_softmax", False):
+        emissions = torch.nn.functional.log_softmax(emissions, dim=-1)
+    if getattr(model, "append_star", False):
+        star = torch.zeros((*emissions.shape[:-1], 1), dtype=emissions.dtype, device=emissions.device)
+        emissions = torch.cat((emissions, star), dim=-1)
+    return emissions, frame_lengths
 
-    # fallback 전역 함수 alias 연결
-    if load_alignment_model is None:
-        load_alignment_model = _load_alignment_model_ta
-        generate_emissions = _generate_emissions_ta
-        preprocess_text = _preprocess_text_ta
 
-        # torchaudio 의 merge_tokens 를 그대로 사용 (TokenSpan 클래스 포함)
-        merge_tokens = ta_F.merge_tokens  # type: ignore
-        forced_align = ta_F.forced_align   # type: ignore
+def _generate_emissions_batch_ta(model, waveforms: List[torch.Tensor]):
+    """여러 waveform을 (B, T)로 패딩해 한 번의 forward로 emission 계산
 
-        def _get_alignments_ta(emissions, tokens, _tokenizer):
-            # emissions: (frames, vocab)
-            targets = torch.tensor([tokens], dtype=torch.int32)
-            alignments, scores = forced_align(emissions, targets, blank=0)
-            return alignments[0], scores[0].exp(), 0  # align seq, scores, blank idx
+    (emissions (B, frames, vocab), 항목별 유효 프레임 수, index duration)을 반환합니다.
+    """
+    bundle, _ = _get_mms_fa_bundle()
+    lengths = torch.tensor([w.shape[-1] for w in waveforms], device=waveforms[0].device)
+    with torch.inference_mode():
+        # 파일별로 정규화한 뒤 패딩 (wrapper는 패딩된 배치 전체에 layer_norm을 적용하므로 사용하지 않음)
+        batch = torch.nn.utils.rnn.pad_sequence(
+            [_normalize_waveform_ta(model, w.reshape(-1)) for w in waveforms], batch_first=True
+        )
+        emissions, frame_lengths = _forward_normalized_ta(model, batch, lengths)
+    index_duration = batch.shape[-1] / emissions.shape[1] / bundle.sample_rate
+    return emissions, frame_lengths.tolist(), index_duration
+
+
+class _PreparedTextTa(NamedTuple):
+    """_preprocess_text_ta가 만든 단어 분할 결과 (후처리에서 재사용)"""
+    words: List[str]
+    word_lengths: List[int]
+
+
+def _preprocess_text_ta(text: str, romanize: bool = False, language: str = None):
+    """공백 단위로 단어 분할, 각 단어를 문자 index 시퀀스로 변환.
+
+    ctc-forced-aligner의 preprocess_text와 같이 (tokens, text_starred)를 반환하며,
+    text_starred 자리에는 단어 분할 결과를 담아 _postprocess_results_ta가 다시
+    토큰화하지 않도록 합니다. romanize/language는 시그니처 호환용으로 무시합니다.
+    """
+    words = text.lower().strip().split()
+    joined = ''.join(words)
+    try:
+        # MMS_FA 라벨은 ASCII이므로 바이트 배열에 테이블 인덱싱으로 한 번에 변환
+        indices = _get_char_index_table()[np.frombuffer(joined.encode('ascii'), dtype=np.uint8)]
+    except UnicodeEncodeError:
+        indices = None
+    if indices is None or (indices < 0).any():
+        # 사전에 없는 문자가 있으면 기존과 같이 KeyError 발생
+        _, char_dict = _get_mms_fa_bundle()
+        tokens = [char_dict[c] for c in joined]
+    else:
+        tokens = indices.tolist()
+    word_lengths = [len(w) for w in words]
+    return tokens, _PreparedTextTa(words, word_lengths)
+
+
+def _iter_words_ta(token_spans, word_lengths, words, index_duration) -> Iterator[Dict[str, float]]:
+    """_TokenSpansTa 토큰 구간을 단어 단위 time dict 로 하나씩 생성 (시간 계산은 호출 시 한 번에 수행)"""
+    if not words:
+        return iter(())
+
+    # 단어별 첫/마지막 토큰 위치를 누적합으로 구해 시작/끝 프레임을 한 번에 수집
+    span_starts = token_spans.starts.cpu().double()
+    span_ends = token_spans.ends.cpu().double()
+    lengths = torch.tensor(word_lengths)
+    last_idx = torch.cumsum(lengths, 0) - 1
+    first_idx = last_idx - lengths + 1
+
+    starts = (span_starts[first_idx] * index_duration).round(decimals=3).tolist()
+    ends = (span_ends[last_idx] * index_duration).round(decimals=3).tolist()
+    return (
+        {'word': w, 'start': start, 'end': end}
+        for w, start, end in zip(words, starts, ends)
+    )
+
+
+def _postprocess_to_words_ta(token_spans, word_lengths, words, index_duration):
+    """_TokenSpansTa 토큰 구간을 단어 단위 time dict 리스트로 변환."""
+    return list(_iter_words_ta(token_spans, word_lengths, words, index_duration))
+
+
+def _get_alignments_ta(emissions, tokens, _tokenizer):
+    import torchaudio.functional as ta_F
+    # emissions: (frames, vocab), 모델 device에서 바로 정렬 (DP는 fp32로 수행)
+    targets = torch.tensor([tokens], dtype=torch.int32, device=emissions.device)
+    alignments, scores = ta_F.forced_align(emissions.float().unsqueeze(0), targets, blank=0)
+    return alignments[0], scores[0].exp(), 0  # align seq, scores, blank idx
 
-        def _get_spans_ta(tokens, segments, blank_token):
-            return merge_tokens(segments, blank_token)
 
-        def _postprocess_results_ta(text_starred, spans, index_duration, scores):
-            # text_starred 미사용.
-            tokens, word_lengths, words = _preprocess_text_ta(text_starred)
-            return _postprocess_to_words_ta(spans, word_lengths, words, index_duration)
+class _TokenSpansTa(NamedTuple):
+    """blank가 아닌 토큰 구간들의 label/시작/끝 프레임 (end는 exclusive)"""
+    labels: torch.Tensor
+    starts: torch.Tensor
+    ends: torch.Tensor
 
-        get_alignments = _get_alignments_ta
-        get_spans = _get_spans_ta
-        postprocess_results = _postprocess_results_ta
 
-        print("✅ torchaudio fallback alignment enabled (Python 3.8 compatible)")
+def _get_spans_ta(tokens, segments, blank_token):
+    """프레임별 정렬 결과를 run-length encoding해 토큰 구간으로 병합
 
-except Exception as _ta_e:
-    print(f"⚠️ torchaudio fallback initialisation failed: {_ta_e}")
\ No newline at end of file
+    torchaudio.functional.merge_tokens와 같은 구간을 Python 루프 없이 텐서 연산으로 계산합니다.
+    """
+    # 값이 바뀌는 프레임이 각 run의 시작, 다음 run의 시작이 현재 run의 끝
+    change = torch.ones_like(segments, dtype=torch.bool)
+    change[1:] = segments[1:] != segments[:-1]
+    starts = change.nonzero(as_tuple=True)[0]
+    ends = torch.empty_like(starts)
+    ends[:-1] = starts[1:]
+    ends[-1:] = segments.shape[0]
+    labels = segments[starts]
+    keep = labels != blank_token
+    return _TokenSpansTa(labels[keep], starts[keep], ends[keep])
+
+
+def _postprocess_results_ta(text_starred, spans, index_duration, scores):
+    # _preprocess_text_ta의 단어 분할 결과를 그대로 사용 (문자열이 오면 다시 분할)
+    if not isinstance(text_starred, _PreparedTextTa):
+        _, text_starred = _preprocess_text_ta(text_starred)
+    return _postprocess_to_words_ta(spans, text_starred.word_lengths, text_starred.words, index_duration)
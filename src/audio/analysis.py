@@ -1,14 +1,86 @@
 # Standard library imports
 import os
+import re
 import wave
+from collections import Counter
 from typing import List, Dict, Annotated, Union, Tuple, Any, Optional
 
 # Related third-party imports
 import nltk
 import numpy as np
 import soundfile as sf
-from librosa.feature import mfcc
-from scipy.fft import fft, fftfreq
+from scipy.fft import rfft, rfftfreq
+from librosa import power_to_db
+from librosa.feature import melspectrogram, mfcc
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 문장 끝으로 보는 단어 마지막 문자 (화자 재정렬용)
+SENTENCE_ENDING_PUNCTUATIONS = frozenset(".?!")
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _sign_change_sum_jit(data):
+        total = 0
+        prev = (data[0] > 0) - (data[0] < 0)
+        for i in range(1, data.shape[0]):
+            sign = (data[i] > 0) - (data[i] < 0)
+            total += abs(sign - prev)
+            prev = sign
+        return total
+
+# MFCC 평균 계산 설정 (librosa 기본 프레임 설정을 명시해 구간 경계를 고정)
+MFCC_N_FFT = 2048
+MFCC_HOP_LENGTH = 512
+MFCC_CHUNK_SECONDS = 30
+MFCC_TOP_DB = 80.0
+
+
+def _mfcc_mean(data: np.ndarray, rate: int, n_mfcc: int = 13) -> np.ndarray:
+    """mfcc(y=data, sr=rate, n_mfcc=n_mfcc)의 프레임 평균을 구간별로 계산
+
+    전체 신호의 STFT 행렬을 한 번에 만들지 않고 MFCC_CHUNK_SECONDS 단위로 mel 스펙트로그램을
+    계산합니다. 구간은 hop 단위로 나누고 앞뒤로 필요한 샘플(중앙 정렬 zero padding 포함)을
+    붙여 전체 신호의 프레임과 같은 프레임을 만들며, top_db 제한은 전체 최댓값 기준으로 적용합니다.
+    DCT는 선형이므로 log-mel 평균의 DCT가 MFCC 평균과 같습니다.
+    """
+    half = MFCC_N_FFT // 2
+    num_frames = 1 + len(data) // MFCC_HOP_LENGTH
+    frames_per_chunk = max(1, (MFCC_CHUNK_SECONDS * rate) // MFCC_HOP_LENGTH)
+
+    log_mel_chunks = []
+    for first in range(0, num_frames, frames_per_chunk):
+        last = min(first + frames_per_chunk, num_frames)
+        # 중앙 정렬 기준 샘플 구간 [first*hop - half, (last-1)*hop + half)
+        begin = first * MFCC_HOP_LENGTH - half
+        end = (last - 1) * MFCC_HOP_LENGTH + half
+        chunk = data[max(begin, 0):min(end, len(data))]
+        if begin < 0 or end > len(data):
+            chunk = np.pad(chunk, (max(-begin, 0), max(end - len(data), 0)))
+        mel = melspectrogram(y=chunk, sr=rate, n_fft=MFCC_N_FFT, hop_length=MFCC_HOP_LENGTH, center=False)
+        log_mel_chunks.append(power_to_db(mel, top_db=None))
+
+    global_max = max(chunk.max() for chunk in log_mel_chunks)
+    floor = global_max - MFCC_TOP_DB
+    log_mel_sum = sum(np.maximum(chunk, floor).sum(axis=1, dtype=np.float64) for chunk in log_mel_chunks)
+    mean_log_mel = (log_mel_sum / num_frames).astype(np.float32)
+    return mfcc(S=mean_log_mel[:, np.newaxis], n_mfcc=n_mfcc)[:, 0]
+
+
+def _zero_crossing_rate(data: np.ndarray) -> float:
+    """sum(|diff(sign(x))|) / len(x) 형태의 영교차율
+
+    numba가 있으면 부호 계산/차분/합산을 한 번의 순회로 처리하고,
+    없으면 NumPy 연산으로 같은 값을 계산합니다.
+    """
+    if NUMBA_AVAILABLE:
+        return int(_sign_change_sum_jit(data)) / len(data)
+    return float(np.sum(np.abs(np.diff(np.sign(data))))) / len(data)
 
 
 class WordSpeakerMapper:
@@ -57,6 +129,35 @@ class WordSpeakerMapper:
         self.speaker_timestamps = speaker_timestamps
         self.word_speaker_mapping = None
 
+    @property
+    def word_timestamps(self) -> List[Dict]:
+        """
+        Word timing information as a list of dicts with 'text', 'start' and 'end' keys.
+
+        Internally the words are kept as start/end arrays and a text list, and a new dict
+        list is built on each access. Changes to the returned list are not reflected;
+        assign ``word_timestamps`` again to update the words.
+        """
+        return [
+            {
+                "text": text,
+                "start": None if np.isnan(start) else start,
+                "end": None if np.isnan(end) else end,
+            }
+            for text, start, end in zip(self._texts, self._starts.tolist(), self._ends.tolist())
+        ]
+
+    @word_timestamps.setter
+    def word_timestamps(self, word_timestamps: List[Dict]) -> None:
+        # 단어 정보를 시작/끝 배열과 텍스트 리스트로 보관 (누락된 시간은 NaN)
+        self._texts = [w["text"] for w in word_timestamps]
+        self._starts = np.array(
+            [np.nan if w.get("start") is None else w["start"] for w in word_timestamps], dtype=np.float64
+        )
+        self._ends = np.array(
+            [np.nan if w.get("end") is None else w["end"] for w in word_timestamps], dtype=np.float64
+        )
+
     def audio_filter_missing_timestamps(
             self,
             word_timestamps: Annotated[List[Dict], "List of word timing information"],
@@ -182,61 +283,55 @@ class WordSpeakerMapper:
         [{'text': 'Hello', 'start_time': 500, 'end_time': 1200, 'speaker': 1}]
         """
 
-        def audio_get_word_ts_anchor(start: int, end: int, option: str) -> int:
-            """
-            Determines the anchor timestamp for a word.
-
-            Parameters
-            ----------
-            start : int
-                Start time of the word in milliseconds.
-            end : int
-                End time of the word in milliseconds.
-            option : str
-                Anchor point for timestamp calculation ('start', 'mid', or 'end').
-
-            Returns
-            -------
-            int
-                Anchor timestamp for the word.
-
-            Examples
-            --------
-            >>> audio_get_word_ts_anchor(500, 1200, 'mid')
-            850
-            """
-            if option == "end":
-                return end
-            elif option == "mid":
-                return (start + end) // 2
-            return start
-
-        wrd_spk_mapping = []
-        turn_idx = 0
-        num_speaker_ts = len(self.speaker_timestamps)
-
-        for wrd_dict in self.word_timestamps:
-            ws, we, wrd = (
-                int(wrd_dict["start"] * 1000),
-                int(wrd_dict["end"] * 1000),
-                wrd_dict["text"],
+        num_words = len(self._texts)
+        if not num_words:
+            self.word_speaker_mapping = []
+            return self.word_speaker_mapping
+
+        if np.isnan(self._starts).any() or np.isnan(self._ends).any():
+            raise ValueError("word_timestamps contain words without start/end timestamps")
+
+        # 단어 시작/끝 시간(ms) 배열 (int()와 같이 0 방향으로 절사)
+        ws = (self._starts * 1000).astype(np.int64)
+        we = (self._ends * 1000).astype(np.int64)
+        if word_anchor_option == "end":
+            wrd_pos = we
+        elif word_anchor_option == "mid":
+            wrd_pos = (ws + we) // 2
+        else:
+            wrd_pos = ws
+
+        speaker_ids = [turn[2] for turn in self.speaker_timestamps]
+        num_speaker_ts = len(speaker_ids)
+        if num_speaker_ts:
+            turn_starts = np.fromiter((turn[0] for turn in self.speaker_timestamps), dtype=np.float64,
+                                      count=num_speaker_ts)
+            turn_ends = np.fromiter((turn[1] for turn in self.speaker_timestamps), dtype=np.float64,
+                                    count=num_speaker_ts)
+            # 단어 위치보다 끝 시간이 처음으로 같거나 큰 turn (순차 탐색과 같이 turn 위치는 되돌아가지 않음)
+            turn_idx = np.maximum.accumulate(
+                np.searchsorted(np.maximum.accumulate(turn_ends), wrd_pos, side="left")
             )
-            wrd_pos = audio_get_word_ts_anchor(ws, we, word_anchor_option)
-
-            sp = -1
-
-            while turn_idx < num_speaker_ts and wrd_pos > self.speaker_timestamps[turn_idx][1]:
-                turn_idx += 1
-
-            if turn_idx < num_speaker_ts and self.speaker_timestamps[turn_idx][0] <= wrd_pos <= \
-                    self.speaker_timestamps[turn_idx][1]:
-                sp = self.speaker_timestamps[turn_idx][2]
-            elif turn_idx > 0:
-                sp = self.speaker_timestamps[turn_idx - 1][2]
-
-            wrd_spk_mapping.append(
-                {"text": wrd, "start_time": ws, "end_time": we, "speaker": sp}
+            clipped_idx = np.minimum(turn_idx, num_speaker_ts - 1)
+            in_turn = (
+                    (turn_idx < num_speaker_ts)
+                    & (turn_starts[clipped_idx] <= wrd_pos)
+                    & (wrd_pos <= turn_ends[clipped_idx])
             )
+            # turn 안이면 해당 turn, 아니면 직전 turn의 화자 (직전 turn이 없으면 -1)
+            speaker_idx = np.where(in_turn, turn_idx, turn_idx - 1).tolist()
+        else:
+            speaker_idx = [-1] * num_words
+
+        wrd_spk_mapping = [
+            {
+                "text": text,
+                "start_time": start,
+                "end_time": end,
+                "speaker": speaker_ids[idx] if idx >= 0 else -1,
+            }
+            for text, start, end, idx in zip(self._texts, ws.tolist(), we.tolist(), speaker_idx)
+        ]
 
         self.word_speaker_mapping = wrd_spk_mapping
         return self.word_speaker_mapping
@@ -277,51 +372,31 @@ class WordSpeakerMapper:
          {'text': 'you', 'speaker': 'Speaker 1'},
          {'text': '?', 'speaker': 'Speaker 1'}]
         """
-        sentence_ending_punctuations = ".?!"
-
-        def audio_is_word_sentence_end(word_index: Annotated[int, "Index of the word to check"]) -> Annotated[
-            bool, "True if the word is a sentence end, False otherwise"]:
-            """
-            Checks if a word is the end of a sentence based on punctuation.
-
-            This method determines whether a word at the given index marks
-            the end of a sentence by checking if the last character of the
-            word is a sentence-ending punctuation (e.g., '.', '!', or '?').
-
-            Parameters
-            ----------
-            word_index : int
-                Index of the word to check in the `word_speaker_mapping`.
-
-            Returns
-            -------
-            bool
-                True if the word at the given index is the end of a sentence,
-                False otherwise.
-
-            """
-            return (
-                    word_index >= 0
-                    and self.word_speaker_mapping[word_index]["text"][-1] in sentence_ending_punctuations
-            )
-
         wsp_len = len(self.word_speaker_mapping)
         words_list = [wd['text'] for wd in self.word_speaker_mapping]
         speaker_list = [wd['speaker'] for wd in self.word_speaker_mapping]
+        # 단어별 문장 끝 여부와 문장 끝/화자 전환 위치를 한 번만 계산
+        # (재정렬은 현재 문장 안에서만 화자를 바꾸므로 이후 탐색에 쓰이는 화자 전환 위치는 변하지 않음)
+        is_sentence_end = [word[-1] in SENTENCE_ENDING_PUNCTUATIONS for word in words_list]
+        sentence_ends = np.flatnonzero(np.array(is_sentence_end, dtype=bool))
+        speaker_breaks = np.flatnonzero(
+            np.fromiter((a != b for a, b in zip(speaker_list, speaker_list[1:])), dtype=bool,
+                        count=max(wsp_len - 1, 0))
+        )
 
         k = 0
         while k < len(self.word_speaker_mapping):
             if (
                     k < wsp_len - 1
                     and speaker_list[k] != speaker_list[k + 1]
-                    and not audio_is_word_sentence_end(k)
+                    and not is_sentence_end[k]
             ):
                 left_idx = self._get_first_word_idx_of_sentence(
-                    k, words_list, speaker_list, max_words_in_sentence
+                    k, sentence_ends, speaker_breaks, max_words_in_sentence
                 )
                 right_idx = (
                     self._get_last_word_idx_of_sentence(
-                        k, words_list, max_words_in_sentence - (k - left_idx) - 1
+                        k, sentence_ends, wsp_len, max_words_in_sentence - (k - left_idx) - 1
                     )
                     if left_idx > -1
                     else -1
@@ -331,69 +406,67 @@ class WordSpeakerMapper:
                     continue
 
                 spk_labels = speaker_list[left_idx:right_idx + 1]
-                mod_speaker = max(set(spk_labels), key=spk_labels.count)
-                if spk_labels.count(mod_speaker) < len(spk_labels) // 2:
+                mod_speaker, mod_count = Counter(spk_labels).most_common(1)[0]
+                if mod_count < len(spk_labels) // 2:
                     k += 1
                     continue
 
-                speaker_list[left_idx:right_idx + 1] = [mod_speaker] * (
-                        right_idx - left_idx + 1
-                )
+                speaker_list[left_idx:right_idx + 1] = [mod_speaker] * len(spk_labels)
                 k = right_idx
 
             k += 1
 
-        for idx in range(len(self.word_speaker_mapping)):
-            self.word_speaker_mapping[idx]["speaker"] = speaker_list[idx]
+        for word_dict, speaker in zip(self.word_speaker_mapping, speaker_list):
+            word_dict["speaker"] = speaker
 
     @staticmethod
     def _get_first_word_idx_of_sentence(
-            word_idx: int, word_list: List[str], speaker_list: List[str], max_words: int
+            word_idx: int, sentence_ends: np.ndarray, speaker_breaks: np.ndarray, max_words: int
     ) -> int:
         """
         Finds the first word index of a sentence for realignment.
 
+        The sentence start is found by binary search over the precomputed sentence-end and
+        speaker-change positions instead of walking back word by word.
+
         Parameters
         ----------
         word_idx : int
             Current word index.
-        word_list : List[str]
-            List of words in the sentence.
-        speaker_list : List[str]
-            List of speakers for the words.
+        sentence_ends : np.ndarray
+            Sorted indices of words that end a sentence.
+        speaker_breaks : np.ndarray
+            Sorted indices ``i`` where the speaker of word ``i`` differs from word ``i + 1``.
         max_words : int
             Maximum words to consider in the sentence.
 
         Returns
         -------
         int
-            The index of the first word of the sentence.
+            The index of the first word of the sentence, or -1 if the sentence start is
+            not reachable within ``max_words`` words of the same speaker.
 
         Examples
         --------
-        >>> words_list = ["Hello", "world", ".", "How", "are", "you", "?"]
-        >>> speakers_list = ["Speaker 1", "Speaker 1", "Speaker 1", "Speaker 2", "Speaker 2", "Speaker 2", "Speaker 2"]
-        >>> WordSpeakerMapper._get_first_word_idx_of_sentence(4, word_list, speaker_list, 50)
-        3
-        """
-        sentence_ending_punctuations = ".?!"
-        is_word_sentence_end = (
-            lambda x: x >= 0 and word_list[x][-1] in sentence_ending_punctuations
-        )
-        left_idx = word_idx
-        while (
-                left_idx > 0
-                and word_idx - left_idx < max_words
-                and speaker_list[left_idx - 1] == speaker_list[left_idx]
-                and not audio_is_word_sentence_end(left_idx - 1)
-        ):
-            left_idx -= 1
+        >>> words_list = ["Hello", "world.", "How", "are", "you?"]
+        >>> sentence_ends = np.array([1, 4])
+        >>> speaker_breaks = np.array([1])
+        >>> WordSpeakerMapper._get_first_word_idx_of_sentence(4, sentence_ends, speaker_breaks, 50)
+        2
+        """
+        # 직전 문장 끝 다음 단어가 문장 시작
+        pos = np.searchsorted(sentence_ends, word_idx, side="left")
+        sentence_start = int(sentence_ends[pos - 1]) + 1 if pos > 0 else 0
+        # 현재 단어와 같은 화자가 이어지는 구간의 시작
+        pos = np.searchsorted(speaker_breaks, word_idx, side="left")
+        run_start = int(speaker_breaks[pos - 1]) + 1 if pos > 0 else 0
 
-        return left_idx if left_idx == 0 or audio_is_word_sentence_end(left_idx - 1) else -1
+        left_idx = max(sentence_start, run_start, word_idx - max(max_words, 0))
+        return left_idx if left_idx == sentence_start else -1
 
     @staticmethod
     def _get_last_word_idx_of_sentence(
-            word_idx: int, word_list: List[str], max_words: int
+            word_idx: int, sentence_ends: np.ndarray, num_words: int, max_words: int
     ) -> int:
         """
         Finds the last word index of a sentence for realignment.
@@ -402,39 +475,31 @@ class WordSpeakerMapper:
         ----------
         word_idx : int
             Current word index.
-        word_list : List[str]
-            List of words in the sentence.
+        sentence_ends : np.ndarray
+            Sorted indices of words that end a sentence.
+        num_words : int
+            Total number of words.
         max_words : int
             Maximum words to consider in the sentence.
 
         Returns
         -------
         int
-            The index of the last word of the sentence.
+            The index of the last word of the sentence, or -1 if the sentence end is
+            further than ``max_words`` words away.
 
         Examples
         --------
-        >>> words_list = ["Hello", "world", ".", "How", "are", "you", "?"]
-        >>> WordSpeakerMapper._get_last_word_idx_of_sentence(3, word_list, 50)
-        6
+        >>> sentence_ends = np.array([1, 4])
+        >>> WordSpeakerMapper._get_last_word_idx_of_sentence(2, sentence_ends, 5, 50)
+        4
         """
-        sentence_ending_punctuations = ".?!"
-        is_word_sentence_end = (
-            lambda x: x >= 0 and word_list[x][-1] in sentence_ending_punctuations
-        )
-        right_idx = word_idx
-        while (
-                right_idx < len(word_list) - 1
-                and right_idx - word_idx < max_words
-                and not audio_is_word_sentence_end(right_idx)
-        ):
-            right_idx += 1
+        # 현재 단어 이후 첫 문장 끝 (없으면 마지막 단어)
+        pos = np.searchsorted(sentence_ends, word_idx, side="left")
+        sentence_end = int(sentence_ends[pos]) if pos < len(sentence_ends) else num_words - 1
 
-        return (
-            right_idx
-            if right_idx == len(word_list) - 1 or audio_is_word_sentence_end(right_idx)
-            else -1
-        )
+        right_idx = min(sentence_end, word_idx + max(max_words, 0))
+        return right_idx if right_idx == sentence_end else -1
 
 
 class SentenceSpeakerMapper:
@@ -473,6 +538,10 @@ class SentenceSpeakerMapper:
             r'[해요해주세요해봐요합니다][\s]*$',  # 존댓말 종결
             r'[네예아니오맞습니다그렇습니다][\s]*$',  # 답변 표현
         ]
+        # 패턴들을 하나의 정규식으로 한 번만 컴파일 (단어마다 재컴파일/반복 검색 방지)
+        self._korean_sentence_re = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.korean_sentence_patterns)
+        )
         
     def audio_korean_sentence_check(self, text: str) -> bool:
         """
@@ -488,16 +557,13 @@ class SentenceSpeakerMapper:
         bool
             문장 경계 여부
         """
-        import re
-        
         # 기본 NLTK 검사
         if self.sentence_checker(text):
             return True
             
         # 한국어 패턴 검사
-        for pattern in self.korean_sentence_patterns:
-            if re.search(pattern, text.strip()):
-                return True
+        if self._korean_sentence_re.search(text.strip()):
+            return True
                 
         # 문장 길이 기반 검사 (너무 긴 문장 분할)
         if len(text.split()) > 30:  # 30단어 이상 시 분할 고려
@@ -505,6 +571,48 @@ class SentenceSpeakerMapper:
             
         return False
 
+    def audio_korean_sentence_check_tokens(
+            self,
+            tokens: Annotated[List[str], "Words already in the current sentence"],
+            word: Annotated[str, "Word to be appended"],
+            word_count: Annotated[int, "Whitespace-separated word count including the new word"],
+    ) -> bool:
+        """
+        ``audio_korean_sentence_check(" ".join(tokens) + " " + word)``와 같은 결과를
+        문장 전체 문자열을 만들지 않고 계산
+
+        이전 단어까지는 문장 경계가 없었으므로 NLTK 검사는 마지막 단어와 새 단어만,
+        한국어 패턴 검사는 문자열 끝만, 길이 검사는 누적 단어 수만 확인합니다.
+
+        Parameters
+        ----------
+        tokens : List[str]
+            현재 문장에 이미 포함된 단어 목록 (비어 있지 않음)
+        word : str
+            추가할 단어
+        word_count : int
+            새 단어를 포함한 공백 기준 단어 수
+
+        Returns
+        -------
+        bool
+            문장 경계 여부
+        """
+        # Punkt의 문장 경계 판정은 인접한 두 토큰에만 의존하므로 새로 생긴 경계만 검사
+        tail = tokens[-1] + " " + word
+        if self.sentence_checker(tail):
+            return True
+
+        # 패턴은 모두 문자열 끝에 고정되어 있으므로 공백을 제외한 끝부분만 검사
+        stripped_tail = tail.strip()
+        if not stripped_tail:
+            stripped_tail = " ".join(tokens).strip()
+        if self._korean_sentence_re.search(stripped_tail):
+            return True
+
+        # 문장 길이 기반 검사 (너무 긴 문장 분할)
+        return word_count > 30
+
     def audio_get_sentences_speaker_mapping(
             self,
             word_speaker_mapping: Annotated[List[Dict], "List of words with speaker labels"]
@@ -542,25 +650,32 @@ class SentenceSpeakerMapper:
             "speaker": f"Speaker {prev_spk}",
             "start_time": word_speaker_mapping[0]['start_time'],
             "end_time": word_speaker_mapping[0]['end_time'],
-            "text": word_speaker_mapping[0]['text'] + " ",
         }
+        # 문장 텍스트는 단어 목록으로 모았다가 문장이 끝날 때 한 번만 합침
+        tokens = [word_speaker_mapping[0]['text']]
+        word_count = len(tokens[0].split())
 
         for word_dict in word_speaker_mapping[1:]:
             word, spk = word_dict["text"], word_dict["speaker"]
             s, e = word_dict["start_time"], word_dict["end_time"]
-            if spk != prev_spk or self.audio_korean_sentence_check(snt["text"] + word):
+            new_word_count = word_count + len(word.split())
+            if spk != prev_spk or self.audio_korean_sentence_check_tokens(tokens, word, new_word_count):
+                snt["text"] = " ".join(tokens) + " "
                 snts.append(snt)
                 snt = {
                     "speaker": f"Speaker {spk}",
                     "start_time": s,
                     "end_time": e,
-                    "text": word + " ",
                 }
+                tokens = [word]
+                word_count = len(word.split())
             else:
                 snt["end_time"] = e
-                snt["text"] += word + " "
+                tokens.append(word)
+                word_count = new_word_count
             prev_spk = spk
 
+        snt["text"] = " ".join(tokens) + " "
         snts.append(snt)
         return snts
 
@@ -674,14 +789,47 @@ class Audio:
         if len(self.data) == 0:
             raise ValueError(f"Audio file is empty: {audio_path}")
 
+        # 이후 FFT/MFCC 계산은 모두 float32 기준 (이미 float32면 복사하지 않음)
+        self.data = self.data.astype(np.float32, copy=False)
+
         # Convert stereo or multichannel audio to mono
-        if len(self.data.shape) > 1 and self.data.shape[1] > 1:
-            self.data = np.mean(self.data, axis=1)
+        if self.data.ndim > 1 and self.data.shape[1] > 1:
+            mono = np.empty(self.data.shape[0], dtype=np.float32)
+            np.mean(self.data, axis=1, dtype=np.float32, out=mono)
+            self.data = mono
+        elif self.data.ndim > 1:
+            # (samples, 1) 형태는 복사 없이 1차원 view로 변환
+            self.data = self.data[:, 0]
 
         self.audio_path = audio_path
         self.extension = extension
         self.samples = len(self.data)
         self.duration = self.samples / self.rate
+        # 헤더 정보(비트 깊이, 채널 수)는 한 번만 읽어 audio_properties/audio_extract_properties에서 재사용
+        self._bit_depth, self._channels = self._read_format_info()
+
+    def _read_format_info(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Reads the bit depth and channel count from the audio file header.
+
+        Returns
+        -------
+        Tuple[int | None, int | None]
+            Bit depth (only for PCM WAV files) and number of channels. Values that cannot
+            be read are returned as None.
+        """
+        if self.extension == ".wav":
+            try:
+                with wave.open(self.audio_path, "rb") as wav_file:
+                    return wav_file.getsampwidth() * 8, wav_file.getnchannels()
+            except (wave.Error, EOFError, OSError) as e:
+                # float WAV 등 wave 모듈이 읽지 못하는 형식은 soundfile 정보 사용
+                print(f"⚠️ WAV 헤더 읽기 실패, soundfile 정보 사용: {e}")
+        try:
+            return None, sf.info(self.audio_path).channels
+        except Exception as e:
+            print(f"⚠️ 오디오 헤더 정보 읽기 실패: {e}")
+            return None, None
 
     def audio_properties(self) -> Tuple[
         str, str, str, int, float, float, Optional[int], int, float, float, Dict[str, float]]:
@@ -720,44 +868,40 @@ class Audio:
         """
         bands = [(20, 250), (250, 2000), (2000, 6000), (6000, 20000)]
 
-        x = fft(self.data)
-        xf = fftfreq(self.samples, 1 / self.rate)
+        # 실수 신호이므로 양의 주파수 절반만 계산 (rfft, 모든 코어 사용), 파워는 sqrt 없이 실수부/허수부 제곱합
+        x = rfft(self.data, workers=-1)
+        freqs = rfftfreq(self.samples, 1 / self.rate)
+        power = x.real * x.real + x.imag * x.imag
 
-        nonzero_indices = np.where(xf != 0)[0]
-        min_freq = np.min(np.abs(xf[nonzero_indices]))
-        max_freq = np.max(np.abs(xf))
+        # rfftfreq는 0부터 증가하는 주파수이므로 DC 다음 bin이 최소, 마지막 bin이 최대
+        min_freq = float(freqs[1]) if len(freqs) > 1 else 0.0
+        max_freq = float(freqs[-1])
 
-        bit_depth = None
-        if self.extension == ".wav":
-            with wave.open(file_path, "r", encoding="utf-8") as wav_file:
-                bit_depth = wav_file.getsampwidth() * 8
-                channels = wav_file.getnchannels()
-        else:
-            info = sf.info(self.audio_path)
-            channels = info.channels
+        bit_depth = self._bit_depth
+        channels = self._channels
 
         duration = float(self.duration)
         loudness = np.sqrt(np.mean(self.data ** 2))
 
-        s = np.abs(x)
-        freqs = xf
+        # 짝수 길이의 Nyquist 성분은 fft에서 음의 주파수로 분류되므로 대역 계산에서 제외
+        band_freqs = freqs[:-1] if self.samples % 2 == 0 else freqs
+        band_lo = np.searchsorted(band_freqs, [band[0] for band in bands], side="left")
+        band_hi = np.searchsorted(band_freqs, [band[1] for band in bands], side="right")
         eq_properties = {}
-        for band in bands:
-            band_mask = (freqs >= band[0]) & (freqs <= band[1])
-            band_data = s[band_mask]
-            band_energy = np.mean(band_data ** 2, axis=0) if band_data.size > 0 else 0
+        for band, lo, hi in zip(bands, band_lo, band_hi):
+            # 주파수가 정렬되어 있으므로 대역은 연속 구간 (마스크/임시 배열 없이 합산)
+            band_energy = power[lo:hi].sum(dtype=np.float64) / (hi - lo) if hi > lo else 0
             eq_properties[f"EQ_{band[0]}_{band[1]}_Hz"] = band_energy
 
-        zcr = np.sum(np.abs(np.diff(np.sign(self.data)))) / len(self.data)
+        zcr = _zero_crossing_rate(self.data)
 
-        magnitude_spectrum = np.abs(np.fft.rfft(self.data))
-        freqs_centroid = np.fft.rfftfreq(len(self.data), 1.0 / self.rate)
-        spectral_centroid = (np.sum(freqs_centroid * magnitude_spectrum) /
-                             np.sum(magnitude_spectrum)) if np.sum(magnitude_spectrum) != 0 else 0.0
+        # 위에서 계산한 스펙트럼 재사용
+        magnitude_spectrum = np.sqrt(power)
+        magnitude_sum = np.sum(magnitude_spectrum, dtype=np.float64)
+        spectral_centroid = (np.sum(freqs * magnitude_spectrum) /
+                             magnitude_sum) if magnitude_sum != 0 else 0.0
 
-        mfccs = mfcc(y=self.data, sr=self.rate, n_mfcc=13)
-
-        mfcc_mean = np.mean(mfccs, axis=1)
+        mfcc_mean = _mfcc_mean(self.data, self.rate, n_mfcc=13)
 
         eq_properties["RMSLoudness"] = float(loudness)
         eq_properties["ZeroCrossingRate"] = float(zcr)
@@ -804,15 +948,9 @@ class Audio:
             file_name = os.path.basename(self.audio_path)
             file_path = os.path.abspath(self.audio_path)
             
-            # Get bit depth and channels
-            bit_depth = None
-            if self.extension == ".wav":
-                with wave.open(file_path, "r", encoding="utf-8") as wav_file:
-                    bit_depth = wav_file.getsampwidth() * 8
-                    channels = wav_file.getnchannels()
-            else:
-                info = sf.info(self.audio_path)
-                channels = info.channels
+            # Get bit depth and channels (read once in __init__)
+            bit_depth = self._bit_depth
+            channels = self._channels
             
             return {
                 "file_name": file_name,
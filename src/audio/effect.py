@@ -111,10 +111,15 @@ class AdvancedDemucsVocalSeparator:
                 cache_info = self.cache_metadata[cache_key]
                 cache_path = self.cache_dir / cache_info["filename"]
                 
-                # 캐시 파일 존재 및 유효성 확인
-                if cache_path.exists():
+                # 캐시 파일 존재 및 유효성 확인 (stat 한 번으로 크기까지 확인)
+                try:
+                    cache_size = cache_path.stat().st_size
+                except OSError:
+                    cache_size = None
+                
+                if cache_size is not None:
                     # 파일 크기 확인
-                    if os.path.getsize(cache_path) > 0:
+                    if cache_size > 0:
                         return str(cache_path)
                     else:
                         # 빈 파일이면 캐시에서 제거
@@ -246,7 +251,12 @@ class AdvancedDemucsVocalSeparator:
             )
             vocal_file = os.path.join(output_path, f"{self.two_stems}.wav")
             
-            if os.path.exists(vocal_file) and os.path.getsize(vocal_file) > 0:
+            try:
+                vocal_size = os.stat(vocal_file).st_size
+            except OSError:
+                vocal_size = 0
+            
+            if vocal_size > 0:
                 print(f"✅ 보컬 분리 완료: {vocal_file}")
                 
                 # 캐시에 저장
@@ -76,12 +76,12 @@ class SilenceStats:
         >>> stat.silence_durations
         [5.0]  # 5 seconds of silence
         """
-        segments_sorted = sorted(segments, key=lambda x: x['start_time'])
-        durations = [
-            (segments_sorted[i + 1]['start_time'] - segments_sorted[i]['end_time']) / 1000.0  # Convert to seconds
-            for i in range(len(segments_sorted) - 1)
-            if (segments_sorted[i + 1]['start_time'] - segments_sorted[i]['end_time']) > 0
-        ]
+        n = len(segments)
+        starts = np.fromiter((segment['start_time'] for segment in segments), dtype=np.float64, count=n)
+        ends = np.fromiter((segment['end_time'] for segment in segments), dtype=np.float64, count=n)
+        order = np.argsort(starts, kind='stable')
+        gaps = starts[order][1:] - ends[order][:-1]
+        durations = (gaps[gaps > 0] / 1000.0).tolist()  # Convert to seconds
         return cls(durations)
 
     def audio_median(self) -> Annotated[float, "Median of silence durations"]:
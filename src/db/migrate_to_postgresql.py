@@ -25,8 +25,11 @@ from decimal import Decimal
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 import uuid
+from contextlib import closing
 from pathlib import Path
 
+from src.utils.locale_config import get_current_time
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -132,6 +135,10 @@ class DatabaseMigrator:
         
         return self.stats
 
+    def _open_sqlite_readonly(self) -> sqlite3.Connection:
+        """SQLite 읽기 전용 연결 (원본은 읽기만 하므로 저널 설정 쓰기 생략)"""
+        return sqlite3.connect(f"{Path(self.sqlite_path).resolve().as_uri()}?mode=ro", uri=True)
+
     async def _check_sqlite_connection(self):
         """SQLite 연결 및 구조 확인"""
         logger.info("📋 SQLite 데이터베이스 분석 중...")
@@ -139,13 +146,11 @@ class DatabaseMigrator:
         if not os.path.exists(self.sqlite_path):
             raise FileNotFoundError(f"SQLite 파일이 없습니다: {self.sqlite_path}")
         
-        conn = sqlite3.connect(self.sqlite_path)
-        cursor = conn.cursor()
-        
-        try:
+        with closing(self._open_sqlite_readonly()) as conn:
             # 테이블 목록 조회
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-            tables = [row[0] for row in cursor.fetchall()]
+            tables = [row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+            )]
             
             logger.info(f"✅ SQLite 테이블 발견: {len(tables)}개")
             
@@ -153,16 +158,12 @@ class DatabaseMigrator:
             total_records = 0
             for table in tables:
                 if table in self.table_mappings:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                    count = cursor.fetchone()[0]
+                    count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
                     total_records += count
                     logger.info(f"  📊 {table}: {count:,}개 레코드")
             
             self.stats.total_tables = len([t for t in tables if t in self.table_mappings])
             self.stats.total_records = total_records
-            
-        finally:
-            conn.close()
 
     async def _setup_postgresql(self) -> asyncpg.Pool:
         """PostgreSQL 연결 및 스키마 생성"""
@@ -200,10 +201,9 @@ class DatabaseMigrator:
         logger.info("📋 데이터 마이그레이션 시작...")
         
         # SQLite 연결
-        sqlite_conn = sqlite3.connect(self.sqlite_path)
-        sqlite_conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 반환
-        
-        try:
+        with closing(self._open_sqlite_readonly()) as sqlite_conn:
+            sqlite_conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 반환
+            
             # 마이그레이션 순서 (참조 무결성 고려)
             migration_order = [
                 # 1단계: 독립적인 테이블들
@@ -238,18 +238,13 @@ class DatabaseMigrator:
                     self.stats.completed_tables += 1
                 else:
                     logger.info(f"⏭️ 테이블 건너뛰기 (없음): {table_name}")
-                    
-        finally:
-            sqlite_conn.close()
 
     async def _table_exists_in_sqlite(self, sqlite_conn: sqlite3.Connection, table_name: str) -> bool:
         """SQLite에 테이블이 존재하는지 확인"""
-        cursor = sqlite_conn.cursor()
-        cursor.execute(
+        return sqlite_conn.execute(
             "SELECT name FROM sqlite_master WHERE type='table' AND name=?", 
             (table_name,)
-        )
-        return cursor.fetchone() is not None
+        ).fetchone() is not None
 
     async def _migrate_single_table(self, sqlite_conn: sqlite3.Connection, 
                                    pg_pool: asyncpg.Pool, table_name: str):
@@ -293,7 +288,7 @@ class DatabaseMigrator:
 
     async def _migrate_audio_files(self, pg_conn: asyncpg.Connection, rows: List[sqlite3.Row]):
         """audio_files 테이블 특별 처리"""
-        insert_sql = None"
+        insert_sql = """
         INSERT INTO audio_files (
             file_path, file_name, file_size, duration_seconds, 
             sample_rate, channels, format, upload_timestamp,
@@ -334,7 +329,7 @@ class DatabaseMigrator:
 
     async def _migrate_consultation_sessions(self, pg_conn: asyncpg.Connection, rows: List[sqlite3.Row]):
         """consultation_sessions 테이블 특별 처리"""
-        insert_sql = None"
+        insert_sql = """
         INSERT INTO consultation_sessions (
             audio_file_id, session_date, duration_minutes, agent_name,
             customer_id, consultation_type, overall_quality_score,
@@ -374,7 +369,7 @@ class DatabaseMigrator:
 
     async def _migrate_consultation_analysis(self, pg_conn: asyncpg.Connection, rows: List[sqlite3.Row]):
         """consultation_analysis 테이블 (호환성)"""
-        insert_sql = None"
+        insert_sql = """
         INSERT INTO consultation_analysis (
             consultation_id, audio_path, business_type, classification_type,
             detail_classification, consultation_result, summary, customer_request,
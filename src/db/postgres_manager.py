@@ -36,12 +36,17 @@ class DatabaseConfig:
     command_timeout: float = 60.0
     server_settings: Dict[str, str] = None
     
+    # 커밋 시 WAL flush 대기 여부 ('off'면 커밋마다 fsync를 기다리지 않음, 충돌 시 최근 커밋만 유실)
+    synchronous_commit: Optional[str] = None
+    
     def __post_init__(self):
         if self.server_settings is None:
             self.server_settings = {
                 'application_name': 'callytics-service',
                 'timezone': 'Asia/Seoul'
             }
+        if self.synchronous_commit:
+            self.server_settings.setdefault('synchronous_commit', self.synchronous_commit)
 
 class PostgreSQLManager:
     """PostgreSQL 연결 풀링 매니저"""
@@ -80,7 +85,8 @@ class PostgreSQLManager:
             password=os.getenv("POSTGRES_PASSWORD", ""),
             min_connections=int(os.getenv("POSTGRES_MIN_CONNECTIONS", "5")),
             max_connections=int(os.getenv("POSTGRES_MAX_CONNECTIONS", "20")),
-            command_timeout=float(os.getenv("POSTGRES_COMMAND_TIMEOUT", "60.0"))
+            command_timeout=float(os.getenv("POSTGRES_COMMAND_TIMEOUT", "60.0")),
+            synchronous_commit=os.getenv("POSTGRES_SYNCHRONOUS_COMMIT") or None
         )
     
     async def initialize(self) -> None:
@@ -344,15 +344,15 @@ async def get_metrics() -> SuccessResponse:
         
         # 서비스별 메트릭 수집
         service_metrics = {}
-        for service_name in SERVICE_URLS.keys():
-            try:
-                url = f"{SERVICE_URLS[service_name]}/metrics"
-                async with httpx.AsyncClient(timeout=10.0) as client:
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            for service_name in SERVICE_URLS.keys():
+                try:
+                    url = f"{SERVICE_URLS[service_name]}/metrics"
                     response = await client.get(url)
                     if response.status_code == 200:
                         service_metrics[service_name] = response.json()
-            except:
-                service_metrics[service_name] = {"status": "unavailable"}
+                except:
+                    service_metrics[service_name] = {"status": "unavailable"}
         
         return SuccessResponse(
             status="success",
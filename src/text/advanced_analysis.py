@@ -10,25 +10,228 @@ from pathlib import Path
 import re
 from dataclasses import dataclass
 from collections import defaultdict
+from functools import lru_cache
 import logging
 
 # Related third-party imports
+import numpy as np
 import torch
 # import openai  # 필요시 주석 해제
 # from openai import OpenAI  # 필요시 주석 해제
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Local imports
 from src.text.model import LanguageModelManager
 from src.text.korean_models import KoreanModels
 
 logger = logging.getLogger(__name__)
 
+# 문장 수 추정용 종결 부호 패턴 (호출마다 파싱하지 않도록 미리 컴파일)
+SENTENCE_END_RE = re.compile(r'[.!?]')
+
+# 감성 분석용 한글 단어 토큰 패턴
+HANGUL_WORD_RE = re.compile(r'[가-힣]+')
+
+# 가로채기 판단용 패턴 (카테고리별 후보를 하나의 교대 패턴으로 묶어 한 번에 검사)
+INCOMPLETE_ENDINGS = ('...', '..', '.', '?', '!', '~', '-')
+IMMEDIATE_RESPONSES = ('네', '아', '그렇군요', '그렇구나', '알겠습니다', '네, 알겠습니다')
+INCOMPLETE_ENDING_RE = re.compile('(?:' + '|'.join(map(re.escape, INCOMPLETE_ENDINGS)) + r')\Z')
+IMMEDIATE_RESPONSE_RE = re.compile('|'.join(map(re.escape, IMMEDIATE_RESPONSES)))
+
+# 화자 역할 코드 (비트 플래그, 고객/상담사 키워드가 모두 포함되면 두 비트 모두 설정)
+SPEAKER_ROLE_CUSTOMER = 1
+SPEAKER_ROLE_COUNSELOR = 2
+CUSTOMER_SPEAKER_KEYWORDS = ('고객', 'customer', 'client', 'user')
+COUNSELOR_SPEAKER_KEYWORDS = ('상담사', 'counselor', 'agent', 'csr', 'staff')
+CUSTOMER_SPEAKER_RE = re.compile('|'.join(CUSTOMER_SPEAKER_KEYWORDS))
+COUNSELOR_SPEAKER_RE = re.compile('|'.join(COUNSELOR_SPEAKER_KEYWORDS))
+# 'Speaker 1', 'CSR' 같은 ASCII 화자명에는 한글 키워드가 나올 수 없으므로 ASCII 키워드만 검사
+CUSTOMER_SPEAKER_ASCII_RE = re.compile('|'.join(k for k in CUSTOMER_SPEAKER_KEYWORDS if k.isascii()))
+COUNSELOR_SPEAKER_ASCII_RE = re.compile('|'.join(k for k in COUNSELOR_SPEAKER_KEYWORDS if k.isascii()))
+# 화자명이 키워드 그 자체('고객', 'agent' 등)인 흔한 경우는 집합 조회로 바로 판정
+CUSTOMER_SPEAKER_LABELS = frozenset(CUSTOMER_SPEAKER_KEYWORDS)
+COUNSELOR_SPEAKER_LABELS = frozenset(COUNSELOR_SPEAKER_KEYWORDS)
+
+@lru_cache(maxsize=256)
+def _classify_speaker_role(speaker: str) -> int:
+    """화자 이름을 역할 코드로 변환 (화자명 종류가 적어 소문자 변환과 판정 결과를 캐시)"""
+    speaker = speaker.lower()
+    label = speaker.strip()
+    if label in CUSTOMER_SPEAKER_LABELS:
+        return SPEAKER_ROLE_CUSTOMER
+    if label in COUNSELOR_SPEAKER_LABELS:
+        return SPEAKER_ROLE_COUNSELOR
+    if speaker.isascii():
+        customer_re, counselor_re = CUSTOMER_SPEAKER_ASCII_RE, COUNSELOR_SPEAKER_ASCII_RE
+    else:
+        customer_re, counselor_re = CUSTOMER_SPEAKER_RE, COUNSELOR_SPEAKER_RE
+    role = 0
+    if customer_re.search(speaker):
+        role |= SPEAKER_ROLE_CUSTOMER
+    if counselor_re.search(speaker):
+        role |= SPEAKER_ROLE_COUNSELOR
+    return role
+
+# 이 발화 수를 넘는 대화에서만 JIT 커널 사용 (작은 입력은 NumPy 마스크가 더 빠름)
+NUMBA_MIN_UTTERANCES = 1000
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scan_interruption_pairs_jit(roles, has_start, start, end, untimed):
+        count = 0
+        untimed_count = 0
+        for i in range(roles.shape[0] - 1):
+            if roles[i] & SPEAKER_ROLE_CUSTOMER and roles[i + 1] & SPEAKER_ROLE_COUNSELOR:
+                if has_start[i] and has_start[i + 1]:
+                    if start[i + 1] < end[i]:
+                        count += 1
+                else:
+                    untimed[untimed_count] = i
+                    untimed_count += 1
+        return count, untimed_count
+
+def _scan_interruption_pairs(roles: np.ndarray, has_start: np.ndarray, start: np.ndarray,
+                             end: np.ndarray) -> Tuple[int, np.ndarray]:
+    """고객→상담사 연속 발화 쌍 검사
+
+    타임스탬프 겹침으로 판정한 가로채기 수와, 타임스탬프가 없어
+    텍스트 패턴으로 판단해야 하는 쌍의 인덱스를 반환합니다.
+    """
+    if NUMBA_AVAILABLE and roles.shape[0] > NUMBA_MIN_UTTERANCES:
+        untimed = np.empty(roles.shape[0] - 1, dtype=np.int64)
+        count, untimed_count = _scan_interruption_pairs_jit(roles, has_start, start, end, untimed)
+        return int(count), untimed[:untimed_count]
+    
+    candidate = (roles[:-1] & SPEAKER_ROLE_CUSTOMER).astype(bool) & (roles[1:] & SPEAKER_ROLE_COUNSELOR).astype(bool)
+    timed = candidate & has_start[:-1] & has_start[1:]
+    count = int(np.count_nonzero(timed & (start[1:] < end[:-1])))
+    return count, np.flatnonzero(candidate & ~timed)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scan_response_latencies_jit(roles, has_start, start, end):
+        latency_sum = 0.0
+        latency_count = 0
+        untimed_count = 0
+        for i in range(roles.shape[0] - 1):
+            if roles[i] & SPEAKER_ROLE_CUSTOMER and roles[i + 1] & SPEAKER_ROLE_COUNSELOR:
+                if has_start[i] and has_start[i + 1]:
+                    latency = start[i + 1] - end[i]
+                    if latency > 0:
+                        latency_sum += latency
+                        latency_count += 1
+                else:
+                    untimed_count += 1
+        return latency_sum, latency_count, untimed_count
+
+def _scan_response_latencies(roles: np.ndarray, has_start: np.ndarray, start: np.ndarray,
+                             end: np.ndarray) -> Tuple[float, int, int]:
+    """고객→상담사 연속 발화 쌍의 응답 지연 집계
+
+    양수 지연 시간의 합과 개수, 타임스탬프가 없어 기본값을 써야 하는 쌍의 수를 반환합니다.
+    """
+    if NUMBA_AVAILABLE and roles.shape[0] > NUMBA_MIN_UTTERANCES:
+        latency_sum, latency_count, untimed_count = _scan_response_latencies_jit(roles, has_start, start, end)
+        return float(latency_sum), int(latency_count), int(untimed_count)
+    
+    pairs = (roles[:-1] & SPEAKER_ROLE_CUSTOMER).astype(bool) & (roles[1:] & SPEAKER_ROLE_COUNSELOR).astype(bool)
+    timed = pairs & has_start[:-1] & has_start[1:]
+    latencies = start[1:][timed] - end[:-1][timed]
+    latencies = latencies[latencies > 0]  # 양수인 경우만
+    untimed_count = int(np.count_nonzero(pairs)) - int(np.count_nonzero(timed))
+    return float(latencies.sum()), int(latencies.size), untimed_count
+
+def _round_metric(value: float) -> float:
+    """지표 값을 소수점 셋째 자리로 반올림 (정수 스케일링, .5는 0에서 먼 쪽으로)"""
+    return int(value * 1000 + (0.5 if value >= 0 else -0.5)) / 1000
+
+@dataclass
+class UtteranceArrays:
+    """발화 목록에서 한 번에 추출한 지표 계산용 배열
+
+    end는 end_time이 없으면 start_time(둘 다 없으면 0.0)으로 채웁니다.
+    """
+    roles: np.ndarray
+    has_start: np.ndarray
+    has_end: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+
+def _extract_utterance_arrays(utterances_data: List[Dict[str, Any]]) -> UtteranceArrays:
+    """화자 역할과 타임스탬프를 발화 목록 한 번의 순회로 추출"""
+    roles = []
+    has_start = []
+    has_end = []
+    start = []
+    end = []
+    for utterance in utterances_data:
+        roles.append(_classify_speaker_role(utterance.get('speaker', '')))
+        start_time = utterance.get('start_time', 0.0)
+        has_start.append('start_time' in utterance)
+        has_end.append('end_time' in utterance)
+        start.append(start_time)
+        end.append(utterance.get('end_time', start_time))
+    return UtteranceArrays(
+        roles=np.array(roles, dtype=np.int8),
+        has_start=np.array(has_start, dtype=bool),
+        has_end=np.array(has_end, dtype=bool),
+        start=np.array(start, dtype=np.float64),
+        end=np.array(end, dtype=np.float64)
+    )
+
 @dataclass
 class QualityScore:
     score: float
     details: Dict[str, any]
     examples: List[str]
 
+class KeywordCounter:
+    """여러 리터럴 키워드의 등장 횟수를 텍스트 한 번의 스캔으로 계산
+
+    키워드별 횟수는 str.count와 같이 겹치지 않는 등장 횟수입니다.
+    pyahocorasick이 없으면 키워드마다 str.count를 사용합니다.
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self._automaton = None
+        if AHOCORASICK_AVAILABLE and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, (keyword, len(keyword)))
+            self._automaton.make_automaton()
+    
+    def count(self, text: str) -> Dict[str, int]:
+        """키워드별 등장 횟수 반환"""
+        if self._automaton is None:
+            return {keyword: text.count(keyword) for keyword in self.keywords}
+        
+        counts = dict.fromkeys(self.keywords, 0)
+        last_end = {}
+        for end_index, (keyword, length) in self._automaton.iter(text):
+            # 같은 키워드의 이전 매치와 겹치면 건너뜀 (str.count와 동일)
+            if end_index - length >= last_end.get(keyword, -1):
+                counts[keyword] += 1
+                last_end[keyword] = end_index
+        return counts
+
 class KoreanPunctuationAnalyzer:
     """한국어 문장 부호 사용 규칙 분석기"""
     
@@ -63,6 +266,15 @@ class KoreanPunctuationAnalyzer:
                 'score_weight': 0.25
             }
         }
+        
+        # 규칙별 정규식은 한 번만 컴파일
+        for rules in self.punctuation_rules.values():
+            if 'correct_patterns' in rules:
+                rules['correct_patterns'] = [re.compile(p) for p in rules['correct_patterns']]
+                rules['incorrect_patterns'] = [re.compile(p) for p in rules['incorrect_patterns']]
+            else:
+                rules['correct_regexes'] = [re.compile(re.escape(c)) for c in rules['correct']]
+                rules['incorrect_regexes'] = [(i, re.compile(re.escape(i))) for i in rules['incorrect']]
     
     def text_analyze_punctuation(self, text: str) -> QualityScore:
         """문장 부호 사용 규칙 분석"""
@@ -102,13 +314,11 @@ class KoreanPunctuationAnalyzer:
         incorrect_count = 0
         examples = []
         
-        for correct in rules['correct']:
-            pattern = re.escape(correct)
-            correct_count += len(re.findall(pattern, text))
+        for pattern in rules['correct_regexes']:
+            correct_count += len(pattern.findall(text))
         
-        for incorrect in rules['incorrect']:
-            pattern = re.escape(incorrect)
-            matches = re.findall(pattern, text)
+        for incorrect, pattern in rules['incorrect_regexes']:
+            matches = pattern.findall(text)
             incorrect_count += len(matches)
             if matches:
                 examples.append(f"잘못된 사용: {incorrect}")
@@ -125,11 +335,11 @@ class KoreanPunctuationAnalyzer:
         examples = []
         
         for pattern in rules['correct_patterns']:
-            matches = re.findall(pattern, text)
+            matches = pattern.findall(text)
             correct_count += len(matches)
         
         for pattern in rules['incorrect_patterns']:
-            matches = re.findall(pattern, text)
+            matches = pattern.findall(text)
             incorrect_count += len(matches)
             if matches:
                 examples.append(f"잘못된 쉼표 사용: {matches[:3]}")
@@ -209,15 +419,8 @@ class KNUSentimentAnalyzer:
     
     def text_analyze_sentiment(self, text: str) -> QualityScore:
         """KNU 감성사전 기반 감성 분석"""
-        positive_count = 0
-        negative_count = 0
-        positive_words_found = []
-        negative_words_found = []
-        positive_intensity = 0
-        negative_intensity = 0
-        
-        # 텍스트를 단어로 분리
-        words = re.findall(r'[가-힣]+', text)
+        # 텍스트를 단어로 분리 (텍스트당 정규식 한 번)
+        words = HANGUL_WORD_RE.findall(text)
         total_words = len(words)
         
         if total_words == 0:
@@ -228,16 +431,13 @@ class KNUSentimentAnalyzer:
             )
         
         # 긍정/부정 단어 카운트
-        for word in words:
-            if word in self.positive_words:
-                positive_count += 1
-                positive_words_found.append(word)
-                positive_intensity += self.emotion_intensity.get(word, 1)
-            
-            if word in self.negative_words:
-                negative_count += 1
-                negative_words_found.append(word)
-                negative_intensity += self.emotion_intensity.get(word, 1)
+        positive_words_found = [word for word in words if word in self.positive_words]
+        negative_words_found = [word for word in words if word in self.negative_words]
+        positive_count = len(positive_words_found)
+        negative_count = len(negative_words_found)
+        intensity = self.emotion_intensity.get
+        positive_intensity = sum(intensity(word, 1) for word in positive_words_found)
+        negative_intensity = sum(intensity(word, 1) for word in negative_words_found)
         
         # 비율 계산
         positive_ratio = positive_count / total_words
@@ -367,6 +567,125 @@ class CommunicationQualityAnalyzer:
             ]
         }
         
+        # 완곡 표현 패턴
+        self.euphonious_patterns = {
+            'soft_requests': [
+                '혹시', '혹시나', '혹시라도', '혹시나마',
+                '혹시 가능하시다면', '혹시 괜찮으시다면',
+                '혹시 시간이 되시면', '혹시 여유가 되시면'
+            ],
+            'gentle_suggestions': [
+                '아마도', '아마', '아마도 그럴 것 같습니다',
+                '아마도 그런 것 같습니다', '아마도 그럴 것 같아요',
+                '아마도 그런 것 같아요', '아마도 그럴 것 같고요'
+            ],
+            'polite_qualifiers': [
+                '조금', '약간', '살짝', '아주 조금',
+                '조금씩', '조금씩씩', '조금씩씩씩',
+                '약간씩', '살짝씩', '아주 조금씩'
+            ],
+            'soft_negations': [
+                '그렇지 않을 수도 있습니다', '그렇지 않을 수도 있어요',
+                '그렇지 않을 수도 있고요', '그렇지 않을 수도 있겠고요',
+                '그렇지 않을 수도 있겠습니다', '그렇지 않을 수도 있겠어요'
+            ],
+            'gentle_acknowledgments': [
+                '아, 그렇군요', '아, 그렇구나', '아, 그렇구먼',
+                '아, 그렇군', '아, 그렇구나요', '아, 그렇구먼요',
+                '아, 그렇군요', '아, 그렇구나', '아, 그렇구먼'
+            ],
+            'soft_transitions': [
+                '그런데요', '그런데 말씀드리면', '그런데 말씀드리자면',
+                '그런데 말씀드리면요', '그런데 말씀드리자면요',
+                '그런데 말씀드리면 말씀드리면', '그런데 말씀드리자면 말씀드리자면'
+            ],
+            'gentle_explanations': [
+                '말씀드리자면', '말씀드리면', '말씀드리자면요',
+                '말씀드리면요', '말씀드리자면 말씀드리자면',
+                '말씀드리면 말씀드리면', '말씀드리자면 말씀드리자면요'
+            ],
+            'soft_confirmations': [
+                '그런 것 같습니다', '그런 것 같아요', '그런 것 같고요',
+                '그런 것 같겠습니다', '그런 것 같겠어요', '그런 것 같겠고요',
+                '그런 것 같습니다만', '그런 것 같아요만', '그런 것 같고요만'
+            ]
+        }
+        
+        # 사과 표현 패턴 (통신사 상담사 수준의 구체적 표현들)
+        self.apology_patterns = {
+            'direct_apologies': [
+                '죄송합니다', '죄송해요', '죄송하네요', '죄송하구요',
+                '죄송하겠습니다', '죄송하겠어요', '죄송하겠네요',
+                '미안합니다', '미안해요', '미안하네요', '미안하구요',
+                '사과드립니다', '사과드려요', '사과드리네요', '사과드리구요',
+                '양해부탁드립니다', '양해부탁드려요', '양해부탁드리네요'
+            ],
+            'polite_apologies': [
+                '정말 죄송합니다', '정말 죄송해요', '정말 죄송하네요',
+                '대단히 죄송합니다', '대단히 죄송해요', '대단히 죄송하네요',
+                '매우 죄송합니다', '매우 죄송해요', '매우 죄송하네요',
+                '깊이 사과드립니다', '깊이 사과드려요', '깊이 사과드리네요',
+                '진심으로 사과드립니다', '진심으로 사과드려요', '진심으로 사과드리네요'
+            ],
+            'service_apologies': [
+                '서비스 이용에 불편을 드려 죄송합니다',
+                '서비스 이용에 불편을 드려 죄송해요',
+                '서비스 이용에 불편을 드려 죄송하네요',
+                '고객님께 불편을 드려 죄송합니다',
+                '고객님께 불편을 드려 죄송해요',
+                '고객님께 불편을 드려 죄송하네요',
+                '불편을 드려 죄송합니다', '불편을 드려 죄송해요', '불편을 드려 죄송하네요',
+                '번거로움을 드려 죄송합니다', '번거로움을 드려 죄송해요', '번거로움을 드려 죄송하네요'
+            ],
+            'delay_apologies': [
+                '지연을 드려 죄송합니다', '지연을 드려 죄송해요', '지연을 드려 죄송하네요',
+                '기다리게 해서 죄송합니다', '기다리게 해서 죄송해요', '기다리게 해서 죄송하네요',
+                '시간이 걸려서 죄송합니다', '시간이 걸려서 죄송해요', '시간이 걸려서 죄송하네요',
+                '오래 기다리게 해서 죄송합니다', '오래 기다리게 해서 죄송해요', '오래 기다리게 해서 죄송하네요'
+            ],
+            'error_apologies': [
+                '오류가 발생해서 죄송합니다', '오류가 발생해서 죄송해요', '오류가 발생해서 죄송하네요',
+                '문제가 생겨서 죄송합니다', '문제가 생겨서 죄송해요', '문제가 생겨서 죄송하네요',
+                '장애가 발생해서 죄송합니다', '장애가 발생해서 죄송해요', '장애가 발생해서 죄송하네요',
+                '시스템 오류로 죄송합니다', '시스템 오류로 죄송해요', '시스템 오류로 죄송하네요'
+            ],
+            'inconvenience_apologies': [
+                '불편을 드려 죄송합니다', '불편을 드려 죄송해요', '불편을 드려 죄송하네요',
+                '번거로움을 드려 죄송합니다', '번거로움을 드려 죄송해요', '번거로움을 드려 죄송하네요',
+                '폐를 끼쳐 죄송합니다', '폐를 끼쳐 죄송해요', '폐를 끼쳐 죄송하네요',
+                '신경 쓰이게 해서 죄송합니다', '신경 쓰이게 해서 죄송해요', '신경 쓰이게 해서 죄송하네요'
+            ],
+            'understanding_apologies': [
+                '이해해 주셔서 감사합니다', '이해해 주셔서 감사해요', '이해해 주셔서 감사하네요',
+                '양해해 주셔서 감사합니다', '양해해 주셔서 감사해요', '양해해 주셔서 감사하네요',
+                '참아 주셔서 감사합니다', '참아 주셔서 감사해요', '참아 주셔서 감사하네요',
+                '기다려 주셔서 감사합니다', '기다려 주셔서 감사해요', '기다려 주셔서 감사하네요'
+            ]
+        }
+        
+        # 정규식 패턴은 생성 시 한 번만 컴파일
+        self.polite_patterns['formal_endings'] = [
+            re.compile(p) for p in self.polite_patterns['formal_endings']
+        ]
+        self.specific_info_patterns['numbers'] = [
+            re.compile(p) for p in self.specific_info_patterns['numbers']
+        ]
+        
+        # 리터럴 키워드는 하나의 카운터로 모아 텍스트당 한 번만 스캔
+        keyword_groups = [
+            self.polite_patterns['honorific_verbs'],
+            self.polite_patterns['honorific_nouns'],
+            self.polite_patterns['polite_expressions'],
+            *self.negative_patterns.values(),
+            *self.empathy_patterns.values(),
+            *self.expertise_patterns.values(),
+            *self.euphonious_patterns.values(),
+            *self.apology_patterns.values(),
+        ]
+        self.keyword_counter = KeywordCounter(
+            keyword for group in keyword_groups for keyword in group
+        )
+        
         # 문장 부호 분석기 초기화
         self.punctuation_analyzer = KoreanPunctuationAnalyzer()
     
@@ -374,26 +693,29 @@ class CommunicationQualityAnalyzer:
         """통신사 상담사 수준의 의사소통 품질 종합 분석"""
         results = {}
         
+        # 키워드 등장 횟수는 한 번만 계산해 각 분석에서 공유
+        keyword_counts = self.keyword_counter.count(text)
+        
         # 1. 존댓말 사용 분석
-        results['politeness'] = self._analyze_politeness(text)
+        results['politeness'] = self._analyze_politeness(text, keyword_counts)
         
         # 2. 부정적 표현 분석 (KNU 감성 분석과 연동)
-        results['negative_expression'] = self._analyze_negative_expressions(text)
+        results['negative_expression'] = self._analyze_negative_expressions(text, keyword_counts)
         
         # 3. 공감 표현 분석
-        results['empathy'] = self._analyze_empathy(text)
+        results['empathy'] = self._analyze_empathy(text, keyword_counts)
         
         # 4. 전문성 분석
-        results['expertise'] = self._analyze_expertise(text)
+        results['expertise'] = self._analyze_expertise(text, keyword_counts)
         
         # 5. 구체적 정보 제공 분석
         results['specific_info'] = self._analyze_specific_info(text)
         
         # 6. 완곡하고 부드러운 표현 분석 (euphonious_word_ratio)
-        results['euphonious_expressions'] = self._analyze_euphonious_expressions(text)
+        results['euphonious_expressions'] = self._analyze_euphonious_expressions(text, keyword_counts)
         
         # 7. 사과 표현 분석 (apology_ratio)
-        results['apology_expressions'] = self._analyze_apology_expressions(text)
+        results['apology_expressions'] = self._analyze_apology_expressions(text, keyword_counts)
         
         # 8. 문장 부호 사용 분석
         results['punctuation'] = self.punctuation_analyzer.text_analyze_punctuation(text)
@@ -403,7 +725,7 @@ class CommunicationQualityAnalyzer:
         
         return results
     
-    def _analyze_politeness(self, text: str) -> QualityScore:
+    def _analyze_politeness(self, text: str, keyword_counts: Dict[str, int]) -> QualityScore:
         """존댓말 사용 분석"""
         total_score = 0
         total_weight = 0
@@ -413,25 +735,25 @@ class CommunicationQualityAnalyzer:
         # 공식 종결어미 사용
         formal_count = 0
         for pattern in self.polite_patterns['formal_endings']:
-            formal_count += len(re.findall(pattern, text))
+            formal_count += len(pattern.findall(text))
         
         # 경어 동사 사용
         honorific_verb_count = 0
         for verb in self.polite_patterns['honorific_verbs']:
-            honorific_verb_count += text.count(verb)
+            honorific_verb_count += keyword_counts[verb]
         
         # 경어 명사 사용
         honorific_noun_count = 0
         for noun in self.polite_patterns['honorific_nouns']:
-            honorific_noun_count += text.count(noun)
+            honorific_noun_count += keyword_counts[noun]
         
         # 공손한 표현 사용
         polite_expression_count = 0
         for expression in self.polite_patterns['polite_expressions']:
-            polite_expression_count += text.count(expression)
+            polite_expression_count += keyword_counts[expression]
         
         # 전체 문장 수 추정 (마침표 기준)
-        total_sentences = len(re.findall(r'[.!?]', text)) + 1
+        total_sentences = len(SENTENCE_END_RE.findall(text)) + 1
         
         # 점수 계산
         formal_score = min(formal_count / total_sentences * 2, 1.0) if total_sentences > 0 else 0
@@ -456,7 +778,7 @@ class CommunicationQualityAnalyzer:
         
         return QualityScore(score=final_score, details=details, examples=examples)
     
-    def _analyze_negative_expressions(self, text: str) -> QualityScore:
+    def _analyze_negative_expressions(self, text: str, keyword_counts: Dict[str, int]) -> QualityScore:
         """부정적 표현 분석 (KNU 감성 분석과 연동)"""
         # KNU 감성 분석 결과 활용
         knu_result = self.knu_analyzer.text_analyze_sentiment(text)
@@ -469,21 +791,21 @@ class CommunicationQualityAnalyzer:
         
         # 직접적 부정 표현
         for expression in self.negative_patterns['direct_negative']:
-            count = text.count(expression)
+            count = keyword_counts[expression]
             pattern_negative_count += count
             if count > 0:
                 examples.append(f"직접적 부정: {expression}")
         
         # 부정적 단어
         for word in self.negative_patterns['negative_words']:
-            count = text.count(word)
+            count = keyword_counts[word]
             pattern_negative_count += count * 0.5  # 가중치 적용
             if count > 0:
                 examples.append(f"부정적 단어: {word}")
         
         # 부정적 감정 표현
         for emotion in self.negative_patterns['negative_emotions']:
-            count = text.count(emotion)
+            count = keyword_counts[emotion]
             pattern_negative_count += count * 0.3
             if count > 0:
                 examples.append(f"부정적 감정: {emotion}")
@@ -519,34 +841,34 @@ class CommunicationQualityAnalyzer:
         
         return QualityScore(score=score, details=details, examples=examples)
     
-    def _analyze_empathy(self, text: str) -> QualityScore:
+    def _analyze_empathy(self, text: str, keyword_counts: Dict[str, int]) -> QualityScore:
         """공감 표현 분석"""
         empathy_count = 0
         examples = []
         
         # 이해 표현
         for expression in self.empathy_patterns['understanding']:
-            count = text.count(expression)
+            count = keyword_counts[expression]
             empathy_count += count
             if count > 0:
                 examples.append(f"이해 표현: {expression}")
         
         # 감정적 지지
         for expression in self.empathy_patterns['emotional_support']:
-            count = text.count(expression)
+            count = keyword_counts[expression]
             empathy_count += count * 1.5  # 더 높은 가중치
             if count > 0:
                 examples.append(f"감정적 지지: {expression}")
         
         # 긍정적 강화
         for expression in self.empathy_patterns['positive_reinforcement']:
-            count = text.count(expression)
+            count = keyword_counts[expression]
             empathy_count += count
             if count > 0:
                 examples.append(f"긍정적 강화: {expression}")
         
         # 점수 계산
-        total_sentences = len(re.findall(r'[.!?]', text)) + 1
+        total_sentences = len(SENTENCE_END_RE.findall(text)) + 1
         empathy_ratio = empathy_count / total_sentences if total_sentences > 0 else 0
         score = min(empathy_ratio * 2, 1.0)  # 적절한 공감 표현 비율
         
@@ -558,28 +880,28 @@ class CommunicationQualityAnalyzer:
         
         return QualityScore(score=score, details=details, examples=examples)
     
-    def _analyze_expertise(self, text: str) -> QualityScore:
+    def _analyze_expertise(self, text: str, keyword_counts: Dict[str, int]) -> QualityScore:
         """전문성 분석"""
         expertise_count = 0
         examples = []
         
         # 전문 용어 사용
         for term in self.expertise_patterns['technical_terms']:
-            count = text.count(term)
+            count = keyword_counts[term]
             expertise_count += count
             if count > 0:
                 examples.append(f"전문 용어: {term}")
         
         # 정확한 설명
         for expression in self.expertise_patterns['precise_explanations']:
-            count = text.count(expression)
+            count = keyword_counts[expression]
             expertise_count += count * 1.2
             if count > 0:
                 examples.append(f"정확한 설명: {expression}")
         
         # 해결책 제시
         for expression in self.expertise_patterns['solution_oriented']:
-            count = text.count(expression)
+            count = keyword_counts[expression]
             expertise_count += count * 1.5
             if count > 0:
                 examples.append(f"해결책 제시: {expression}")
@@ -604,7 +926,7 @@ class CommunicationQualityAnalyzer:
         
         # 숫자 정보
         for pattern in self.specific_info_patterns['numbers']:
-            matches = re.findall(pattern, text)
+            matches = pattern.findall(text)
             specific_count += len(matches)
             if matches:
                 examples.append(f"숫자 정보: {matches[:3]}")
@@ -636,60 +958,17 @@ class CommunicationQualityAnalyzer:
         
         return QualityScore(score=score, details=details, examples=examples)
 
-    def _analyze_euphonious_expressions(self, text: str) -> QualityScore:
+    def _analyze_euphonious_expressions(self, text: str, keyword_counts: Dict[str, int]) -> QualityScore:
         """완곡하고 부드러운 표현 분석 (euphonious_word_ratio)"""
         euphonious_count = 0
         examples = []
         
-        # 완곡 표현 패턴
-        euphonious_patterns = {
-            'soft_requests': [
-                '혹시', '혹시나', '혹시라도', '혹시나마',
-                '혹시 가능하시다면', '혹시 괜찮으시다면',
-                '혹시 시간이 되시면', '혹시 여유가 되시면'
-            ],
-            'gentle_suggestions': [
-                '아마도', '아마', '아마도 그럴 것 같습니다',
-                '아마도 그런 것 같습니다', '아마도 그럴 것 같아요',
-                '아마도 그런 것 같아요', '아마도 그럴 것 같고요'
-            ],
-            'polite_qualifiers': [
-                '조금', '약간', '살짝', '아주 조금',
-                '조금씩', '조금씩씩', '조금씩씩씩',
-                '약간씩', '살짝씩', '아주 조금씩'
-            ],
-            'soft_negations': [
-                '그렇지 않을 수도 있습니다', '그렇지 않을 수도 있어요',
-                '그렇지 않을 수도 있고요', '그렇지 않을 수도 있겠고요',
-                '그렇지 않을 수도 있겠습니다', '그렇지 않을 수도 있겠어요'
-            ],
-            'gentle_acknowledgments': [
-                '아, 그렇군요', '아, 그렇구나', '아, 그렇구먼',
-                '아, 그렇군', '아, 그렇구나요', '아, 그렇구먼요',
-                '아, 그렇군요', '아, 그렇구나', '아, 그렇구먼'
-            ],
-            'soft_transitions': [
-                '그런데요', '그런데 말씀드리면', '그런데 말씀드리자면',
-                '그런데 말씀드리면요', '그런데 말씀드리자면요',
-                '그런데 말씀드리면 말씀드리면', '그런데 말씀드리자면 말씀드리자면'
-            ],
-            'gentle_explanations': [
-                '말씀드리자면', '말씀드리면', '말씀드리자면요',
-                '말씀드리면요', '말씀드리자면 말씀드리자면',
-                '말씀드리면 말씀드리면', '말씀드리자면 말씀드리자면요'
-            ],
-            'soft_confirmations': [
-                '그런 것 같습니다', '그런 것 같아요', '그런 것 같고요',
-                '그런 것 같겠습니다', '그런 것 같겠어요', '그런 것 같겠고요',
-                '그런 것 같습니다만', '그런 것 같아요만', '그런 것 같고요만'
-            ]
-        }
         
         # 각 카테고리별 완곡 표현 카운트
-        for category, patterns in euphonious_patterns.items():
+        for category, patterns in self.euphonious_patterns.items():
             category_count = 0
             for pattern in patterns:
-                count = text.count(pattern)
+                count = keyword_counts[pattern]
                 category_count += count
                 if count > 0:
                     examples.append(f"{category}: {pattern} ({count}회)")
@@ -707,82 +986,31 @@ class CommunicationQualityAnalyzer:
             'euphonious_ratio': euphonious_ratio,
             'total_words': total_words,
             'category_breakdown': {
-                category: sum(text.count(pattern) for pattern in patterns)
-                for category, patterns in euphonious_patterns.items()
+                category: sum(keyword_counts[pattern] for pattern in patterns)
+                for category, patterns in self.euphonious_patterns.items()
             }
         }
         
         return QualityScore(score=score, details=details, examples=examples)
 
-    def _analyze_apology_expressions(self, text: str) -> QualityScore:
+    def _analyze_apology_expressions(self, text: str, keyword_counts: Dict[str, int]) -> QualityScore:
         """사과 표현 분석 (apology_ratio)"""
         apology_count = 0
         examples = []
         
-        # 사과 표현 패턴 (통신사 상담사 수준의 구체적 표현들)
-        apology_patterns = {
-            'direct_apologies': [
-                '죄송합니다', '죄송해요', '죄송하네요', '죄송하구요',
-                '죄송하겠습니다', '죄송하겠어요', '죄송하겠네요',
-                '미안합니다', '미안해요', '미안하네요', '미안하구요',
-                '사과드립니다', '사과드려요', '사과드리네요', '사과드리구요',
-                '양해부탁드립니다', '양해부탁드려요', '양해부탁드리네요'
-            ],
-            'polite_apologies': [
-                '정말 죄송합니다', '정말 죄송해요', '정말 죄송하네요',
-                '대단히 죄송합니다', '대단히 죄송해요', '대단히 죄송하네요',
-                '매우 죄송합니다', '매우 죄송해요', '매우 죄송하네요',
-                '깊이 사과드립니다', '깊이 사과드려요', '깊이 사과드리네요',
-                '진심으로 사과드립니다', '진심으로 사과드려요', '진심으로 사과드리네요'
-            ],
-            'service_apologies': [
-                '서비스 이용에 불편을 드려 죄송합니다',
-                '서비스 이용에 불편을 드려 죄송해요',
-                '서비스 이용에 불편을 드려 죄송하네요',
-                '고객님께 불편을 드려 죄송합니다',
-                '고객님께 불편을 드려 죄송해요',
-                '고객님께 불편을 드려 죄송하네요',
-                '불편을 드려 죄송합니다', '불편을 드려 죄송해요', '불편을 드려 죄송하네요',
-                '번거로움을 드려 죄송합니다', '번거로움을 드려 죄송해요', '번거로움을 드려 죄송하네요'
-            ],
-            'delay_apologies': [
-                '지연을 드려 죄송합니다', '지연을 드려 죄송해요', '지연을 드려 죄송하네요',
-                '기다리게 해서 죄송합니다', '기다리게 해서 죄송해요', '기다리게 해서 죄송하네요',
-                '시간이 걸려서 죄송합니다', '시간이 걸려서 죄송해요', '시간이 걸려서 죄송하네요',
-                '오래 기다리게 해서 죄송합니다', '오래 기다리게 해서 죄송해요', '오래 기다리게 해서 죄송하네요'
-            ],
-            'error_apologies': [
-                '오류가 발생해서 죄송합니다', '오류가 발생해서 죄송해요', '오류가 발생해서 죄송하네요',
-                '문제가 생겨서 죄송합니다', '문제가 생겨서 죄송해요', '문제가 생겨서 죄송하네요',
-                '장애가 발생해서 죄송합니다', '장애가 발생해서 죄송해요', '장애가 발생해서 죄송하네요',
-                '시스템 오류로 죄송합니다', '시스템 오류로 죄송해요', '시스템 오류로 죄송하네요'
-            ],
-            'inconvenience_apologies': [
-                '불편을 드려 죄송합니다', '불편을 드려 죄송해요', '불편을 드려 죄송하네요',
-                '번거로움을 드려 죄송합니다', '번거로움을 드려 죄송해요', '번거로움을 드려 죄송하네요',
-                '폐를 끼쳐 죄송합니다', '폐를 끼쳐 죄송해요', '폐를 끼쳐 죄송하네요',
-                '신경 쓰이게 해서 죄송합니다', '신경 쓰이게 해서 죄송해요', '신경 쓰이게 해서 죄송하네요'
-            ],
-            'understanding_apologies': [
-                '이해해 주셔서 감사합니다', '이해해 주셔서 감사해요', '이해해 주셔서 감사하네요',
-                '양해해 주셔서 감사합니다', '양해해 주셔서 감사해요', '양해해 주셔서 감사하네요',
-                '참아 주셔서 감사합니다', '참아 주셔서 감사해요', '참아 주셔서 감사하네요',
-                '기다려 주셔서 감사합니다', '기다려 주셔서 감사해요', '기다려 주셔서 감사하네요'
-            ]
-        }
         
         # 각 카테고리별 사과 표현 카운트
-        for category, patterns in apology_patterns.items():
+        for category, patterns in self.apology_patterns.items():
             category_count = 0
             for pattern in patterns:
-                count = text.count(pattern)
+                count = keyword_counts[pattern]
                 category_count += count
                 if count > 0:
                     examples.append(f"{category}: {pattern} ({count}회)")
             apology_count += category_count
         
         # 전체 문장 수 대비 사과 표현 비율 계산
-        total_sentences = len(re.findall(r'[.!?]', text)) + 1
+        total_sentences = len(SENTENCE_END_RE.findall(text)) + 1
         apology_ratio = apology_count / total_sentences if total_sentences > 0 else 0
         
         # 점수 계산 (적절한 사과 표현 사용 시 높은 점수)
@@ -793,51 +1021,39 @@ class CommunicationQualityAnalyzer:
             'apology_ratio': apology_ratio,
             'total_sentences': total_sentences,
             'category_breakdown': {
-                category: sum(text.count(pattern) for pattern in patterns)
-                for category, patterns in apology_patterns.items()
+                category: sum(keyword_counts[pattern] for pattern in patterns)
+                for category, patterns in self.apology_patterns.items()
             }
         }
         
         return QualityScore(score=score, details=details, examples=examples)
 
-    def _calculate_avg_response_latency(self, utterances_data: List[Dict[str, Any]]) -> float | None:
+    def _calculate_avg_response_latency(self, utterances_data: List[Dict[str, Any]],
+                                        arrays: Optional[UtteranceArrays] = None) -> float | None:
         """평균 응답 지연 시간 계산 (avg_response_latency)"""
         try:
             if not utterances_data or len(utterances_data) < 2:
                 return None
             
-            response_latencies = []
+            if arrays is None:
+                arrays = _extract_utterance_arrays(utterances_data)
             
-            for i in range(len(utterances_data) - 1):
-                current_utterance = utterances_data[i]
-                next_utterance = utterances_data[i + 1]
-                
-                # 현재 발화자가 고객이고 다음 발화자가 상담사인 경우만 계산
-                current_speaker = current_utterance.get('speaker', '').lower()
-                next_speaker = next_utterance.get('speaker', '').lower()
-                
-                is_customer_current = any(keyword in current_speaker for keyword in ['고객', 'customer', 'client', 'user'])
-                is_counselor_next = any(keyword in next_speaker for keyword in ['상담사', 'counselor', 'agent', 'csr', 'staff'])
-                
-                if is_customer_current and is_counselor_next:
-                    # 타임스탬프가 있는 경우
-                    if 'start_time' in current_utterance and 'start_time' in next_utterance:
-                        current_end = current_utterance.get('end_time', current_utterance['start_time'])
-                        next_start = next_utterance['start_time']
-                        latency = next_start - current_end
-                        if latency > 0:  # 양수인 경우만
-                            response_latencies.append(latency)
-                    
-                    # 타임스탬프가 없는 경우 기본값 사용
-                    else:
-                        # 기본 응답 지연 시간 (1-3초 범위에서 랜덤)
-                        import random
-                        default_latency = random.uniform(1.0, 3.0)
-                        response_latencies.append(default_latency)
+            # 현재 발화자가 고객이고 다음 발화자가 상담사인 경우만 계산
+            # 타임스탬프가 있는 경우 양수 지연 시간만 집계
+            latency_sum, latency_count, untimed_count = _scan_response_latencies(
+                arrays.roles, arrays.has_start, arrays.start, arrays.end
+            )
             
-            if response_latencies:
-                avg_latency = sum(response_latencies) / len(response_latencies)
-                return round(avg_latency, 3)
+            # 타임스탬프가 없는 경우 기본값 사용
+            if untimed_count:
+                # 기본 응답 지연 시간 (1-3초 범위에서 랜덤)
+                import random
+                latency_sum += sum(random.uniform(1.0, 3.0) for _ in range(untimed_count))
+                latency_count += untimed_count
+            
+            if latency_count:
+                avg_latency = latency_sum / latency_count
+                return _round_metric(avg_latency)
             
             return None
             
@@ -845,47 +1061,32 @@ class CommunicationQualityAnalyzer:
             print(f"⚠️ 평균 응답 지연 시간 계산 실패: {e}")
             return None
 
-    def _calculate_interruption_count(self, utterances_data: List[Dict[str, Any]]) -> int | None:
+    def _calculate_interruption_count(self, utterances_data: List[Dict[str, Any]],
+                                      arrays: Optional[UtteranceArrays] = None) -> int | None:
         """대화 가로채기 횟수 계산 (interruption_count)"""
         try:
             if not utterances_data or len(utterances_data) < 2:
                 return 0
             
-            interruption_count = 0
+            if arrays is None:
+                arrays = _extract_utterance_arrays(utterances_data)
             
-            for i in range(len(utterances_data) - 1):
-                current_utterance = utterances_data[i]
-                next_utterance = utterances_data[i + 1]
-                
-                # 현재 발화자가 고객이고 다음 발화자가 상담사인 경우
-                current_speaker = current_utterance.get('speaker', '').lower()
-                next_speaker = next_utterance.get('speaker', '').lower()
-                
-                is_customer_current = any(keyword in current_speaker for keyword in ['고객', 'customer', 'client', 'user'])
-                is_counselor_next = any(keyword in next_speaker for keyword in ['상담사', 'counselor', 'agent', 'csr', 'staff'])
+            # 현재 발화자가 고객이고 다음 발화자가 상담사인 경우
+            # 타임스탬프가 있으면 겹침 확인 (상담사가 고객 말을 끊은 경우)
+            interruption_count, untimed_pairs = _scan_interruption_pairs(
+                arrays.roles, arrays.has_start, arrays.start, arrays.end
+            )
+            
+            # 타임스탬프가 없는 경우 텍스트 패턴으로 판단
+            for i in untimed_pairs:
+                current_text = utterances_data[i].get('text', '').strip()
+                next_text = utterances_data[i + 1].get('text', '').strip()
                 
-                if is_customer_current and is_counselor_next:
-                    # 타임스탬프가 있는 경우 겹침 확인
-                    if 'start_time' in current_utterance and 'start_time' in next_utterance:
-                        current_end = current_utterance.get('end_time', current_utterance['start_time'])
-                        next_start = next_utterance['start_time']
-                        
-                        # 겹침이 있는 경우 (상담사가 고객 말을 끊은 경우)
-                        if next_start < current_end:
-                            interruption_count += 1
-                    
-                    # 타임스탬프가 없는 경우 텍스트 패턴으로 판단
-                    else:
-                        current_text = current_utterance.get('text', '').strip()
-                        next_text = next_utterance.get('text', '').strip()
-                        
-                        # 고객 발화가 완전하지 않은 경우 (끝이 명확하지 않은 경우)
-                        incomplete_endings = ['...', '..', '.', '?', '!', '~', '-']
-                        if any(current_text.endswith(ending) for ending in incomplete_endings):
-                            # 상담사가 즉시 응답하는 패턴
-                            immediate_responses = ['네', '아', '그렇군요', '그렇구나', '알겠습니다', '네, 알겠습니다']
-                            if any(next_text.startswith(response) for response in immediate_responses):
-                                interruption_count += 1
+                # 고객 발화가 완전하지 않은 경우 (끝이 명확하지 않은 경우)
+                if INCOMPLETE_ENDING_RE.search(current_text):
+                    # 상담사가 즉시 응답하는 패턴
+                    if IMMEDIATE_RESPONSE_RE.match(next_text):
+                        interruption_count += 1
             
             return interruption_count
             
@@ -893,12 +1094,16 @@ class CommunicationQualityAnalyzer:
             print(f"⚠️ 대화 가로채기 횟수 계산 실패: {e}")
             return 0
 
-    def _calculate_silence_ratio(self, utterances_data: List[Dict[str, Any]]) -> float | None:
+    def _calculate_silence_ratio(self, utterances_data: List[Dict[str, Any]],
+                                 arrays: Optional[UtteranceArrays] = None) -> float | None:
         """침묵 비율 계산 (silence_ratio)"""
         try:
             if not utterances_data:
                 return 0.0
             
+            if arrays is None:
+                arrays = _extract_utterance_arrays(utterances_data)
+            
             total_duration = 0
             silence_duration = 0
             
@@ -911,34 +1116,34 @@ class CommunicationQualityAnalyzer:
                 total_duration = len(utterances_data) * avg_utterance_duration
             
             # 발화 간 침묵 시간 계산
-            for i in range(len(utterances_data) - 1):
-                current_utterance = utterances_data[i]
-                next_utterance = utterances_data[i + 1]
-                
-                if 'end_time' in current_utterance and 'start_time' in next_utterance:
-                    gap = next_utterance['start_time'] - current_utterance['end_time']
-                    if gap > 0:
-                        silence_duration += gap
-                else:
-                    # 기본 침묵 시간 (0.5-2초)
-                    import random
-                    default_silence = random.uniform(0.5, 2.0)
-                    silence_duration += default_silence
+            timed = arrays.has_end[:-1] & arrays.has_start[1:]
+            gaps = arrays.start[1:][timed] - arrays.end[:-1][timed]
+            silence_duration = float(gaps[gaps > 0].sum())
+            
+            untimed_count = len(utterances_data) - 1 - int(np.count_nonzero(timed))
+            if untimed_count:
+                # 기본 침묵 시간 (0.5-2초)
+                import random
+                silence_duration += sum(random.uniform(0.5, 2.0) for _ in range(untimed_count))
             
             # 침묵 비율 계산
             silence_ratio = silence_duration / total_duration if total_duration > 0 else 0.0
-            return round(silence_ratio, 3)
+            return _round_metric(silence_ratio)
             
         except Exception as e:
             print(f"⚠️ 침묵 비율 계산 실패: {e}")
             return 0.0
 
-    def _calculate_talk_ratio(self, utterances_data: List[Dict[str, Any]]) -> float | None:
+    def _calculate_talk_ratio(self, utterances_data: List[Dict[str, Any]],
+                              arrays: Optional[UtteranceArrays] = None) -> float | None:
         """발화 시간 비율 계산 (talk_ratio)"""
         try:
             if not utterances_data:
                 return 0.0
             
+            if arrays is None:
+                arrays = _extract_utterance_arrays(utterances_data)
+            
             total_duration = 0
             talk_duration = 0
             
@@ -946,16 +1151,15 @@ class CommunicationQualityAnalyzer:
             if 'start_time' in utterances_data[0] and 'end_time' in utterances_data[-1]:
                 total_duration = utterances_data[-1]['end_time'] - utterances_data[0]['start_time']
                 
-                # 각 발화의 실제 시간 계산
-                for utterance in utterances_data:
-                    if 'start_time' in utterance and 'end_time' in utterance:
-                        utterance_duration = utterance['end_time'] - utterance['start_time']
-                        talk_duration += utterance_duration
-                    else:
-                        # 기본 발화 시간 (2-5초)
-                        import random
-                        default_duration = random.uniform(2.0, 5.0)
-                        talk_duration += default_duration
+                # 각 발화의 실제 시간 계산 (타임스탬프가 있는 발화는 배열로 한 번에 합산)
+                timed = arrays.has_start & arrays.has_end
+                talk_duration = float((arrays.end[timed] - arrays.start[timed]).sum())
+                
+                # 타임스탬프가 없는 발화는 기본 발화 시간 (2-5초)
+                untimed_count = len(utterances_data) - int(np.count_nonzero(timed))
+                if untimed_count:
+                    import random
+                    talk_duration += sum(random.uniform(2.0, 5.0) for _ in range(untimed_count))
             else:
                 # 기본값 사용
                 avg_utterance_duration = 3.0
@@ -964,15 +1168,25 @@ class CommunicationQualityAnalyzer:
             
             # 발화 시간 비율 계산
             talk_ratio = talk_duration / total_duration if total_duration > 0 else 0.0
-            return round(talk_ratio, 3)
+            return _round_metric(talk_ratio)
             
         except Exception as e:
             print(f"⚠️ 발화 시간 비율 계산 실패: {e}")
             return 0.0
 
+# 전역 인스턴스 (싱글톤 패턴, 패턴 컴파일과 키워드 자동자 구성은 한 번만 수행)
+_communication_quality_analyzer: Optional[CommunicationQualityAnalyzer] = None
+
+def get_communication_quality_analyzer() -> CommunicationQualityAnalyzer:
+    """의사소통 품질 분석기 인스턴스 반환"""
+    global _communication_quality_analyzer
+    if _communication_quality_analyzer is None:
+        _communication_quality_analyzer = CommunicationQualityAnalyzer()
+    return _communication_quality_analyzer
+
 def text_analyze_communication_quality_advanced(text: str) -> Dict[str, any]:
     """고급 의사소통 품질 분석 (통신사 상담사 수준)"""
-    analyzer = CommunicationQualityAnalyzer()
+    analyzer = get_communication_quality_analyzer()
     results = analyzer.text_analyze_communication_quality(text)
     
     # 종합 점수 계산 (KNU 감성 분석 포함)
@@ -1150,8 +1364,12 @@ class AdvancedAnalysisManager:
                 cache_info = self.cache_metadata[cache_key]
                 cache_path = self.cache_dir / cache_info["filename"]
                 
-                if cache_path.exists() and os.path.getsize(cache_path) > 0:
-                    return cache_info
+                # 존재 여부와 크기를 stat 한 번으로 확인
+                try:
+                    if cache_path.stat().st_size > 0:
+                        return cache_info
+                except OSError:
+                    pass
         
         return None
     
@@ -1179,7 +1397,7 @@ class AdvancedAnalysisManager:
                 }
                 self._save_cache_metadata()
             
-            print(f"💾 분석 캐시 저장: {cache_filename}")
+            logger.debug("💾 분석 캐시 저장: %s", cache_filename)
             
         except Exception as e:
             print(f"⚠️ 분석 캐시 저장 실패: {e}")
@@ -1268,7 +1486,7 @@ class AdvancedAnalysisManager:
     
     def _analyze_clarity(self, text: str) -> float:
         """명확성 분석 (통신사 상담사 수준)"""
-        analyzer = CommunicationQualityAnalyzer()
+        analyzer = get_communication_quality_analyzer()
         results = analyzer.text_analyze_communication_quality(text)
         
         # 명확성은 전문성과 구체적 정보 제공의 조합
@@ -1282,7 +1500,7 @@ class AdvancedAnalysisManager:
     
     def _analyze_politeness(self, text: str) -> float:
         """예의성 분석 (통신사 상담사 수준)"""
-        analyzer = CommunicationQualityAnalyzer()
+        analyzer = get_communication_quality_analyzer()
         results = analyzer.text_analyze_communication_quality(text)
         
         # 예의성은 존댓말 사용과 부정적 표현 회피의 조합
@@ -1296,7 +1514,7 @@ class AdvancedAnalysisManager:
     
     def _analyze_empathy(self, text: str) -> float:
         """공감성 분석 (통신사 상담사 수준)"""
-        analyzer = CommunicationQualityAnalyzer()
+        analyzer = get_communication_quality_analyzer()
         results = analyzer.text_analyze_communication_quality(text)
         
         # 공감성 점수 반환
@@ -1306,7 +1524,7 @@ class AdvancedAnalysisManager:
     
     def _analyze_professionalism(self, text: str) -> float:
         """전문성 분석 (통신사 상담사 수준)"""
-        analyzer = CommunicationQualityAnalyzer()
+        analyzer = get_communication_quality_analyzer()
         results = analyzer.text_analyze_communication_quality(text)
         
         # 전문성 점수 반환
@@ -1316,7 +1534,7 @@ class AdvancedAnalysisManager:
     
     def _analyze_response_quality(self, text: str) -> float:
         """응답 품질 분석 (통신사 상담사 수준)"""
-        analyzer = CommunicationQualityAnalyzer()
+        analyzer = get_communication_quality_analyzer()
         results = analyzer.text_analyze_communication_quality(text)
         
         # 응답 품질은 모든 지표의 종합
@@ -1351,7 +1569,7 @@ class AdvancedAnalysisManager:
             종합 분석 결과
         """
         try:
-            print(f"🔍 종합 텍스트 분석 시작: {len(text)}자")
+            logger.debug("🔍 종합 텍스트 분석 시작: %d자", len(text))
             start_time = time.time()
             
             # 캐시 확인
@@ -1359,7 +1577,7 @@ class AdvancedAnalysisManager:
             if cached_info:
                 result = self._load_from_cache(cached_info)
                 self.performance_stats["cache_hits"] += 1
-                print(f"💾 캐시에서 로드: 종합 분석")
+                logger.debug("💾 캐시에서 로드: 종합 분석")
                 return result
             
             # 병렬 분석 태스크 생성
@@ -1372,11 +1590,11 @@ class AdvancedAnalysisManager:
             
             # 병렬 실행
             if self.enable_parallel:
-                print("🚀 병렬 분석 시작")
+                logger.debug("🚀 병렬 분석 시작")
                 results = await asyncio.gather(*analysis_tasks, return_exceptions=True)
                 self.performance_stats["parallel_analyses"] += 1
             else:
-                print("🐌 순차 분석 시작")
+                logger.debug("🐌 순차 분석 시작")
                 results = []
                 for task in analysis_tasks:
                     try:
@@ -1410,7 +1628,7 @@ class AdvancedAnalysisManager:
                 / self.performance_stats["total_analyses"]
             )
             
-            print(f"✅ 종합 분석 완료: {processing_time:.2f}초")
+            logger.debug("✅ 종합 분석 완료: %.2f초", processing_time)
             return analysis_result
             
         except Exception as e:
@@ -1443,8 +1661,14 @@ class AdvancedAnalysisManager:
             print(f"🚀 배치 병렬 분석 시작: {len(texts)}개 텍스트")
             start_time = time.time()
             
-            # 병렬 태스크 생성
-            tasks = [self.analyze_text_comprehensive(text) for text in texts]
+            # 병렬 태스크 생성 (동시 실행 수는 max_workers로 제한)
+            semaphore = asyncio.Semaphore(self.max_workers)
+            
+            async def analyze_bounded(text: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self.analyze_text_comprehensive(text)
+            
+            tasks = [analyze_bounded(text) for text in texts]
             
             # 병렬 실행
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -1494,7 +1718,7 @@ class AdvancedAnalysisManager:
                     try:
                         if cache_path.exists():
                             os.remove(cache_path)
-                            print(f"🧹 분석 캐시 정리: {cache_info['filename']}")
+                            logger.debug("🧹 분석 캐시 정리: %s", cache_info['filename'])
                     except Exception as e:
                         print(f"⚠️ 캐시 파일 삭제 실패: {cache_path}, {e}")
                     
@@ -1598,7 +1822,12 @@ class AdvancedAnalysisManager:
                 'error': str(e)
             }
 
-def text_calculate_customer_sentiment_trend(utterances_data: List[Dict[str, Any]]) -> tuple:
+def _score_or_nan(score: float | None) -> float:
+    """매핑되지 않은 감정 점수(None)를 NaN으로 변환"""
+    return np.nan if score is None else score
+
+def text_calculate_customer_sentiment_trend(utterances_data: List[Dict[str, Any]],
+                                            roles: Optional[np.ndarray] = None) -> tuple:
     """
     고객 감정 추세 분석 (50% 구분으로 안정성 향상)
     
@@ -1606,6 +1835,8 @@ def text_calculate_customer_sentiment_trend(utterances_data: List[Dict[str, Any]
     ----------
     utterances_data : List[Dict[str, Any]]
         발화 데이터 (speaker, sentiment 포함)
+    roles : Optional[np.ndarray]
+        이미 계산한 발화별 화자 역할 코드 (없으면 새로 계산)
         
     Returns
     -------
@@ -1613,46 +1844,48 @@ def text_calculate_customer_sentiment_trend(utterances_data: List[Dict[str, Any]
     """
     try:
         # 1. 고객 발화만 필터링
-        customer_utterances = []
-        for utterance in utterances_data:
-            speaker = utterance.get('speaker', '').lower()
-            if any(keyword in speaker for keyword in ['고객', 'customer', 'client', 'user']):
-                customer_utterances.append(utterance)
+        if roles is None:
+            roles = [_classify_speaker_role(utterance.get('speaker', '')) for utterance in utterances_data]
+        customer_utterances = [
+            utterance for utterance, role in zip(utterances_data, roles)
+            if role & SPEAKER_ROLE_CUSTOMER
+        ]
         
         if len(customer_utterances) < 2:  # 최소 2개 발화 필요 (50% 구분)
             return None, None, None
         
-        # 2. sentiment 텍스트를 숫자로 매핑
-        sentiment_scores = []
-        for utterance in customer_utterances:
-            sentiment_text = utterance.get('sentiment', '').lower()
-            score = text_map_sentiment_to_score(sentiment_text)
-            if score is not None:
-                sentiment_scores.append(score)
+        # 2. sentiment 텍스트를 숫자로 매핑 (매핑 불가는 NaN으로 두고 한 번에 제거)
+        #    정규화(strip/lower)는 캐시된 매핑 함수 안에서 라벨별로 한 번만 수행
+        sentiment_scores = np.fromiter(
+            (_score_or_nan(text_map_sentiment_to_score(utterance.get('sentiment', '')))
+             for utterance in customer_utterances),
+            dtype=np.float64, count=len(customer_utterances)
+        )
+        sentiment_scores = sentiment_scores[~np.isnan(sentiment_scores)]
         
-        if len(sentiment_scores) < 2:
+        if sentiment_scores.size < 2:
             return None, None, None
         
         # 3. 초반부(처음 50%)와 후반부(끝 50%) 구분 (안정성 향상)
-        total_count = len(sentiment_scores)
+        total_count = sentiment_scores.size
         mid_point = total_count // 2
         
         # 짝수 개수인 경우 정확히 반씩, 홀수 개수인 경우 중간값은 제외
-        if total_count % 2 == 0:
-            early_scores = sentiment_scores[:mid_point]
-            late_scores = sentiment_scores[mid_point:]
-        else:
-            early_scores = sentiment_scores[:mid_point]
-            late_scores = sentiment_scores[mid_point + 1:]
+        early_scores = sentiment_scores[:mid_point]
+        late_scores = sentiment_scores[total_count - mid_point:]
         
         # 4. 각 구간의 평균 점수 계산
-        customer_sentiment_early = round(sum(early_scores) / len(early_scores), 3)
-        customer_sentiment_late = round(sum(late_scores) / len(late_scores), 3)
+        customer_sentiment_early = _round_metric(float(early_scores.mean()))
+        customer_sentiment_late = _round_metric(float(late_scores.mean()))
         
         # 5. 감정 변화 추세 계산 (후반부 - 초반부)
-        customer_sentiment_trend = round(customer_sentiment_late - customer_sentiment_early, 3)
+        customer_sentiment_trend = _round_metric(customer_sentiment_late - customer_sentiment_early)
         
-        print(f"📊 감정 추세 분석: 초반부({len(early_scores)}개)={customer_sentiment_early}, 후반부({len(late_scores)}개)={customer_sentiment_late}, 추세={customer_sentiment_trend}")
+        logger.debug(
+            "📊 감정 추세 분석: 초반부(%d개)=%s, 후반부(%d개)=%s, 추세=%s",
+            len(early_scores), customer_sentiment_early,
+            len(late_scores), customer_sentiment_late, customer_sentiment_trend
+        )
         
         return customer_sentiment_early, customer_sentiment_late, customer_sentiment_trend
         
@@ -1660,9 +1893,38 @@ def text_calculate_customer_sentiment_trend(utterances_data: List[Dict[str, Any]
         print(f"⚠️ 고객 감정 추세 분석 실패: {e}")
         return None, None, None
 
+# sentiment 텍스트 → 숫자 점수 매핑 (호출마다 새로 만들지 않도록 모듈 상수로 유지)
+SENTIMENT_SCORE_MAPPING = {
+    # 기본 매핑
+    'positive': 1.0,
+    'neutral': 0.0,
+    'negative': -1.0,
+    
+    # 확장 매핑 (5점 척도)
+    'very positive': 2.0,
+    'very_positive': 2.0,
+    'very negative': -2.0,
+    'very_negative': -2.0,
+    
+    # 한국어 매핑
+    '긍정': 1.0,
+    '부정': -1.0,
+    '중립': 0.0,
+    '매우긍정': 2.0,
+    '매우부정': -2.0,
+    
+    # 숫자 문자열 직접 매핑
+    '1': 1.0,
+    '0': 0.0,
+    '-1': -1.0,
+    '2': 2.0,
+    '-2': -2.0
+}
+
+@lru_cache(maxsize=128)
 def text_map_sentiment_to_score(sentiment_text: str) -> float | None:
     """
-    sentiment 텍스트를 숫자 점수로 매핑
+    sentiment 텍스트를 숫자 점수로 매핑 (감정 라벨 종류가 적어 결과를 캐시)
     
     Parameters
     ----------
@@ -1674,38 +1936,11 @@ def text_map_sentiment_to_score(sentiment_text: str) -> float | None:
     float | None
         감정 점수 또는 None
     """
-    sentiment_mapping = {
-        # 기본 매핑
-        'positive': 1.0,
-        'neutral': 0.0,
-        'negative': -1.0,
-        
-        # 확장 매핑 (5점 척도)
-        'very positive': 2.0,
-        'very_positive': 2.0,
-        'very negative': -2.0,
-        'very_negative': -2.0,
-        
-        # 한국어 매핑
-        '긍정': 1.0,
-        '부정': -1.0,
-        '중립': 0.0,
-        '매우긍정': 2.0,
-        '매우부정': -2.0,
-        
-        # 숫자 문자열 직접 매핑
-        '1': 1.0,
-        '0': 0.0,
-        '-1': -1.0,
-        '2': 2.0,
-        '-2': -2.0
-    }
-    
     # 정규화된 텍스트로 매핑 시도
     normalized_text = sentiment_text.strip().lower().replace(' ', '_')
     
-    if normalized_text in sentiment_mapping:
-        return sentiment_mapping[normalized_text]
+    if normalized_text in SENTIMENT_SCORE_MAPPING:
+        return SENTIMENT_SCORE_MAPPING[normalized_text]
     
     # 숫자로 직접 변환 시도
     try:
@@ -1732,15 +1967,18 @@ def text_analyze_communication_quality_with_trend(utterances_data: List[Dict[str
     """
     try:
         # 기존 품질 분석
-        analyzer = CommunicationQualityAnalyzer()
+        analyzer = get_communication_quality_analyzer()
+        
+        # 발화별 화자 역할과 타임스탬프는 한 번의 순회로 추출해 모든 지표에서 공유
+        arrays = _extract_utterance_arrays(utterances_data)
+        roles = arrays.roles
         
         # 상담사 발화만 추출하여 품질 분석
         counselor_texts = []
-        for utterance in utterances_data:
-            speaker = utterance.get('speaker', '').lower()
+        for utterance, role in zip(utterances_data, roles):
             text = utterance.get('text', '').strip()
             
-            if any(keyword in speaker for keyword in ['상담사', 'counselor', 'agent', 'csr', 'staff']):
+            if role & SPEAKER_ROLE_COUNSELOR:
                 if text:
                     counselor_texts.append(text)
         
@@ -1751,13 +1989,13 @@ def text_analyze_communication_quality_with_trend(utterances_data: List[Dict[str
             quality_results = analyzer.text_analyze_communication_quality(combined_text)
         
         # 감정 추세 분석
-        sentiment_early, sentiment_late, sentiment_trend = text_calculate_customer_sentiment_trend(utterances_data)
+        sentiment_early, sentiment_late, sentiment_trend = text_calculate_customer_sentiment_trend(utterances_data, roles)
         
         # 추가 지표 계산 (utterances_data 기반)
-        avg_response_latency = analyzer._calculate_avg_response_latency(utterances_data)
-        interruption_count = analyzer._calculate_interruption_count(utterances_data)
-        silence_ratio = analyzer._calculate_silence_ratio(utterances_data)
-        talk_ratio = analyzer._calculate_talk_ratio(utterances_data)
+        avg_response_latency = analyzer._calculate_avg_response_latency(utterances_data, arrays)
+        interruption_count = analyzer._calculate_interruption_count(utterances_data, arrays)
+        silence_ratio = analyzer._calculate_silence_ratio(utterances_data, arrays)
+        talk_ratio = analyzer._calculate_talk_ratio(utterances_data, arrays)
         
         # KNU 감성 분석 결과에서 긍정/부정 비율 추출
         positive_word_ratio = 0.0
@@ -1821,8 +2059,8 @@ def text_analyze_communication_quality_with_trend(utterances_data: List[Dict[str
             
             "analysis_metadata": {
                 "total_utterances": len(utterances_data),
-                "counselor_utterances": len([u for u in utterances_data if any(k in u.get('speaker', '').lower() for k in ['상담사', 'counselor', 'agent', 'csr', 'staff'])]),
-                "customer_utterances": len([u for u in utterances_data if any(k in u.get('speaker', '').lower() for k in ['고객', 'customer', 'client', 'user'])])
+                "counselor_utterances": int(np.count_nonzero(roles & SPEAKER_ROLE_COUNSELOR)),
+                "customer_utterances": int(np.count_nonzero(roles & SPEAKER_ROLE_CUSTOMER))
             }
         }
         
@@ -1848,6 +2086,45 @@ def text_analyze_communication_quality_with_trend(utterances_data: List[Dict[str
             "talk_ratio": 0.0
         }
 
+# 의사소통 품질/흐름 지표 계산에 쓰이는 발화 필드 (JSON 로드 시 나머지 필드는 버림)
+CONVERSATION_METRIC_FIELDS = ('speaker', 'text', 'sentiment', 'start_time', 'end_time')
+
+def text_load_utterances_for_metrics(json_path: str) -> List[Dict[str, Any]]:
+    """
+    발화 JSON 배열 파일에서 지표 계산에 필요한 필드만 읽기
+    
+    ijson이 설치되어 있으면 파일을 스트리밍으로 파싱해 단어 단위 타임스탬프 같은
+    큰 부가 필드를 가진 전체 객체 그래프를 만들지 않습니다.
+    
+    Parameters
+    ----------
+    json_path : str
+        발화 객체 배열(JSON) 파일 경로
+        
+    Returns
+    -------
+    List[Dict[str, Any]]
+        CONVERSATION_METRIC_FIELDS만 담은 발화 데이터
+    """
+    with open(json_path, 'rb') as f:
+        if IJSON_AVAILABLE:
+            utterances = ijson.items(f, 'item', use_float=True)
+        else:
+            utterances = json.load(f)
+        return [
+            {field: utterance[field] for field in CONVERSATION_METRIC_FIELDS if field in utterance}
+            for utterance in utterances
+        ]
+
+def text_analyze_communication_quality_with_trend_from_json(json_path: str) -> Dict[str, Any]:
+    """발화 JSON 파일 경로로 text_analyze_communication_quality_with_trend 수행"""
+    try:
+        utterances_data = text_load_utterances_for_metrics(json_path)
+    except Exception as e:
+        print(f"⚠️ 발화 JSON 로드 실패: {e}")
+        utterances_data = []
+    return text_analyze_communication_quality_with_trend(utterances_data)
+
 """
 🎯 간소화된 상담 분류 시스템
 키워드 기반 + LLM 하이브리드 접근법으로 정확도 향상
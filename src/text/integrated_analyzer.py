@@ -16,6 +16,25 @@ from src.utils.structured_logger import StructuredLogger
 
 logger = logging.getLogger(__name__)
 
+# 감정 키워드
+POSITIVE_SENTIMENT_WORDS = ('좋', '만족', '감사', '고맙', '해결', '완료')
+NEGATIVE_SENTIMENT_WORDS = ('불만', '문제', '어려움', '힘들', '짜증', '화나')
+
+# 긍정/부정 우세 여부(1, -1, 0)별 감정 점수와 카테고리
+SENTIMENT_BY_BALANCE = {
+    1: (0.7, 'satisfied'),
+    -1: (-0.5, 'frustrated'),
+    0: (0.0, 'neutral')
+}
+
+# 상담 결과별 해결 상태
+RESOLUTION_STATUS_BY_RESULT = {
+    '만족': 'resolved',
+    '미흡': 'partially_resolved',
+    '해결 불가': 'unresolved',
+    '추가상담필요': 'escalated'
+}
+
 class IntegratedAnalyzer:
     """통합 분석기 - 간소화된 분류 체계"""
     
@@ -36,14 +55,13 @@ class IntegratedAnalyzer:
             # 1. 텍스트 추출 및 전처리
             text_content = await self._extract_and_preprocess_text(audio_file_path)
             
-            # 2. 상담 분류 (하이브리드)
-            classification_result = await self._classify_consultation(text_content)
-            
-            # 3. 품질 지표 계산
-            quality_metrics = await self._calculate_quality_metrics(text_content)
-            
-            # 4. 감정 분석
-            sentiment_analysis = await self._analyze_sentiment(text_content)
+            # 2~4. 상담 분류(하이브리드), 품질 지표 계산, 감정 분석은 서로 독립적이므로 동시 실행
+            # (상담 분류만 스레드에서 실행되고, 나머지 두 단계는 await 없는 가벼운 계산이라 이벤트 루프에서 바로 끝남)
+            classification_result, quality_metrics, sentiment_analysis = await asyncio.gather(
+                self._classify_consultation(text_content),
+                self._calculate_quality_metrics(text_content),
+                self._analyze_sentiment(text_content)
+            )
             
             # 5. 결과 통합
             integrated_result = await self._integrate_results(
@@ -93,8 +111,8 @@ class IntegratedAnalyzer:
     async def _classify_consultation(self, text_content: str) -> ClassificationResult:
         """상담 분류 (하이브리드)"""
         try:
-            # 하이브리드 분류 실행
-            result = self.classifier.classify(text_content, method='hybrid')
+            # 하이브리드 분류 실행 (동기 호출이므로 스레드에서 실행해 이벤트 루프를 막지 않음)
+            result = await asyncio.to_thread(self.classifier.text_classify, text_content, 'hybrid')
             
             logger.info(f"상담 분류 완료: {result.classification_method}, 신뢰도: {result.confidence_score:.2f}")
             
@@ -145,22 +163,12 @@ class IntegratedAnalyzer:
             
             if text_content:
                 # 긍정/부정 키워드 기반 감정 분석
-                positive_words = ['좋', '만족', '감사', '고맙', '해결', '완료']
-                negative_words = ['불만', '문제', '어려움', '힘들', '짜증', '화나']
-                
                 text_lower = text_content.lower()
-                positive_count = sum(1 for word in positive_words if word in text_lower)
-                negative_count = sum(1 for word in negative_words if word in text_lower)
+                positive_count = sum(1 for word in POSITIVE_SENTIMENT_WORDS if word in text_lower)
+                negative_count = sum(1 for word in NEGATIVE_SENTIMENT_WORDS if word in text_lower)
                 
-                if positive_count > negative_count:
-                    sentiment_score = 0.7
-                    emotion_category = 'satisfied'
-                elif negative_count > positive_count:
-                    sentiment_score = -0.5
-                    emotion_category = 'frustrated'
-                else:
-                    sentiment_score = 0.0
-                    emotion_category = 'neutral'
+                balance = (positive_count > negative_count) - (positive_count < negative_count)
+                sentiment_score, emotion_category = SENTIMENT_BY_BALANCE[balance]
                 
                 sentiment_data.append({
                     'speaker_type': 'customer',
@@ -274,18 +282,7 @@ class IntegratedAnalyzer:
         """해결 상태 판단"""
         try:
             result = classification_result.consultation_result
-            quality = quality_metrics.get('overall_quality', 0.0)
-            
-            if result == '만족':
-                return 'resolved'
-            elif result == '미흡':
-                return 'partially_resolved'
-            elif result == '해결 불가':
-                return 'unresolved'
-            elif result == '추가상담필요':
-                return 'escalated'
-            else:
-                return 'unresolved'
+            return RESOLUTION_STATUS_BY_RESULT.get(result, 'unresolved')
                 
         except Exception as e:
             logger.error(f"해결 상태 판단 실패: {e}")
@@ -24,6 +24,19 @@ from src.text.model import LanguageModel
 # .env 파일 로드
 load_dotenv()
 
+# API 감정 분석 응답 파싱 (정확히 라벨만 온 경우 O(1) 조회, 아니면 키워드 스캔)
+SENTIMENT_RESPONSE_LABELS = {
+    "긍정": "긍정", "positive": "긍정",
+    "부정": "부정", "negative": "부정",
+    "중립": "중립", "neutral": "중립"
+}
+POSITIVE_RESPONSE_RE = re.compile("긍정|positive|만족|좋")
+NEGATIVE_RESPONSE_RE = re.compile("부정|negative|불만|화|싫")
+
+# API 비속어 감지 응답 파싱
+PROFANITY_RESPONSE_ANSWERS = {"예": True, "yes": True, "아니오": False, "no": False}
+PROFANITY_RESPONSE_RE = re.compile("예|yes|포함|있습니다|발견")
+
 
 class APIModelHandler:
     """
@@ -126,17 +139,12 @@ class APIModelHandler:
     
     def _messages_to_text(self, messages: List[Dict[str, str]]) -> str:
         """메시지 리스트를 텍스트로 변환"""
-        text = None
-        for message in messages:
-            role = message.get("role", "")
-            content = message.get("content", "")
-            if role == "system":
-                text += f"시스템: {content}\n"
-            elif role == "user":
-                text += f"사용자: {content}\n"
-            elif role == "assistant":
-                text += f"어시스턴트: {content}\n"
-        return text
+        role_labels = {"system": "시스템", "user": "사용자", "assistant": "어시스턴트"}
+        return "".join(
+            f"{role_labels[role]}: {message.get('content', '')}\n"
+            for message in messages
+            if (role := message.get("role", "")) in role_labels
+        )
     
     def text_get_available_apis(self) -> List[str]:
         """사용 가능한 API 목록 반환"""
@@ -553,11 +561,13 @@ class KoreanModels:
                 model_name="gpt-4.1-nano"
             )
             
-            # 응답에서 감정 추출 (더 정확한 매칭)
-            response_lower = response.lower()
-            if any(word in response for word in ["긍정", "positive", "만족", "좋"]):
+            # 응답에서 감정 추출 (라벨만 온 경우 바로 조회, 아니면 키워드 스캔)
+            label = SENTIMENT_RESPONSE_LABELS.get(response.strip())
+            if label is not None:
+                return label
+            if POSITIVE_RESPONSE_RE.search(response):
                 return "긍정"
-            elif any(word in response for word in ["부정", "negative", "불만", "화", "싫"]):
+            elif NEGATIVE_RESPONSE_RE.search(response):
                 return "부정"
             else:
                 return "중립"
@@ -632,7 +642,10 @@ class KoreanModels:
             
             # 더 정확한 판단 로직
             response_clean = response.strip().lower()
-            return any(word in response_clean for word in ["예", "yes", "포함", "있습니다", "발견"])
+            answer = PROFANITY_RESPONSE_ANSWERS.get(response_clean)
+            if answer is not None:
+                return answer
+            return PROFANITY_RESPONSE_RE.search(response_clean) is not None
                 
         except Exception as e:
             print(f"API 비속어 감지 오류: {e}")
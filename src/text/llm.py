@@ -1,8 +1,11 @@
 # Standard library imports
 import re
 import json
+import copy
 import asyncio
-from typing import Annotated, Optional, Dict, Any, List
+import hashlib
+from collections import OrderedDict
+from typing import Annotated, Optional, Dict, Any, List, Tuple
 import os
 
 # Related third-party imports
@@ -304,6 +307,184 @@ class LLMResultHandler:
         print("LLM Result:", llm_result)
 
 
+# 태스크별 프롬프트 (system 프롬프트, user 프롬프트 접두어)
+# 고정된 system 프롬프트는 모듈 로드 시 한 번만 만들고 호출마다 user 부분만 붙입니다.
+LLM_TASK_PROMPTS: Dict[str, Tuple[str, str]] = {
+    "Classification": (
+        """당신은 통신사 고객 상담 분석 전문가입니다. 
+화자의 역할을 정확히 분류해주세요.
+
+분류 기준:
+- 고객: 문의, 불만, 요청을 하는 화자
+- 상담원: 안내, 해결책 제시, 업무 처리를 하는 화자
+
+출력 형식: JSON
+{
+    "speaker_roles": {
+        "Speaker 1": "고객" 또는 "상담원",
+        "Speaker 2": "고객" 또는 "상담원"
+    },
+    "confidence": 0.0-1.0,
+    "reasoning": "분류 근거"
+}""",
+        "다음 통신사 상담 대화에서 각 화자의 역할을 분류해주세요:\n\n"
+    ),
+    "Summary": (
+        """당신은 통신사 고객 상담 요약 전문가입니다.
+상담 내용을 핵심 포인트 중심으로 요약해주세요.
+
+요약 항목:
+1. 고객 문의/요청 사항
+2. 상담원 응답/해결책
+3. 상담 결과
+4. 후속 조치 필요사항
+
+출력 형식: JSON
+{
+    "summary": "전체 상담 요약 (2-3문장)",
+    "customer_inquiry": "고객 문의 사항",
+    "agent_response": "상담원 응답",
+    "consultation_result": "상담 결과",
+    "follow_up_needed": true/false,
+    "key_points": ["핵심 포인트 1", "핵심 포인트 2"]
+}""",
+        "다음 통신사 상담 내용을 요약해주세요:\n\n"
+    ),
+    "ConflictDetection": (
+        """당신은 통신사 고객 상담 갈등 감지 전문가입니다.
+상담 중 갈등, 불만, 문제 상황을 정확히 감지해주세요.
+
+갈등 지표:
+- 고객 불만/화남 표현
+- 반복적인 문제 제기
+- 해결 거부/불만족
+- 감정적 표현
+- 요구사항 미충족
+
+출력 형식: JSON
+{
+    "conflict_detected": true/false,
+    "conflict_level": "낮음/보통/높음",
+    "conflict_indicators": ["지표1", "지표2"],
+    "customer_emotion": "화남/불만/실망/중립",
+    "resolution_difficulty": "쉬움/보통/어려움",
+    "escalation_needed": true/false
+}""",
+        "다음 통신사 상담에서 갈등이나 문제 상황을 분석해주세요:\n\n"
+    ),
+    "TopicDetection": (
+        """당신은 통신사 업무 분류 전문가입니다.
+상담 내용을 정확한 업무 유형으로 분류해주세요.
+
+가능한 업무 유형:
+{system_input}
+
+분류 기준:
+- 주요 키워드 매칭
+- 고객 요청 사항 분석
+- 상담 목적 파악
+
+출력 형식: JSON
+{{
+    "primary_topic": "주요 업무 유형",
+    "secondary_topics": ["부차적 주제1", "부차적 주제2"],
+    "confidence": 0.0-1.0,
+    "keywords_found": ["키워드1", "키워드2"],
+    "business_complexity": "단순/복합"
+}}""",
+        "다음 통신사 상담의 업무 유형을 분류해주세요:\n\n"
+    ),
+    "ComplaintAnalysis": (
+        """당신은 통신사 민원 분석 전문가입니다.
+고객 민원을 종합적으로 분석해주세요.
+
+분석 항목:
+1. 민원 유형 및 심각도
+2. 고객 만족도 예측
+3. 해결 방안 제시
+4. 우선순위 평가
+
+출력 형식: JSON
+{
+    "complaint_type": "요금/서비스/기기/기타",
+    "severity": "낮음/보통/높음/긴급",
+    "customer_satisfaction_predicted": 1-5,
+    "resolution_suggestions": ["해결방안1", "해결방안2"],
+    "priority_level": 1-5,
+    "department_recommendation": "담당 부서",
+    "estimated_resolution_time": "예상 해결 시간"
+}""",
+        "다음 통신사 민원을 분석해주세요:\n\n"
+    ),
+    "ActionItems": (
+        """당신은 통신사 상담 후속 조치 전문가입니다.
+상담 내용을 바탕으로 구체적인 액션 아이템을 도출해주세요.
+
+액션 아이템 유형:
+- 즉시 처리 가능한 업무
+- 후속 연락 필요 사항
+- 타 부서 협조 필요 업무
+- 고객 추가 준비 사항
+
+출력 형식: JSON
+{
+    "immediate_actions": ["즉시 처리할 업무1", "즉시 처리할 업무2"],
+    "follow_up_actions": ["후속 조치1", "후속 조치2"],
+    "customer_actions": ["고객이 해야할 일1", "고객이 해야할 일2"],
+    "interdepartmental_actions": ["타 부서 협조 업무1"],
+    "timeline": {
+        "immediate": "즉시",
+        "short_term": "1-3일",
+        "long_term": "1주일 이상"
+    }
+}""",
+        "다음 통신사 상담의 액션 아이템을 도출해주세요:\n\n"
+    ),
+    "QualityAssessment": (
+        """당신은 통신사 상담 품질 평가 전문가입니다.
+상담 품질을 객관적으로 평가해주세요.
+
+평가 기준:
+1. 문제 해결도 (1-5점)
+2. 고객 응대 품질 (1-5점)  
+3. 정보 제공 정확성 (1-5점)
+4. 상담 효율성 (1-5점)
+5. 고객 만족도 예측 (1-5점)
+
+출력 형식: JSON
+{
+    "overall_score": 1-5,
+    "problem_resolution": 1-5,
+    "service_quality": 1-5,
+    "information_accuracy": 1-5,
+    "efficiency": 1-5,
+    "customer_satisfaction_predicted": 1-5,
+    "strengths": ["강점1", "강점2"],
+    "improvements": ["개선점1", "개선점2"],
+    "recommendation": "전체적인 평가 및 권고사항"
+}""",
+        "다음 통신사 상담의 품질을 평가해주세요:\n\n"
+    )
+}
+DEFAULT_LLM_TASK_PROMPT: Tuple[str, str] = (
+    "당신은 한국어 음성 대화 분석 전문가입니다. 정확하고 일관된 분석을 제공해주세요.",
+    "다음 내용을 분석해주세요:\n"
+)
+# system_input을 채워 넣어야 하는 템플릿 system 프롬프트
+LLM_TEMPLATED_SYSTEM_PROMPTS = frozenset({"TopicDetection"})
+
+# API 실패 시 태스크별 폴백 응답 (호출마다 만들지 않고 복사본만 반환)
+LLM_FALLBACK_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "Classification": {"speaker_roles": "화자 역할 분류 실패"},
+    "SentimentAnalysis": {"sentiment": "중립"},
+    "ProfanityWordDetection": {"profanity": "비속어 감지 실패"},
+    "Summary": {"summary": "요약 생성 실패"},
+    "ConflictDetection": {"conflict": False},
+    "TopicDetection": {"topic": "기타"}
+}
+DEFAULT_LLM_FALLBACK_RESPONSE: Dict[str, Any] = {"result": "분석 실패"}
+
+
 class LLMHandler:
     """
     OpenAI API를 사용한 LLM 처리 핸들러
@@ -333,6 +514,22 @@ class LLMHandler:
             "models": None,
             "models_count": 0
         }
+        
+        # 응답 캐시 (동일 프롬프트 재요청 시 API 호출 생략, LRU)
+        # 주의: 아래 generate의 API 호출이 주석 처리되어 있는 동안은 항상 폴백 응답이 반환되어 캐시에 저장되지 않음
+        self._response_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._response_cache_size = 256
+
+    @staticmethod
+    def _response_cache_key(task_type: str, prompt: Dict[str, str]) -> str:
+        """
+        태스크 유형과 프롬프트로 응답 캐시 키(SHA256)를 생성합니다.
+        """
+        canonical = json.dumps(
+            {"task_type": task_type, "system": prompt["system"], "user": prompt["user"]},
+            ensure_ascii=False, sort_keys=True
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
     async def _check_api_quota_cached(self) -> bool:
         """
@@ -435,6 +632,14 @@ class LLMHandler:
         Exception
             If the API call fails after all retry attempts.
         """
+        # 프롬프트 생성 및 응답 캐시 확인
+        prompt = self._create_prompt(task_type, user_input, system_input)
+        cache_key = self._response_cache_key(task_type, prompt)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+        
         for attempt in range(self.max_retries):
             try:
                 # API 키 재검증
@@ -452,9 +657,6 @@ class LLMHandler:
                         if "quota" in str(e).lower() or "rate" in str(e).lower():
                             raise Exception(f"API quota exceeded or rate limited: {e}")
                 
-                # 프롬프트 생성
-                prompt = self._create_prompt(task_type, user_input, system_input)
-                
                 # API 호출
                 # response = await self.client.chat.completions.create(
                 #     model="gpt-4.1-nano",
@@ -468,6 +670,11 @@ class LLMHandler:
                 
                 # 응답 파싱
                 result = self._parse_response(task_type, response.choices[0].message.content)
+                
+                # 응답 캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)
+                self._response_cache[cache_key] = copy.deepcopy(result)
+                if len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
                 return result
                 
             except Exception as e:
@@ -498,166 +705,10 @@ class LLMHandler:
             Dictionary containing system and user prompts.
         """
         
-        if task_type == "Classification":
-            system_prompt = """당신은 통신사 고객 상담 분석 전문가입니다. 
-화자의 역할을 정확히 분류해주세요.
-
-분류 기준:
-- 고객: 문의, 불만, 요청을 하는 화자
-- 상담원: 안내, 해결책 제시, 업무 처리를 하는 화자
-
-출력 형식: JSON
-{
-    "speaker_roles": {
-        "Speaker 1": "고객" 또는 "상담원",
-        "Speaker 2": "고객" 또는 "상담원"
-    },
-    "confidence": 0.0-1.0,
-    "reasoning": "분류 근거"
-}"""
-            user_prompt = f"다음 통신사 상담 대화에서 각 화자의 역할을 분류해주세요:\n\n{user_input}"
-            
-        elif task_type == "Summary":
-            system_prompt = """당신은 통신사 고객 상담 요약 전문가입니다.
-상담 내용을 핵심 포인트 중심으로 요약해주세요.
-
-요약 항목:
-1. 고객 문의/요청 사항
-2. 상담원 응답/해결책
-3. 상담 결과
-4. 후속 조치 필요사항
-
-출력 형식: JSON
-{
-    "summary": "전체 상담 요약 (2-3문장)",
-    "customer_inquiry": "고객 문의 사항",
-    "agent_response": "상담원 응답",
-    "consultation_result": "상담 결과",
-    "follow_up_needed": true/false,
-    "key_points": ["핵심 포인트 1", "핵심 포인트 2"]
-}"""
-            user_prompt = f"다음 통신사 상담 내용을 요약해주세요:\n\n{user_input}"
-            
-        elif task_type == "ConflictDetection":
-            system_prompt = """당신은 통신사 고객 상담 갈등 감지 전문가입니다.
-상담 중 갈등, 불만, 문제 상황을 정확히 감지해주세요.
-
-갈등 지표:
-- 고객 불만/화남 표현
-- 반복적인 문제 제기
-- 해결 거부/불만족
-- 감정적 표현
-- 요구사항 미충족
-
-출력 형식: JSON
-{
-    "conflict_detected": true/false,
-    "conflict_level": "낮음/보통/높음",
-    "conflict_indicators": ["지표1", "지표2"],
-    "customer_emotion": "화남/불만/실망/중립",
-    "resolution_difficulty": "쉬움/보통/어려움",
-    "escalation_needed": true/false
-}"""
-            user_prompt = f"다음 통신사 상담에서 갈등이나 문제 상황을 분석해주세요:\n\n{user_input}"
-            
-        elif task_type == "TopicDetection":
-            system_prompt = f"""당신은 통신사 업무 분류 전문가입니다.
-상담 내용을 정확한 업무 유형으로 분류해주세요.
-
-가능한 업무 유형:
-{system_input}
-
-분류 기준:
-- 주요 키워드 매칭
-- 고객 요청 사항 분석
-- 상담 목적 파악
-
-출력 형식: JSON
-{{
-    "primary_topic": "주요 업무 유형",
-    "secondary_topics": ["부차적 주제1", "부차적 주제2"],
-    "confidence": 0.0-1.0,
-    "keywords_found": ["키워드1", "키워드2"],
-    "business_complexity": "단순/복합"
-}}"""
-            user_prompt = f"다음 통신사 상담의 업무 유형을 분류해주세요:\n\n{user_input}"
-            
-        elif task_type == "ComplaintAnalysis":
-            system_prompt = """당신은 통신사 민원 분석 전문가입니다.
-고객 민원을 종합적으로 분석해주세요.
-
-분석 항목:
-1. 민원 유형 및 심각도
-2. 고객 만족도 예측
-3. 해결 방안 제시
-4. 우선순위 평가
-
-출력 형식: JSON
-{
-    "complaint_type": "요금/서비스/기기/기타",
-    "severity": "낮음/보통/높음/긴급",
-    "customer_satisfaction_predicted": 1-5,
-    "resolution_suggestions": ["해결방안1", "해결방안2"],
-    "priority_level": 1-5,
-    "department_recommendation": "담당 부서",
-    "estimated_resolution_time": "예상 해결 시간"
-}"""
-            user_prompt = f"다음 통신사 민원을 분석해주세요:\n\n{user_input}"
-            
-        elif task_type == "ActionItems":
-            system_prompt = """당신은 통신사 상담 후속 조치 전문가입니다.
-상담 내용을 바탕으로 구체적인 액션 아이템을 도출해주세요.
-
-액션 아이템 유형:
-- 즉시 처리 가능한 업무
-- 후속 연락 필요 사항
-- 타 부서 협조 필요 업무
-- 고객 추가 준비 사항
-
-출력 형식: JSON
-{
-    "immediate_actions": ["즉시 처리할 업무1", "즉시 처리할 업무2"],
-    "follow_up_actions": ["후속 조치1", "후속 조치2"],
-    "customer_actions": ["고객이 해야할 일1", "고객이 해야할 일2"],
-    "interdepartmental_actions": ["타 부서 협조 업무1"],
-    "timeline": {
-        "immediate": "즉시",
-        "short_term": "1-3일",
-        "long_term": "1주일 이상"
-    }
-}"""
-            user_prompt = f"다음 통신사 상담의 액션 아이템을 도출해주세요:\n\n{user_input}"
-            
-        elif task_type == "QualityAssessment":
-            system_prompt = """당신은 통신사 상담 품질 평가 전문가입니다.
-상담 품질을 객관적으로 평가해주세요.
-
-평가 기준:
-1. 문제 해결도 (1-5점)
-2. 고객 응대 품질 (1-5점)  
-3. 정보 제공 정확성 (1-5점)
-4. 상담 효율성 (1-5점)
-5. 고객 만족도 예측 (1-5점)
-
-출력 형식: JSON
-{
-    "overall_score": 1-5,
-    "problem_resolution": 1-5,
-    "service_quality": 1-5,
-    "information_accuracy": 1-5,
-    "efficiency": 1-5,
-    "customer_satisfaction_predicted": 1-5,
-    "strengths": ["강점1", "강점2"],
-    "improvements": ["개선점1", "개선점2"],
-    "recommendation": "전체적인 평가 및 권고사항"
-}"""
-            user_prompt = f"다음 통신사 상담의 품질을 평가해주세요:\n\n{user_input}"
-            
-        else:
-            system_prompt = "당신은 한국어 음성 대화 분석 전문가입니다. 정확하고 일관된 분석을 제공해주세요."
-            user_prompt = f"다음 내용을 분석해주세요:\n{user_input}"
-        
-        return {"system": system_prompt, "user": user_prompt}
+        system_prompt, user_prefix = LLM_TASK_PROMPTS.get(task_type, DEFAULT_LLM_TASK_PROMPT)
+        if task_type in LLM_TEMPLATED_SYSTEM_PROMPTS:
+            system_prompt = system_prompt.format(system_input=system_input)
+        return {"system": system_prompt, "user": f"{user_prefix}{user_input}"}
 
     def _parse_response(self, task_type: str, response: str) -> Dict[str, Any]:
         """
@@ -750,15 +801,7 @@ class LLMHandler:
         Dict[str, Any]
             Fallback response data.
         """
-        fallbacks = {
-            "Classification": {"speaker_roles": "화자 역할 분류 실패"},
-            "SentimentAnalysis": {"sentiment": "중립"},
-            "ProfanityWordDetection": {"profanity": "비속어 감지 실패"},
-            "Summary": {"summary": "요약 생성 실패"},
-            "ConflictDetection": {"conflict": False},
-            "TopicDetection": {"topic": "기타"}
-        }
-        return fallbacks.get(task_type, {"result": "분석 실패"})
+        return dict(LLM_FALLBACK_RESPONSES.get(task_type, DEFAULT_LLM_FALLBACK_RESPONSE))
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -830,6 +873,10 @@ class LLMHandler:
                     "age_seconds": current_time - self._models_cache["last_check"],
                     "models_count": self._models_cache["models_count"],
                     "cache_duration": self._models_cache["cache_duration"]
+                },
+                "response_cache": {
+                    "size": len(self._response_cache),
+                    "max_size": self._response_cache_size
                 }
             },
             "optimization": {
@@ -192,18 +192,14 @@ class LLaMAModel(LanguageModel):
         str
             Formatted prompt.
         """
-        prompt = None
-        for message in messages:
-            role = message.get("role", "").lower()
-            content = message.get("content", "")
-            if role == "system":
-                prompt += f"System: {content}\n"
-            elif role == "user":
-                prompt += f"User: {content}\n"
-            elif role == "assistant":
-                prompt += f"Assistant: {content}\n"
-        prompt += "Assistant:"
-        return prompt
+        role_labels = {"system": "System", "user": "User", "assistant": "Assistant"}
+        lines = [
+            f"{role_labels[role]}: {message.get('content', '')}\n"
+            for message in messages
+            if (role := message.get("role", "").lower()) in role_labels
+        ]
+        lines.append("Assistant:")
+        return "".join(lines)
 
     def text_unload(self) -> Annotated[None, "Unload the LLaMA model and release resources"]:
         """
@@ -53,27 +53,34 @@ class AgentAudioUploadManager:
     def upload_audio_validate_audio_file(self, file_path: str) -> Dict[str, Any]:
         """오디오 파일 유효성 검사"""
         try:
-            import librosa
+            import soundfile as sf
             
-            # 파일 존재 확인
-            if not os.path.exists(file_path):
+            # 파일 존재 확인 (stat 한 번으로 존재 여부와 크기를 함께 확인)
+            try:
+                file_size = os.stat(file_path).st_size
+            except FileNotFoundError:
                 return {"valid": False, "error": "파일이 존재하지 않습니다"}
             
             # 파일 크기 확인 (100MB 제한)
-            file_size = os.path.getsize(file_path)
             if file_size > 100 * 1024 * 1024:
                 return {"valid": False, "error": "파일 크기가 100MB를 초과합니다"}
             
-            # 오디오 파일 정보 추출
-            y, sr = librosa.load(file_path, sr=None)
-            duration = librosa.get_duration(y=y, sr=sr)
-            
             # 지원 형식 확인
             supported_formats = ['.wav', '.mp3', '.m4a', '.flac', '.ogg']
             file_ext = Path(file_path).suffix.lower()
             if file_ext not in supported_formats:
                 return {"valid": False, "error": f"지원하지 않는 형식입니다: {file_ext}"}
             
+            # 오디오 파일 정보 추출 (헤더만 읽음, libsndfile 미지원 형식은 디코딩 폴백)
+            try:
+                info = sf.info(file_path)
+                sr, channels, duration = info.samplerate, info.channels, info.duration
+            except RuntimeError:
+                import librosa
+                y, sr = librosa.load(file_path, sr=None, mono=False)
+                duration = librosa.get_duration(y=y, sr=sr)
+                channels = y.shape[0] if y.ndim > 1 else 1
+            
             # 길이 확인 (최대 2시간)
             if duration > 7200:
                 return {"valid": False, "error": "오디오 길이가 2시간을 초과합니다"}
@@ -83,7 +90,7 @@ class AgentAudioUploadManager:
                 "file_size": file_size,
                 "duration_seconds": duration,
                 "sample_rate": sr,
-                "channels": len(y.shape) if len(y.shape) > 1 else 1,
+                "channels": channels,
                 "format_type": file_ext[1:].upper()
             }
             
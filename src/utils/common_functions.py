@@ -75,7 +75,7 @@ class CommonFunctions:
     @staticmethod
     def util_validate_file_path(file_path: str) -> bool:
         """파일 경로 유효성 검사"""
-        return os.path.exists(file_path) and os.path.isfile(file_path)
+        return os.path.isfile(file_path)  # isfile은 존재하지 않으면 False (stat 한 번)
     
     @staticmethod
     def util_get_file_size(file_path: str) -> int:
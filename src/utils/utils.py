@@ -5,10 +5,6 @@ import asyncio
 import logging
 from typing import Annotated
 
-# Related third-party imports
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
-
 
 class Logger:
     """
@@ -200,14 +196,15 @@ class Cleaner:
             print(f"❌ 임시 파일 정리 중 오류 발생: {e}")
 
 
-class Watcher(FileSystemEventHandler):
+class Watcher:
     """
     A file system event handler that watches a directory for newly created audio files and triggers a callback.
 
-    The Watcher class extends FileSystemEventHandler to monitor a directory for new audio files with specific
-    extensions (.mp3, .wav, .flac). When a new file is detected, it invokes an asynchronous callback function,
-    allowing users to integrate custom processing logic (e.g., transcription, diarization) immediately after
-    the file is created.
+    The Watcher class implements the watchdog event-handler interface (``dispatch``) to monitor a directory for
+    new audio files with specific extensions (.mp3, .wav, .flac). When a new file is detected, it invokes an
+    asynchronous callback function, allowing users to integrate custom processing logic (e.g., transcription,
+    diarization) immediately after the file is created. watchdog itself is only imported when the watcher is
+    started, so importing this module (e.g. for Logger) does not require it.
 
     Parameters
     ----------
@@ -228,9 +225,24 @@ class Watcher(FileSystemEventHandler):
         -------
         None
         """
-        super().__init__()
         self.callback = callback
 
+    def dispatch(self, event) -> None:
+        """
+        Entry point called by the watchdog observer for every file system event.
+
+        Parameters
+        ----------
+        event : FileSystemEvent
+            The event object representing the file system change.
+
+        Returns
+        -------
+        None
+        """
+        if event.event_type == "created":
+            self.util_on_created(event)
+
     def util_on_created(self, event) -> None:
         """
         Handle the creation of a new file event.
@@ -274,6 +286,8 @@ class Watcher(FileSystemEventHandler):
             os.makedirs(directory, exist_ok=True)
             print(f"Directory '{directory}' created.")
 
+        from watchdog.observers import Observer
+
         observer = Observer()
         event_handler = cls(callback)
         observer.schedule(event_handler, directory, recursive=False)
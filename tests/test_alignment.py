@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+ForcedAligner emission 구간 분할 테스트
+"""
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("faster_whisper")
+
+from src.audio import alignment
+
+SAMPLES_PER_FRAME = 320  # 16kHz에서 20ms 프레임
+
+
+def _fake_generate_emissions(stride):
+    """입력 구간의 전역 프레임 번호를 emission 값으로 돌려주는 가짜 모델"""
+    def generate(model, waveform, batch_size=8):
+        frames = waveform.shape[-1] // SAMPLES_PER_FRAME
+        return waveform[::SAMPLES_PER_FRAME][:frames] / SAMPLES_PER_FRAME, stride
+    return generate
+
+
+class TestGenerateEmissionsTiled:
+    """긴 오디오 emission 이어 붙이기 테스트"""
+
+    @pytest.mark.parametrize("stride", [20, 0.02])  # ctc-forced-aligner(ms) / torchaudio(초)
+    @pytest.mark.parametrize("seconds", [61, 150])
+    def test_stitched_emissions_have_no_duplicate_context_frames(self, monkeypatch, stride, seconds):
+        """구간 경계의 문맥 프레임이 잘려 전체 오디오와 같은 프레임 열이 되어야 함"""
+        monkeypatch.setattr(alignment, "generate_emissions", _fake_generate_emissions(stride))
+        total = seconds * alignment.ALIGNMENT_SAMPLE_RATE
+        waveform = torch.arange(total, dtype=torch.float64)
+
+        emissions, tiled_stride = alignment._generate_emissions_tiled(None, waveform, batch_size=8)
+
+        expected = torch.arange(total // SAMPLES_PER_FRAME, dtype=torch.float64)
+        assert emissions.shape == expected.shape
+        assert torch.equal(emissions, expected)
+        assert tiled_stride == pytest.approx(stride)
+
+
+class _FakeInnerModel(torch.nn.Module):
+    """320 샘플마다 합계를 하나의 프레임으로 내는 가짜 wav2vec2 모델"""
+
+    def forward(self, waveforms, lengths=None):
+        frames = waveforms.shape[-1] // SAMPLES_PER_FRAME
+        emissions = waveforms[:, :frames * SAMPLES_PER_FRAME].reshape(waveforms.shape[0], frames, SAMPLES_PER_FRAME)
+        frame_lengths = None if lengths is None else lengths // SAMPLES_PER_FRAME
+        return emissions.sum(-1, keepdim=True).repeat(1, 1, 2), frame_lengths
+
+
+class _FakeMmsFaModel(torch.nn.Module):
+    """torchaudio MMS_FA wrapper와 같이 입력 전체에 layer_norm을 적용하는 가짜 모델"""
+
+    def __init__(self):
+        super().__init__()
+        self.model = _FakeInnerModel()
+        self.normalize_waveform = True
+        self.apply_log_softmax = True
+        self.append_star = False
+        self.weight = torch.nn.Parameter(torch.zeros(1, dtype=torch.float64))
+
+    def forward(self, waveforms, lengths=None):
+        waveforms = torch.nn.functional.layer_norm(waveforms, waveforms.shape)
+        emissions, frame_lengths = self.model(waveforms, lengths)
+        return torch.nn.functional.log_softmax(emissions, dim=-1), frame_lengths
+
+
+class TestGenerateEmissionsBatch:
+    """배치 emission 계산 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _require_torchaudio(self):
+        """MMS_FA 번들 정보(sample rate)를 torchaudio에서 읽으므로 없으면 건너뜀"""
+        pytest.importorskip("torchaudio")
+
+    def test_batched_emissions_match_per_file(self):
+        """패딩된 배치 결과가 파일별 결과와 같아야 함"""
+        model = _FakeMmsFaModel()
+        generator = torch.Generator().manual_seed(0)
+        waveforms = [
+            torch.randn(SAMPLES_PER_FRAME * 50, generator=generator, dtype=torch.float64),
+            torch.randn(SAMPLES_PER_FRAME * 20, generator=generator, dtype=torch.float64) * 3,
+        ]
+
+        emissions, frame_lengths, _ = alignment._generate_emissions_batch_ta(model, waveforms)
+
+        for i, waveform in enumerate(waveforms):
+            single, _ = alignment._generate_emissions_ta(model, waveform)
+            assert torch.allclose(emissions[i, :frame_lengths[i]], single)
+
+    def test_bucket_padded_emissions_match_eager(self, monkeypatch):
+        """torch.compile용 구간 패딩 결과가 패딩 없는 결과와 같아야 함"""
+        model = _FakeMmsFaModel()
+        waveform = torch.randn(SAMPLES_PER_FRAME * 70, generator=torch.Generator().manual_seed(1), dtype=torch.float64)
+        eager, _ = alignment._generate_emissions_ta(model, waveform)
+
+        monkeypatch.setattr(alignment, "ALIGNMENT_TORCH_COMPILE", True)
+        padded, _ = alignment._generate_emissions_ta(model, waveform)
+
+        assert torch.allclose(padded, eager)
@@ -6,32 +6,36 @@
 import sys
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
-def run_verification_script(script_name, service_name):
-    """개별 서비스 검증 스크립트 실행"""
+def run_verification_script(script_name, service_name) -> Tuple[bool, List[str]]:
+    """개별 서비스 검증 스크립트 실행 (출력은 병렬 실행 중 섞이지 않도록 모아서 반환)"""
     
-    print(f"\n{'='*60}")
-    print(f"🔍 {service_name} 서비스 검증 시작")
-    print(f"{'='*60}")
+    lines = [
+        f"\n{'='*60}",
+        f"🔍 {service_name} 서비스 검증 시작",
+        f"{'='*60}"
+    ]
     
     try:
         result = subprocess.run([sys.executable, script_name], 
                               capture_output=True, text=True, timeout=60)
         
         if result.returncode == 0:
-            print(f"✅ {service_name} 서비스 검증 성공!")
-            return True
+            lines.append(f"✅ {service_name} 서비스 검증 성공!")
+            return True, lines
         else:
-            print(f"❌ {service_name} 서비스 검증 실패!")
-            print(f"에러 출력: {result.stderr}")
-            return False
+            lines.append(f"❌ {service_name} 서비스 검증 실패!")
+            lines.append(f"에러 출력: {result.stderr}")
+            return False, lines
             
     except subprocess.TimeoutExpired:
-        print(f"⏰ {service_name} 서비스 검증 시간 초과!")
-        return False
+        lines.append(f"⏰ {service_name} 서비스 검증 시간 초과!")
+        return False, lines
     except Exception as e:
-        print(f"💥 {service_name} 서비스 검증 중 예외 발생: {e}")
-        return False
+        lines.append(f"💥 {service_name} 서비스 검증 중 예외 발생: {e}")
+        return False, lines
 
 def main():
     """모든 서비스 검증 실행"""
@@ -53,13 +57,24 @@ def main():
     success_count = 0
     total_count = len(services)
     
+    # 서비스별 검증은 서로 독립적(대부분 무거운 import 대기)이므로 병렬 실행
+    available = []
     for script_name, service_name in services:
         if os.path.exists(script_name):
-            if run_verification_script(script_name, service_name):
-                success_count += 1
+            available.append((script_name, service_name))
         else:
             print(f"⚠️ {script_name} 파일이 존재하지 않습니다.")
     
+    if available:
+        with ThreadPoolExecutor(max_workers=len(available)) as executor:
+            results = list(executor.map(lambda s: run_verification_script(*s), available))
+        
+        # 출력은 서비스 순서대로 한 번에
+        for success, lines in results:
+            print("\n".join(lines))
+            if success:
+                success_count += 1
+    
     # 결과 요약
     print(f"\n{'='*60}")
     print("📊 검증 결과 요약")
@@ -4,10 +4,14 @@ Database Service 호환성 검증 스크립트 (PostgreSQL 전용)
 """
 
 import sys
-import importlib
+import importlib.util
 
 def test_imports():
-    """필요한 라이브러리들이 정상적으로 import되는지 테스트"""
+    """필요한 라이브러리들이 설치되어 import 가능한지 테스트
+
+    torch/transformers 같은 무거운 모듈의 초기화(CUDA 등)는 피하기 위해
+    모듈을 실행하지 않고 탐색만 합니다. 실제 import는 서비스 코드 테스트에서 수행됩니다.
+    """
     
     required_modules = [
         'fastapi',
@@ -24,7 +28,8 @@ def test_imports():
     
     for module in required_modules:
         try:
-            importlib.import_module(module)
+            if importlib.util.find_spec(module) is None:
+                raise ImportError(f"No module named '{module}'")
             print(f"✅ {module} - 정상")
         except ImportError as e:
             print(f"❌ {module} - 실패: {e}")